@@ -14,17 +14,20 @@
 #   and a clear warning in the console.
 # - Window is resizable; logical size is 1280x720 and scales crisply.
 
-import os, random, pygame
+import os, sys, random, pygame
 
-pygame.init()
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import Scene, SceneManager
+from spatial import SpatialHash
 
 LOGICAL_W, LOGICAL_H = 1280, 720
-SCREEN = pygame.display.set_mode((LOGICAL_W, LOGICAL_H),
-                                 pygame.SCALED | pygame.RESIZABLE)
-pygame.display.set_caption("CredCity — Level 1 (Fixed)")
+SCREEN = None  # set by init() / the scene manager
 
-CLOCK = pygame.time.Clock()
 FPS = 60
+DT = 1 / FPS  # seconds per update(): the SceneManager runs updates at a fixed step
 
 # ---------- colors ----------
 WHITE=(245,245,245); GREY=(150,150,160); BLACK=(10,10,15)
@@ -38,7 +41,7 @@ def font(sz, bold=False):
         f = pygame.font.SysFont("arial", sz, bold=bold)
     return f
 
-FONT_S=font(18); FONT_M=font(24); FONT_L=font(36,True)
+FONT_S=FONT_M=FONT_L=None  # created by init()
 
 def draw_text(surf, text, f, color, pos, center=False, max_width=None, shadow=True):
     """Text with optional wrap + soft shadow for readability."""
@@ -135,11 +138,9 @@ def load_bg_any(basename, fallback_color):
     surf.fill(fallback_color)
     return (surf, f"MISSING: {basename} (.jpg/.jpeg/.png)")
 
-CITY_BG, CITY_MISS   = load_bg_any("city.jpg",  (40, 60, 80))
-BANK_BG, BANK_MISS   = load_bg_any("bank.jpg",  (25, 90, 70))
-STORE_BG, STORE_MISS = load_bg_any("store.jpg", (90, 60, 40))
-CAFE_BG, CAFE_MISS   = load_bg_any("cafe.jpg",  (80, 45, 60))
-TOWER_BG, TOWER_MISS = load_bg_any("tower.jpg", (55, 55, 95))
+# backgrounds are loaded by init()
+CITY_BG=BANK_BG=STORE_BG=CAFE_BG=TOWER_BG=None
+CITY_MISS=BANK_MISS=STORE_MISS=CAFE_MISS=TOWER_MISS=None
 
 # ---- Glass banner + sprite loader helpers ----
 
@@ -186,16 +187,53 @@ def load_sprite_any(basename, target_w, target_h):
     print(f"[CredCity] Optional sprite missing: {basename} (looking for .png/.jpg/.jpeg)")
     return None
 
-# Try to load a cart sprite (optional). Place 'cart.png' in assets/ if you have one.
-CART_IMG = load_sprite_any("cart.png", 110, 64)  # will be None if you don't add the file
-ELEVATOR_IMG = load_sprite_any("elevator.png", 160, 100) # used in Tower
+CART_IMG = None
+ELEVATOR_IMG = None
+bank = store = cafe = tower = None  # building scenes, created by init()
+
+# ---------- lazy init (importing this module opens no window and loads nothing) ----------
+_initialized = False
+
+def init():
+    """Init pygame, make sure a window exists, then create fonts + load images. Safe to call twice."""
+    global SCREEN, FONT_S, FONT_M, FONT_L, CART_IMG, ELEVATOR_IMG, _initialized
+    global CITY_BG, CITY_MISS, BANK_BG, BANK_MISS, STORE_BG, STORE_MISS
+    global CAFE_BG, CAFE_MISS, TOWER_BG, TOWER_MISS, bank, store, cafe, tower
+    if _initialized:
+        return
+    pygame.init()
+
+    # Inside the launcher the shared window already exists; the scene resizes it
+    SCREEN = pygame.display.get_surface()
+    if SCREEN is None:
+        SCREEN = pygame.display.set_mode((LOGICAL_W, LOGICAL_H),
+                                         pygame.SCALED | pygame.RESIZABLE)
+        pygame.display.set_caption("CredCity — Level 1 (Fixed)")
+
+    FONT_S=font(18); FONT_M=font(24); FONT_L=font(36,True)
+
+    CITY_BG, CITY_MISS   = load_bg_any("city.jpg",  (40, 60, 80))
+    BANK_BG, BANK_MISS   = load_bg_any("bank.jpg",  (25, 90, 70))
+    STORE_BG, STORE_MISS = load_bg_any("store.jpg", (90, 60, 40))
+    CAFE_BG, CAFE_MISS   = load_bg_any("cafe.jpg",  (80, 45, 60))
+    TOWER_BG, TOWER_MISS = load_bg_any("tower.jpg", (55, 55, 95))
+
+    # Try to load a cart sprite (optional). Place 'cart.png' in assets/ if you have one.
+    CART_IMG = load_sprite_any("cart.png", 110, 64)  # will be None if you don't add the file
+    ELEVATOR_IMG = load_sprite_any("elevator.png", 160, 100) # used in Tower
+
+    # building mini-games (they build fonts in reset())
+    bank=BankScene(); store=StoreScene(); cafe=CafeScene(); tower=TowerScene()
+    _initialized = True
 
 
 # ---------- global state ----------
 STATE_CITY="city"; STATE_BANK="bank"; STATE_STORE="store"; STATE_CAFE="cafe"; STATE_TOWER="tower"
-credit_score=650
+START_CREDIT=650
+credit_score=START_CREDIT
 
-player=pygame.Rect(100,600,30,40)
+PLAYER_SPAWN=(100,600)
+player=pygame.Rect(*PLAYER_SPAWN,30,40)
 SPEED=5
 LOCATIONS={
     "bank":  pygame.Rect(170, 300, 190, 120),
@@ -203,6 +241,9 @@ LOCATIONS={
     "cafe":  pygame.Rect(740, 210, 200, 100),
     "tower": pygame.Rect(470, 440, 190, 180),
 }
+# buildings by grid cell, so the hub only tests the ones near the player / mouse
+LOCATION_GRID=SpatialHash(cell_size=160)
+for _name,_rect in LOCATIONS.items(): LOCATION_GRID.insert(_name,_rect)
 state=STATE_CITY
 
 def draw_hud():
@@ -300,7 +341,6 @@ class BankScene:
             msg=f"Placed correctly: {self.correct}/{len(self.papers)}. Credit impact applied. ESC to return."
             draw_text(SCREEN,msg,FONT_M,WHITE,(LOGICAL_W//2,LOGICAL_H-40),center=True)
 
-bank=BankScene()
 
 # ============================================================
 # STORE — shelves with items; keep utilization ≤30%
@@ -396,7 +436,7 @@ class StoreScene:
 
         # concept timer
         if self.show_concept_timer > 0:
-            self.show_concept_timer -= 1 / FPS
+            self.show_concept_timer -= DT
 
         # move cart
         keys = pygame.key.get_pressed()
@@ -405,7 +445,7 @@ class StoreScene:
         self.cart.clamp_ip(pygame.Rect(0, 180, LOGICAL_W, LOGICAL_H - 180))
 
         # spawns
-        self.spawn_cd += 1 / FPS
+        self.spawn_cd += DT
         if self.spawn_cd >= self.SPAWN_EVERY and len(self.items) < self.MAX_ITEMS_ON_SCREEN:
             self.spawn_item()
             self.spawn_cd = 0.0
@@ -433,7 +473,7 @@ class StoreScene:
                 self.items.remove(it)
 
         # timer
-        self.time -= 1 / FPS
+        self.time -= DT
         if self.time <= 0 and not self.finished:
             util = self.balance / self.limit
             util_pct = int(util * 100)
@@ -590,8 +630,6 @@ class StoreScene:
                       max_width=self.TOP_BANNER_W - 40)
 
 
-store = StoreScene()
-
 # ============================================================
 # CAFE — drop coins into moving coffee cups (timing)
 # ============================================================
@@ -612,7 +650,7 @@ class CafeScene:
                 self.coin=[self.till.centerx, self.till.y]
     def update(self):
         if self.finished: return
-        self.spawn += 1/FPS
+        self.spawn += DT
         if self.spawn>=0.9 and (len(self.cups)+self.ontime+self.late)<self.total:
             self.spawn=0; self.spawn_cup()
         for c in list(self.cups):
@@ -657,7 +695,6 @@ class CafeScene:
         if self.finished and self.note:
             draw_text(SCREEN,self.note+" (Credit impact applied.)",FONT_M,WHITE,(LOGICAL_W//2,LOGICAL_H-54),center=True)
 
-cafe=CafeScene()
 
 # ============================================================
 # TOWER — elevator quiz
@@ -795,13 +832,13 @@ class TowerScene:
 
         # timers
         if self.show_intro_timer > 0:
-            self.show_intro_timer -= 1 / FPS
+            self.show_intro_timer -= DT
 
         if self.explain_timer > 0:
-            self.explain_timer -= 1 / FPS
+            self.explain_timer -= DT
 
         if self.advance_delay > 0:
-            self.advance_delay -= 1 / FPS
+            self.advance_delay -= DT
             if self.advance_delay <= 0:
                 self.next_question()
 
@@ -1009,9 +1046,6 @@ class TowerScene:
                   FONT_S, WHITE, (LOGICAL_W // 2, LOGICAL_H - 36), center=True)
 
 
-
-tower=TowerScene()
-
 # ============================================================
 # CITY
 # ============================================================
@@ -1024,6 +1058,13 @@ def set_state(s):
     if s==STATE_CAFE:  cafe.reset()
     if s==STATE_TOWER: tower.reset()
 
+def reset():
+    """New visit: back in the city at the spawn point with the starting score"""
+    global credit_score
+    credit_score=START_CREDIT
+    player.topleft=PLAYER_SPAWN
+    set_state(STATE_CITY)
+
 def draw_hub_miss_labels():
     # show missing labels once in city to help debug asset filenames
     labels=[]
@@ -1052,8 +1093,11 @@ def city_draw():
     pygame.draw.rect(SCREEN,(255,255,255),player)
     pygame.draw.rect(SCREEN,BLUE,player.inflate(-8,-8))
     mouse=pygame.mouse.get_pos()
+    # player within 15 px of a building (== player.colliderect(rect.inflate(30,30))) or mouse on it
+    near=set(LOCATION_GRID.query_rect(player.inflate(30,30)))
+    near.update(LOCATION_GRID.query_point(*mouse))
     for name,rect in LOCATIONS.items():
-        if player.colliderect(rect.inflate(30,30)) or rect.collidepoint(mouse):
+        if name in near:
             tip={
                 "bank":"Route applications to teller windows",
                 "store":"Grab shelf items; keep utilization ≤30%",
@@ -1071,34 +1115,50 @@ def city_draw():
 # MAIN LOOP
 # ============================================================
 
-def main():
-    global state
-    running=True
-    while running:
-        CLOCK.tick(FPS)
-        for e in pygame.event.get():
-            if e.type==pygame.QUIT: running=False
-            if state==STATE_CITY:
-                if e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE: running=False
-            elif state==STATE_BANK:  bank.handle(e)
-            elif state==STATE_STORE: store.handle(e)
-            elif state==STATE_CAFE:  cafe.handle(e)
-            elif state==STATE_TOWER: tower.handle(e)
+class CredCityScene(Scene):
+    """City hub + the four buildings, hosted by the SceneManager."""
+    size = (LOGICAL_W, LOGICAL_H)
+    flags = pygame.SCALED | pygame.RESIZABLE
+    caption = "CredCity — Level 1 (Fixed)"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        init()
+        self.started = False
 
+    def enter(self):
+        global SCREEN
+        SCREEN = self.manager.screen
+        if not self.started:
+            self.started = True
+            reset()
+
+    def handle(self, e):
+        if state==STATE_CITY:
+            if e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE: self.manager.pop()
+        elif state==STATE_BANK:  bank.handle(e)
+        elif state==STATE_STORE: store.handle(e)
+        elif state==STATE_CAFE:  cafe.handle(e)
+        elif state==STATE_TOWER: tower.handle(e)
+
+    def update(self):
         if state==STATE_CITY: city_update()
         elif state==STATE_BANK:  bank.update()
         elif state==STATE_STORE: store.update()
         elif state==STATE_CAFE:  cafe.update()
         elif state==STATE_TOWER: tower.update()
 
+    def draw(self, screen):
         if state==STATE_CITY: city_draw()
         elif state==STATE_BANK:  bank.draw()
         elif state==STATE_STORE: store.draw()
         elif state==STATE_CAFE:  cafe.draw()
         elif state==STATE_TOWER: tower.draw()
 
-        pygame.display.flip()
-    pygame.quit()
+def run():
+    manager=SceneManager((LOGICAL_W, LOGICAL_H), "CredCity — Level 1 (Fixed)", fps=FPS)
+    manager.push(CredCityScene(manager))
+    manager.run()
 
 if __name__=="__main__":
-    main()
+    run()
@@ -0,0 +1,265 @@
+"""
+Action Log - Append-only JSON-lines persistence for the ActionTracker
+
+Every logged action is written as one compact JSON line as it happens, so
+saving costs O(1) per action instead of re-dumping the whole session:
+
+    {"session_start": 1760000000.0, "version": 1}             (header)
+    {"timestamp": 1760000012.5, "action_type": "sale", "details": {...}}
+
+Several sessions share one log: a writer opened for a session other than the
+one the log ends with starts it with a header of its own, and the actions
+after a header belong to that session.
+
+Lines are buffered and written + fsynced in batches (every `batch` actions or
+once `fsync_interval` seconds have passed at the next write), so a crash
+loses at most the last unsynced batch. close() (also run at exit) flushes
+the rest.
+
+When the live file grows past `max_bytes` it is rolled over to <path>.1,
+<path>.2, ... (lower = older). Once there are more than `max_segments`
+rolled files, compact() merges them back into <path>.1.
+
+load_tracker(path) rebuilds an ActionTracker for the latest session in the
+segments and the live file, skipping a torn last line left by a crash. A writer reopening the live
+file cuts that line off first, so new records never get glued onto it.
+
+In the game the writer is an event bus subscriber (subscribe()); attach()
+hooks it to a stand-alone tracker as its sink instead.
+"""
+import atexit
+import json
+import os
+import time
+
+from action_tracker import ActionTracker
+
+FORMAT_VERSION = 1
+
+
+def segment_paths(path):
+    """Rolled-over segments (oldest first) followed by the live file, if they exist"""
+    paths = []
+    n = 1
+    while os.path.exists(f"{path}.{n}"):
+        paths.append(f"{path}.{n}")
+        n += 1
+    if os.path.exists(path):
+        paths.append(path)
+    return paths
+
+
+def _header(session_start):
+    return json.dumps({"session_start": session_start, "version": FORMAT_VERSION}).encode() + b"\n"
+
+
+def _session_of(line):
+    """session_start of a header line, None for an action or a torn line"""
+    if b'"session_start"' not in line:
+        return None
+    try:
+        return json.loads(line).get("session_start")
+    except ValueError:
+        return None
+
+
+def _last_session(path):
+    """session_start of the last header in one file, or None"""
+    last = None
+    with open(path, "rb") as f:
+        for line in f:
+            session = _session_of(line)
+            if session is not None:
+                last = session
+    return last
+
+
+def _repair_tail(f, chunk=4096):
+    """
+    Cut a torn last line (crash mid-write) off a log opened for appending,
+    so the next record starts on a line of its own; returns the new size
+    """
+    end = f.seek(0, os.SEEK_END)
+    pos = end
+    with open(f.name, "rb") as reader:
+        while pos > 0:
+            start = max(0, pos - chunk)
+            reader.seek(start)
+            data = reader.read(pos - start)
+            if pos == end and data.endswith(b"\n"):
+                return end
+            newline = data.rfind(b"\n")
+            if newline >= 0:
+                pos = start + newline + 1
+                break
+            pos = start
+    if pos < end:
+        f.truncate(pos)
+    return pos
+
+
+class ActionLogWriter:
+    """Buffered append-only writer; set as `tracker.sink`"""
+
+    def __init__(self, path, session_start=None, batch=32, fsync_interval=1.0,
+                 max_bytes=8 * 1024 * 1024, max_segments=8):
+        self.path = path
+        self.session_start = session_start if session_start is not None else time.time()
+        self.batch = batch
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+
+        self._buffer = []
+        self._last_sync = time.monotonic()
+        self._file = None
+        self._open()
+        atexit.register(self.close)
+
+    def _open(self):
+        self._file = open(self.path, "ab")
+        self._size = _repair_tail(self._file)
+        if self._size == 0 or _last_session(self.path) != self.session_start:
+            header = _header(self.session_start)
+            self._file.write(header)
+            self._size += len(header)
+
+    def write(self, action):
+        """Queue one action dict; flushes when the batch is full or the interval has passed"""
+        self._buffer.append(json.dumps(action, separators=(",", ":"), default=str))
+        if len(self._buffer) >= self.batch or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+    def record(self, event):
+        """Event bus subscriber (events.ActionEvent)"""
+        self.write(event.to_dict())
+
+    def flush(self):
+        """Write and fsync everything buffered so far"""
+        if self._file is None or not self._buffer:
+            return
+        data = ("\n".join(self._buffer) + "\n").encode()
+        self._buffer.clear()
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._size += len(data)
+        self._last_sync = time.monotonic()
+        if self._size >= self.max_bytes:
+            self.rollover()
+
+    def rollover(self):
+        """Move the live file to the next <path>.N segment and start a new one"""
+        self._file.close()
+        n = len(segment_paths(self.path))  # rolled segments + the live file
+        os.replace(self.path, f"{self.path}.{n}")
+        self._open()
+        if n > self.max_segments:
+            compact(self.path)
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        atexit.unregister(self.close)
+
+
+def compact(path):
+    """
+    Merge the rolled-over segments of `path` into <path>.1 (the live file is
+    left alone), dropping torn lines and headers that repeat the session
+    before them
+    """
+    segments = segment_paths(path)
+    if segments and segments[-1] == path:
+        segments.pop()
+    if len(segments) < 2:
+        return
+
+    tmp = f"{path}.compact"
+    session = None
+    with open(tmp, "wb") as out:
+        for segment in segments:
+            with open(segment, "rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "action_type" not in entry:
+                        if entry.get("session_start") == session:
+                            continue
+                        session = entry.get("session_start")
+                    out.write(line if line.endswith(b"\n") else line + b"\n")
+        out.flush()
+        os.fsync(out.fileno())
+
+    os.replace(tmp, segments[0])
+    for segment in segments[1:]:
+        os.remove(segment)
+
+
+def read_actions(path, session_start=None):
+    """
+    Yield (timestamp, action_type, details) for every action in the log,
+    oldest first; only those of one session if `session_start` is given
+    """
+    loads = json.loads
+    current = None
+    for segment in segment_paths(path):
+        with open(segment, "rb") as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                if "action_type" not in entry:
+                    current = entry.get("session_start", current)
+                elif session_start is None or current == session_start:
+                    yield entry["timestamp"], entry["action_type"], entry["details"]
+
+
+def read_session_start(path):
+    """session_start of the latest session in the log, or None"""
+    for segment in reversed(segment_paths(path)):
+        session = _last_session(segment)
+        if session is not None:
+            return session
+    return None
+
+
+def load_tracker(path, tracker=None):
+    """
+    Rebuild an ActionTracker from the latest session in a log (without
+    writing anything back)
+
+    Args:
+        path: Live log file path
+        tracker: Tracker to fill (a new one by default)
+    """
+    if tracker is None:
+        tracker = ActionTracker()
+    session_start = read_session_start(path)
+    if session_start is None:
+        return tracker
+    append = tracker._append
+    for timestamp, action_type, details in read_actions(path, session_start):
+        append(action_type, details, timestamp)
+    tracker.session_start = session_start
+    return tracker
+
+
+def subscribe(bus, path, session_start=None, **kwargs):
+    """Stream every event published on `bus` to `path`; returns the writer"""
+    writer = ActionLogWriter(path, session_start=session_start, **kwargs)
+    bus.subscribe(writer.record)
+    return writer
+
+
+def attach(tracker, path, **kwargs):
+    """Stream every future action of `tracker` to `path`; returns the writer"""
+    writer = ActionLogWriter(path, session_start=tracker.session_start, **kwargs)
+    tracker.sink = writer
+    return writer
@@ -1,105 +1,363 @@
 """
 Action Tracker - Records all player actions with timestamps and context
+
+Actions are stored column-wise to stay small in long (kiosk) sessions:
+interned action types in an array of type ids, timestamps and amounts in
+float arrays, and the caller's details dict. `tracker.actions` and the query
+methods hand out lightweight ActionRecord views that read like the old
+action dicts (record["action_type"], record["details"], record["datetime"]).
+The datetime string is only formatted when somebody reads it.
+
+The global tracker is a subscriber of events.event_bus: game code publishes
+each action once and the tracker records it (record()). log_action() is kept
+for trackers used on their own. An optional sink (see action_log.py) receives
+every action logged that way, so the session is streamed to disk instead of
+dumped in one go.
+
+With max_actions set, only the most recent actions are kept in memory (a
+ring buffer trimmed in chunks); older ones are spilled. Records keep their
+absolute index, the summary counters still cover the whole session, and the
+spilled actions remain readable from the sink's log (action_log.read_actions).
 """
 import json
 import time
-from datetime import datetime
+from array import array
+from bisect import bisect_left
+
+from events import event_bus, format_datetime
+from settings import ACTION_HISTORY_LIMIT
+
+# action_type -> (count key, total key) in get_action_summary()
+SUMMARY_COUNTERS = {
+    "loan": ("loans_taken", "total_borrowed"),
+    "sale": ("sales_made", "total_earned"),
+    "repayment": ("repayments_made", "total_repaid"),
+}
+
+RECORD_KEYS = ("timestamp", "datetime", "action_type", "details")
+
+def _empty_summary():
+    return {
+        "total_actions": 0,
+        "loans_taken": 0,
+        "sales_made": 0,
+        "repayments_made": 0,
+        "total_borrowed": 0,
+        "total_earned": 0,
+        "total_repaid": 0
+    }
+
+def format_action(action_type, details, time_str):
+    """One line of the AI prompt history, or None for actions it leaves out"""
+    if action_type == "loan":
+        return (f"{time_str}: Borrowed {details['amount']} gold from {details['lender']} "
+                f"at {details['interest_rate']*100}% interest (will owe {details['amount_owed']} gold)")
+    if action_type == "sale":
+        return f"{time_str}: Made sale for {details['amount']} gold (stock used: {details['stock_used']})"
+    if action_type == "repayment":
+        return f"{time_str}: Repaid {details['amount']} gold to {details['lender']}"
+    return None
+
+
+class ActionRecord:
+    """Read-only, dict-like view of one logged action"""
+    __slots__ = ("_tracker", "_index")
+
+    def __init__(self, tracker, index):
+        self._tracker = tracker
+        self._index = index
+
+    def _pos(self):
+        """Position of this action in the in-memory columns"""
+        pos = self._index - self._tracker._base
+        if pos < 0:
+            raise LookupError(f"action {self._index} was spilled out of the in-memory history")
+        return pos
+
+    @property
+    def timestamp(self):
+        return self._tracker._timestamps[self._pos()]
+
+    @property
+    def datetime(self):
+        return format_datetime(self.timestamp)
+
+    @property
+    def action_type(self):
+        tracker = self._tracker
+        return tracker._type_names[tracker._types[self._pos()]]
+
+    @property
+    def details(self):
+        return self._tracker._details[self._pos()]
+
+    def __getitem__(self, key):
+        if key not in RECORD_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in RECORD_KEYS else default
+
+    def keys(self):
+        return RECORD_KEYS
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in RECORD_KEYS}
+
+    def __eq__(self, other):
+        if isinstance(other, ActionRecord):
+            return self._tracker is other._tracker and self._index == other._index
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"ActionRecord({self.to_dict()!r})"
+
+
+class ActionLog:
+    """Sequence view over the in-memory actions (what `tracker.actions` returns)"""
+    __slots__ = ("_tracker",)
+
+    def __init__(self, tracker):
+        self._tracker = tracker
+
+    def __len__(self):
+        return len(self._tracker._types)
+
+    def __getitem__(self, index):
+        tracker = self._tracker
+        n = len(self)
+        if isinstance(index, slice):
+            base = tracker._base
+            return [ActionRecord(tracker, base + i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("action index out of range")
+        return ActionRecord(tracker, tracker._base + index)
+
+    def __iter__(self):
+        tracker = self._tracker
+        base = tracker._base
+        for i in range(len(self)):
+            yield ActionRecord(tracker, base + i)
+
 
 class ActionTracker:
-    def __init__(self):
-        self.actions = []
+    def __init__(self, max_actions=None):
+        """
+        Args:
+            max_actions: Keep at least this many recent actions in memory and
+                spill older ones (None keeps everything)
+        """
+        self.max_actions = max_actions
+        self.reset()
+
+        # Optional writer with write(action_dict) / flush() (action_log.ActionLogWriter)
+        self.sink = None
+
+    def reset(self):
+        """Forget every action and start a new session"""
         self.session_start = time.time()
-    
+
+        # Columns, one entry per action
+        self._type_names = []          # interned action types
+        self._type_ids = {}            # action type -> index in _type_names
+        self._types = array("H")       # type id per action
+        self._timestamps = array("d")
+        self._amounts = array("d")     # details["amount"] (0 when absent)
+        self._details = []
+        self._base = 0                 # absolute index of the first in-memory action
+
+        # Maintained by log_action, so summaries / lender lookups never rescan
+        self._summary = _empty_summary()
+        self._spilled = _empty_summary()  # counters of the spilled actions (for scan_summary)
+        self._by_lender = {}           # lender -> array of absolute action indices
+        self._history_cache = {}       # count -> get_formatted_history() text
+
+    @property
+    def actions(self):
+        """The in-memory actions, as a sequence of ActionRecord views"""
+        return ActionLog(self)
+
+    @property
+    def spilled(self):
+        """Number of (oldest) actions no longer held in memory"""
+        return self._base
+
     def log_action(self, action_type, details):
         """
         Log a player action with full context
-        
+
         Args:
             action_type: Type of action (loan, sale, repayment, etc.)
             details: Dictionary with action-specific details
         """
-        action_entry = {
-            "timestamp": time.time(),
-            "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "action_type": action_type,
-            "details": details
-        }
-        self.actions.append(action_entry)
-        return action_entry
-    
+        timestamp = time.time()
+        index = self._append(action_type, details, timestamp)
+        if self.sink is not None:
+            self.sink.write({"timestamp": timestamp, "action_type": action_type, "details": details})
+        return ActionRecord(self, index)
+
+    def record(self, event):
+        """Event bus subscriber: store a published ActionEvent"""
+        self._append(event.action_type, event.details, event.timestamp)
+        if self.sink is not None:
+            self.sink.write(event.to_dict())
+
+    def _append(self, action_type, details, timestamp):
+        """Store one action in the columns and update the aggregates; returns its absolute index"""
+        type_id = self._type_ids.get(action_type)
+        if type_id is None:
+            type_id = self._type_ids[action_type] = len(self._type_names)
+            self._type_names.append(action_type)
+
+        amount = details.get("amount", 0)
+        index = self._base + len(self._types)
+        self._types.append(type_id)
+        self._timestamps.append(timestamp)
+        self._amounts.append(amount if isinstance(amount, (int, float)) else 0)
+        self._details.append(details)
+
+        counters = SUMMARY_COUNTERS.get(action_type)
+        if counters:
+            count_key, total_key = counters
+            self._summary[count_key] += 1
+            self._summary[total_key] += amount
+
+        lender = details.get("lender")
+        if lender is not None:
+            lender_index = self._by_lender.get(lender)
+            if lender_index is None:
+                lender_index = self._by_lender[lender] = array("L")
+            lender_index.append(index)
+
+        self._history_cache.clear()
+        limit = self.max_actions
+        if limit is not None and len(self._types) >= limit + max(1, limit // 4):
+            self._spill(len(self._types) - limit)
+        return index
+
+    def _spill(self, count):
+        """
+        Drop the oldest `count` actions from memory. Called once the buffer is
+        a quarter over max_actions, so the front deletes stay amortized O(1)
+        per action.
+        """
+        counters = {self._type_ids[t]: keys for t, keys in SUMMARY_COUNTERS.items() if t in self._type_ids}
+        spilled = self._spilled
+        for type_id, amount in zip(self._types[:count], self._amounts[:count]):
+            keys = counters.get(type_id)
+            if keys:
+                spilled[keys[0]] += 1
+                spilled[keys[1]] += amount
+
+        del self._types[:count]
+        del self._timestamps[:count]
+        del self._amounts[:count]
+        del self._details[:count]
+        self._base += count
+
+        for lender, indices in list(self._by_lender.items()):
+            cut = bisect_left(indices, self._base)
+            if cut == len(indices):
+                del self._by_lender[lender]
+            elif cut:
+                del indices[:cut]
+
     def get_recent_actions(self, count=5):
         """Get the most recent N actions"""
-        return self.actions[-count:] if len(self.actions) >= count else self.actions
-    
+        return self.actions[-count:]
+
+    def get_actions_between(self, start, end=None):
+        """
+        Get the in-memory actions logged in [start, end) (O(log n + k))
+
+        Args:
+            start: Earliest timestamp (time.time() seconds)
+            end: Stop before this timestamp (None = up to now)
+        """
+        first = bisect_left(self._timestamps, start)
+        last = len(self._timestamps) if end is None else bisect_left(self._timestamps, end, first)
+        return [ActionRecord(self, self._base + i) for i in range(first, last)]
+
+    def get_actions_since(self, seconds):
+        """Get the actions logged in the last `seconds` seconds"""
+        return self.get_actions_between(time.time() - seconds)
+
     def get_action_summary(self):
-        """Get summary statistics of all actions"""
-        summary = {
-            "total_actions": len(self.actions),
-            "loans_taken": 0,
-            "sales_made": 0,
-            "repayments_made": 0,
-            "total_borrowed": 0,
-            "total_earned": 0,
-            "total_repaid": 0
-        }
-        
-        for action in self.actions:
-            action_type = action["action_type"]
-            details = action["details"]
-            
-            if action_type == "loan":
-                summary["loans_taken"] += 1
-                summary["total_borrowed"] += details.get("amount", 0)
-            elif action_type == "sale":
-                summary["sales_made"] += 1
-                summary["total_earned"] += details.get("amount", 0)
-            elif action_type == "repayment":
-                summary["repayments_made"] += 1
-                summary["total_repaid"] += details.get("amount", 0)
-        
+        """Get summary statistics of all actions (O(1), kept up to date by log_action)"""
+        summary = dict(self._summary)
+        summary["total_actions"] = self._base + len(self._types)
         return summary
-    
+
     def get_lender_history(self, lender_name):
-        """Get all interactions with a specific lender"""
-        return [
-            action for action in self.actions
-            if action["details"].get("lender") == lender_name
-        ]
-    
+        """
+        Get the in-memory interactions with a specific lender (O(k) for k
+        matches); spilled ones are only in the action log
+        """
+        return [ActionRecord(self, i) for i in self._by_lender.get(lender_name, ())]
+
+    def scan_summary(self):
+        """Recompute the summary with a full scan (slow; used to check the counters)"""
+        summary = dict(self._spilled)
+        summary["total_actions"] = self._base + len(self._types)
+        counters = {self._type_ids[t]: keys for t, keys in SUMMARY_COUNTERS.items() if t in self._type_ids}
+        for type_id, amount in zip(self._types, self._amounts):
+            keys = counters.get(type_id)
+            if keys:
+                summary[keys[0]] += 1
+                summary[keys[1]] += amount
+        return summary
+
+    def check_consistency(self):
+        """
+        Compare the incremental aggregates against a full rescan
+
+        Returns:
+            List of mismatch descriptions (empty when consistent)
+        """
+        problems = []
+        fast, slow = self.get_action_summary(), self.scan_summary()
+        for key in slow:
+            if abs(fast[key] - slow[key]) > 1e-6 * max(1, abs(slow[key])):
+                problems.append(f"summary[{key!r}]: incremental {fast[key]} != scan {slow[key]}")
+
+        scanned = {}
+        for i, details in enumerate(self._details, self._base):
+            if details.get("lender") is not None:
+                scanned.setdefault(details["lender"], []).append(i)
+        for lender in set(scanned) | set(self._by_lender):
+            indexed = list(self._by_lender.get(lender, ()))
+            if indexed != scanned.get(lender, []):
+                problems.append(f"lender index for {lender!r}: {len(indexed)} indexed != "
+                                f"{len(scanned.get(lender, []))} scanned")
+        return problems
+
     def export_to_json(self, filename="player_actions.json"):
-        """Export all actions to JSON file"""
+        """Export the in-memory actions (and the whole-session summary) to JSON file"""
         with open(filename, 'w') as f:
             json.dump({
                 "session_start": self.session_start,
-                "actions": self.actions,
+                "actions": [record.to_dict() for record in self.actions],
                 "summary": self.get_action_summary()
             }, f, indent=2)
-    
+
     def get_formatted_history(self, count=10):
-        """Get formatted string of recent actions for AI prompts"""
-        recent = self.get_recent_actions(count)
+        """Get formatted string of recent actions for AI prompts (cached until the next action)"""
+        text = self._history_cache.get(count)
+        if text is None:
+            text = self._history_cache[count] = self._format_history(count)
+        return text
+
+    def _format_history(self, count):
         formatted = []
-        
-        for action in recent:
-            action_type = action["action_type"]
-            details = action["details"]
-            time_str = action["datetime"]
-            
-            if action_type == "loan":
-                formatted.append(
-                    f"{time_str}: Borrowed {details['amount']} gold from {details['lender']} "
-                    f"at {details['interest_rate']*100}% interest (will owe {details['amount_owed']} gold)"
-                )
-            elif action_type == "sale":
-                formatted.append(
-                    f"{time_str}: Made sale for {details['amount']} gold (stock used: {details['stock_used']})"
-                )
-            elif action_type == "repayment":
-                formatted.append(
-                    f"{time_str}: Repaid {details['amount']} gold to {details['lender']}"
-                )
-        
+        for action in self.get_recent_actions(count):
+            line = format_action(action["action_type"], action["details"], action["datetime"])
+            if line:
+                formatted.append(line)
         return "\n".join(formatted) if formatted else "No actions yet"
 
-# Global tracker instance
-action_tracker = ActionTracker()
\ No newline at end of file
+# Global tracker instance, fed by the game's event bus
+action_tracker = ActionTracker(max_actions=ACTION_HISTORY_LIMIT)
+event_bus.subscribe(action_tracker.record)
@@ -1,18 +1,11 @@
 """
 Action Feedback System - AI-powered feedback for player decisions
 """
-import boto3
 import json
-from dotenv import load_dotenv
-import os
 import re
 
-load_dotenv()
+from ai.bedrock import get_client
 
-client = boto3.client(
-    "bedrock-runtime",
-    region_name=os.getenv("AWS_DEFAULT_REGION")
-)
 
 def call_claude(prompt, max_tokens=400):
     """Helper function to call Claude via Bedrock"""
@@ -28,7 +21,7 @@ def call_claude(prompt, max_tokens=400):
         ]
     })
 
-    response = client.invoke_model(
+    response = get_client().invoke_model(
         modelId='us.anthropic.claude-haiku-4-5-20251001-v1:0',
         contentType='application/json',
         accept='application/json',
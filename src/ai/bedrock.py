@@ -0,0 +1,48 @@
+"""
+Bedrock Client - One lazily created bedrock-runtime client shared by the advisors
+
+boto3 and python-dotenv are only imported the first time an advisor needs the
+client (or by warm_up() on a background thread once the game window is up),
+so importing the game never pays for them.
+"""
+import os
+import threading
+
+_client = None
+_lock = threading.Lock()
+
+
+def get_client():
+    """Return the shared bedrock-runtime client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                import boto3
+                from dotenv import load_dotenv
+
+                load_dotenv()
+                _client = boto3.client(
+                    "bedrock-runtime",
+                    region_name=os.getenv("AWS_DEFAULT_REGION")
+                )
+    return _client
+
+
+def warm_up():
+    """
+    Create the client on a daemon thread so the first advisor call doesn't
+    stall a frame importing boto3
+
+    Returns:
+        The started thread
+    """
+    def _worker():
+        try:
+            get_client()
+        except Exception as e:
+            print(f"Warning: Bedrock warm-up failed: {e}")
+
+    thread = threading.Thread(target=_worker, name="bedrock-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,112 @@
+"""
+AI Gateway - One shared, rate-limited door to Bedrock for many sessions
+
+The ai.* helpers are blocking calls. The gateway runs them on a thread pool
+for asyncio code and shares three things between every session using it:
+
+    cache       answers are kept for `cache_ttl` seconds under a key the
+                caller chooses (e.g. the action plus a coarse money/debt
+                bucket), so similar players in a room reuse one answer
+    coalescing  concurrent calls with the same key wait for one request
+    limits      at most `max_concurrency` requests in flight and a token
+                bucket of `rate` requests per second (bursts up to `burst`)
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TokenBucket:
+    """Async token bucket: acquire() waits until a request may start"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AIGateway:
+    def __init__(self, max_concurrency=8, rate=5.0, burst=10, cache_ttl=60.0, cache_size=2048):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="ai-gateway")
+
+        self._cache = OrderedDict()   # key -> (expires, result), least recently used first
+        self._inflight = {}           # key -> Future shared by concurrent callers
+        self.stats = {"calls": 0, "cache_hits": 0, "coalesced": 0, "errors": 0}
+
+    def _cached(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    async def call(self, key, fn, *args, fallback=None):
+        """
+        Result of fn(*args), shared with every caller asking for `key`
+
+        Args:
+            key: Hashable cache key (None = never cache or coalesce)
+            fn: Blocking function (an ai.* helper)
+            fallback: Returned (and not cached) when fn raises
+        """
+        if key is not None:
+            entry = self._cached(key)
+            if entry is not None:
+                self.stats["cache_hits"] += 1
+                return entry[1]
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self.stats["coalesced"] += 1
+                return await asyncio.shield(pending)
+            pending = self._inflight[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            result = await self._run(fn, args)
+            failed = False
+        except Exception as e:
+            print(f"Warning: AI call {getattr(fn, '__name__', fn)} failed: {e}")
+            self.stats["errors"] += 1
+            result, failed = fallback, True
+        except BaseException:
+            # cancelled: don't leave the coalesced callers waiting forever
+            if key is not None:
+                del self._inflight[key]
+                pending.cancel()
+            raise
+
+        if key is not None:
+            del self._inflight[key]
+            pending.set_result(result)
+            if not failed:
+                self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    async def _run(self, fn, args):
+        async with self.semaphore:
+            await self.bucket.acquire()
+            self.stats["calls"] += 1
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,16 +1,8 @@
-import boto3
 import json
 
 # ========== AWS Bedrock Client ==========
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-
-client = boto3.client(
-    "bedrock-runtime",
-    region_name=os.getenv("AWS_DEFAULT_REGION")
-)
+# Created on first use (see ai/bedrock.py)
+from ai.bedrock import get_client
 
 def lending_decision(player):
     """
@@ -53,7 +45,7 @@ Respond strictly in JSON format with:
         ]
     })
 
-    response = client.invoke_model(
+    response = get_client().invoke_model(
         modelId='us.anthropic.claude-haiku-4-5-20251001-v1:0',
         contentType='application/json',
         accept='application/json',
@@ -1,5 +1,13 @@
-from langchain_aws import BedrockLLM
+_llm = None
 
-llm = BedrockLLM(
-    credentials_profile_name="bedrock-admin", model_id="amazon.titan-text-express-v1"
-)
\ No newline at end of file
+
+def get_llm():
+    """Build the LangChain Bedrock LLM the first time it is needed (langchain_aws is slow to import)"""
+    global _llm
+    if _llm is None:
+        from langchain_aws import BedrockLLM
+
+        _llm = BedrockLLM(
+            credentials_profile_name="bedrock-admin", model_id="amazon.titan-text-express-v1"
+        )
+    return _llm
@@ -1,16 +1,9 @@
-import boto3
 import json
-import os
 import re
-from dotenv import load_dotenv
-
-load_dotenv()
 
 # ========== AWS Bedrock Client ==========
-client = boto3.client(
-    "bedrock-runtime",
-    region_name=os.getenv("AWS_DEFAULT_REGION")
-)
+# Created on first use (see ai/bedrock.py)
+from ai.bedrock import get_client
 
 def overall_summary(player, actions):
     """
@@ -55,7 +48,7 @@ Ensure all values are strings and the JSON is valid.
 
     # Call Bedrock model
     try:
-        response = client.invoke_model(
+        response = get_client().invoke_model(
             modelId='us.anthropic.claude-haiku-4-5-20251001-v1:0',
             contentType='application/json',
             accept='application/json',
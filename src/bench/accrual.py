@@ -0,0 +1,71 @@
+"""
+Accrual Benchmark - Per-tick compounding vs closed-form accrual
+
+Fast-forwards the starting debts (plus one loan from every lender) by
+--hours of game time at DEBT_UPDATE_INTERVAL-second ticks, three ways:
+    per-tick loop      Player.update_debts' old loop, once per tick
+    accrue "tick"      engine.accrue_interest with per-tick rounding (exact parity)
+    accrue "final"     engine.accrue_interest in closed form (O(lenders))
+and checks that "tick" matches the loop to the cent and how far "final"
+drifts from it.
+
+Run from the repo root:
+    python src/bench/accrual.py
+    python src/bench/accrual.py --hours 0.5 --interval 30
+"""
+import argparse
+import os
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import engine
+
+# Small enough that the balances stay below ledger.MAX_BALANCE over a long fast-forward
+DEBTS = dict(engine.START_DEBTS, **{"Farmer Finn": 10.8, "Poultry Guy": 27.5})
+
+
+def per_tick(debts, ticks):
+    """The loop Player.update_debts used to run once per tick"""
+    debts = dict(debts)
+    for _ in range(ticks):
+        for lender, amount in debts.items():
+            debts[lender] = round(amount * (1 + engine.INTEREST_RATES.get(lender, 0)), 2)
+    return debts
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0, help="game time to fast-forward")
+    parser.add_argument("--interval", type=float, default=30, help="seconds per tick")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    seconds = args.hours * 3600
+    ticks = int(seconds // args.interval)
+    print(f"===== Fast-forward {args.hours} h = {ticks:,} ticks, {len(DEBTS)} lenders =====")
+    loop_s, expected = timed(lambda: per_tick(DEBTS, ticks), args.repeat)
+    tick_s, tick = timed(lambda: engine.accrue_interest(DEBTS, ticks, "tick"), args.repeat)
+    final_s, final = timed(lambda: engine.accrue_interest(DEBTS, ticks, "final"), args.repeat)
+    for label, s in (("per-tick loop", loop_s), ('accrue "tick"', tick_s), ('accrue "final"', final_s)):
+        print(f"{label:16}{1e6 * s:12.1f} µs")
+
+    if tick != expected:
+        print('accrue "tick" rounding does not match the per-tick loop')
+        sys.exit(1)
+    drift = max(abs(final[k] - expected[k]) / max(1.0, abs(expected[k])) for k in expected)
+    print(f'"tick" matches the loop; "final" differs by at most {drift:.2e} (relative)')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Customer Benchmark - Per-frame cost of the NumPy customer crowd
+
+Runs crowd.Crowd in the café world for --frames frames at 60 FPS with a
+real CoffeeShop and Player taking the sales, and reports the update time
+per frame (mean / p99) for each --customers size against the --budget,
+plus how many café sales the crowd made per game minute. For comparison
+the same number of NPC sprites are moved one by one with
+NPC.random_move().
+
+Run from the repo root:
+    python src/bench/customers.py
+    python src/bench/customers.py --customers 1000 --customers 5000 --frames 3600
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import pygame
+
+from crowd import Crowd
+from npc import NPC
+from player import Player
+from settings import FPS, WORLD_HEIGHT, WORLD_WIDTH
+from store import CoffeeShop
+
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(round(p * (len(sorted_values) - 1))))]
+
+
+def sprite_loop(n, frames):
+    """ms per frame for n NPC sprites moved with random_move()"""
+    npcs = [NPC(f"Customer {i}", "./src/assets/farmer.png", pos=(i % WORLD_WIDTH, i % WORLD_HEIGHT),
+                size=(48, 48)) for i in range(n)]
+    start = time.perf_counter()
+    for _ in range(frames):
+        for npc in npcs:
+            npc.random_move()
+    return 1000 * (time.perf_counter() - start) / frames
+
+
+def run(n, frames, visits, seed):
+    shop = CoffeeShop((WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
+    player = Player((0, 0))
+    crowd = Crowd(n, (WORLD_WIDTH, WORLD_HEIGHT), shop.rect.midbottom, visits_per_minute=visits, seed=seed)
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        crowd.update(1 / FPS, shop, player)
+        times.append(1000 * (time.perf_counter() - start))
+    minutes = frames / FPS / 60
+    return statistics.fmean(times), _percentile(sorted(times), 0.99), crowd.sales / minutes, crowd.revenue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--customers", type=int, action="append", help="crowd size(s) (default 100, 1000, 10000)")
+    parser.add_argument("--frames", type=int, default=1800, help="frames per size (60 per game second)")
+    parser.add_argument("--visits", type=float, default=60, help="café visits per minute by the whole crowd")
+    parser.add_argument("--budget", type=float, default=1.0, help="ms per frame allowed at 1,000 customers")
+    parser.add_argument("--sprite-frames", type=int, default=60, help="frames for the random_move() comparison")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(SRC_DIR))  # asset paths are relative to the repo root
+    pygame.init()
+    print(f"{'customers':>10}{'mean ms':>10}{'p99 ms':>10}{'sprites ms':>12}{'sales/min':>11}{'revenue':>9}")
+    over = False
+    for n in args.customers or [100, 1000, 10000]:
+        mean, p99, per_minute, revenue = run(n, args.frames, args.visits, args.seed)
+        sprites = sprite_loop(n, args.sprite_frames)
+        print(f"{n:>10,}{mean:>10.3f}{p99:>10.3f}{sprites:>12.3f}{per_minute:>11.1f}{revenue:>9,}")
+        if n <= 1000 and mean > args.budget:
+            over = True
+    if over:
+        print(f"Crowd update is over the {args.budget} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Frame Benchmark - Per-frame cost of every scene, headless
+
+Drives each scene through SceneManager.frame() under SDL_VIDEODRIVER=dummy
+with scripted input (a mouse sweep plus per-scene actions such as walking
+the café player), and reports mean / p50 / p99 / max frame time. A
+per-function breakdown shows where the time goes: draw_text, draw_panel,
+the gradient / particle backgrounds and the popups. Breakdown times are
+inclusive (draw_hud includes the draw_text calls it makes).
+
+Run from the repo root:
+    python src/bench/frames.py                           # all scenes, 300 frames
+    python src/bench/frames.py --only cafe --only credcity:store --frames 1000
+    python src/bench/frames.py --save-baseline src/bench/frames_baseline.json
+    python src/bench/frames.py --baseline src/bench/frames_baseline.json
+
+With --baseline the exit code is 1 when a scene's mean or p99 regressed by
+more than --tolerance (relative) and --min-ms (absolute).
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(SRC_DIR)
+for folder in (SRC_DIR, os.path.join(SRC_DIR, "whack"), os.path.join(SRC_DIR, "CredCity")):
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+import pygame
+
+from scene import SceneManager
+
+# Functions whose (inclusive) time is broken out: module -> names ("Class.method" for methods)
+BREAKDOWN = {
+    "credcity": ["draw_text", "draw_panel", "draw_glass", "draw_card", "draw_hud", "button"],
+    "loans_main": ["draw_gradient_background", "draw_game_status"],
+    "camera": ["CameraGroup.draw"],
+    "ui": ["UI.draw_left_panel", "UI.draw_right_panel", "UI.draw_minimap",
+           "UI.draw_status_bar", "UI.draw_active_menu", "UI.draw_popup"],
+    "credit": ["draw_background", "draw_game_popup_overlay",
+               "PopupManager.draw_popup", "PopupManager.wrap_text"],
+    "level_select": ["draw_background", "draw_hexagon_grid"],
+    "level1_credit": ["draw_command_center_background", "draw_hexagon_grid",
+                      "draw_question_panel", "show_feedback", "show_final_score"],
+    "level2_identity": ["draw_city_background", "draw_email_display", "draw_feedback"],
+    "level3_socialmedia": ["draw_instagram_ui", "draw_instagram_post", "show_feedback"],
+}
+
+
+class Profiler:
+    """Wraps the BREAKDOWN functions and accumulates time / calls per frame window"""
+
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+        self.installed = set()
+
+    def install(self):
+        """Wrap every BREAKDOWN function of the modules imported so far (once each)"""
+        for module_name, names in BREAKDOWN.items():
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            for name in names:
+                owner = module
+                attr = name
+                if "." in name:
+                    cls_name, attr = name.split(".")
+                    owner = getattr(module, cls_name, None)
+                if owner is None or not hasattr(owner, attr):
+                    continue
+                label = f"{module_name}.{name}"
+                if label in self.installed:
+                    continue
+                self.installed.add(label)
+                setattr(owner, attr, self._wrap(label, getattr(owner, attr)))
+
+    def _wrap(self, label, fn):
+        totals, calls = self.totals, self.calls
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                totals[label] = totals.get(label, 0.0) + time.perf_counter() - start
+                calls[label] = calls.get(label, 0) + 1
+        return wrapper
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+
+
+# ============ SCENE CASES ============
+# Each case builds its scene on `manager` and returns (scene, step) where
+# step(frame) applies that frame's scripted input.
+
+def _credcity(state):
+    def setup(manager):
+        import credcity
+        scene = credcity.CredCityScene(manager)
+        manager.push(scene)
+        credcity.player.topleft = (100, 600)
+        if state != credcity.STATE_CITY:
+            credcity.set_state(state)
+        else:
+            credcity.state = state
+
+        def step(frame):
+            if state == credcity.STATE_CITY:
+                # walk the hub player around instead of key presses
+                credcity.player.x = 100 + int(500 + 450 * math.sin(frame / 40))
+        return scene, step
+    return setup
+
+
+def _cafe(popup, crowd=0):
+    def setup(manager):
+        import functions
+        import loans_main
+        functions.game_state.tutorial_shown = False
+        scene = loans_main.CosmicCafeScene(manager, crowd=crowd)
+        manager.push(scene)
+        scene.ai_warming = True  # no network from a benchmark
+        if not popup:
+            scene.ui.showing_popup = False
+        cx, cy = scene.player.rect.center
+
+        def step(frame):
+            # circle the coffee shop so the camera and proximity checks move
+            scene.player.rect.center = (cx + int(400 * math.cos(frame / 30)),
+                                        cy + int(300 * math.sin(frame / 30)))
+        return scene, step
+    return setup
+
+
+def _grocery(state, popup_level=None):
+    def setup(manager):
+        import credit
+        scene = credit.GroceryScene(manager)
+        manager.push(scene)
+        credit.current_game_state = getattr(credit, state)
+        for game in (credit.level1_game, credit.level2_game, credit.level3_game):
+            game.reset()
+        credit.popup_manager.active_popup = None
+        if popup_level:
+            credit.popup_manager.set_popups(credit.level_popups[popup_level])
+            credit.popup_manager.show_next_popup()
+        return scene, lambda frame: None
+    return setup
+
+
+def _whack(module_name, class_name, attrs=None):
+    def setup(manager):
+        module = __import__(module_name)
+        scene = getattr(module, class_name)(manager)
+        manager.push(scene)
+        for k, v in (attrs or {}).items():
+            setattr(scene, k, v)
+        return scene, lambda frame: None
+    return setup
+
+
+CASES = {
+    "credcity:city": _credcity("city"),
+    "credcity:bank": _credcity("bank"),
+    "credcity:store": _credcity("store"),
+    "credcity:cafe": _credcity("cafe"),
+    "credcity:tower": _credcity("tower"),
+    "cafe": _cafe(popup=False),
+    "cafe:popup": _cafe(popup=True),
+    "cafe:stress": _cafe(popup=False, crowd=3000),
+    "grocery:menu": _grocery("MAIN_MENU"),
+    "grocery:level1": _grocery("LEVEL_1_GAME"),
+    "grocery:level2": _grocery("LEVEL_2_GAME"),
+    "grocery:level3": _grocery("LEVEL_3_GAME"),
+    "grocery:popup": _grocery("MAIN_MENU", popup_level=1),
+    "whack:select": _whack("level_select", "LevelSelectScene"),
+    "whack:level1": _whack("level1_credit", "CreditCardScene"),
+    "whack:level2": _whack("level2_identity", "EmailScene"),
+    "whack:level3": _whack("level3_socialmedia", "SocialMediaScene"),
+}
+
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(round(p * (len(sorted_values) - 1))))]
+
+
+def run_case(manager, name, frames, warmup, seed, profiler):
+    """
+    Run one case on the shared manager and return its stats (or an error)
+
+    The window stays up between cases: the games keep their fonts in module
+    globals after init(), so pygame must not be shut down in between.
+    """
+    random.seed(seed)
+    manager.running = True
+    pygame.display.set_caption(name)
+    try:
+        scene, step = CASES[name](manager)
+        profiler.install()
+
+        times = []
+        for frame in range(warmup + frames):
+            if frame == warmup:
+                profiler.reset()
+            step(frame)
+            # mouse sweep across the window (hover states, tooltips)
+            w, h = manager.screen.get_size()
+            pos = (int(w / 2 + w / 2.2 * math.sin(frame / 23)), int(h / 2 + h / 2.2 * math.sin(frame / 37)))
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+
+            start = time.perf_counter()
+            manager.frame(manager.step)  # exactly one fixed-step update per measured frame
+            if frame >= warmup:
+                times.append((time.perf_counter() - start) * 1000)
+            if manager.current is not scene:
+                break
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    finally:
+        while manager.stack:
+            manager.stack.pop().exit()
+
+    if not times:
+        return {"error": "scene exited before measuring"}
+    ordered = sorted(times)
+    breakdown = {
+        label: {"ms_per_frame": round(1000 * total / len(times), 4),
+                "calls_per_frame": round(profiler.calls[label] / len(times), 2)}
+        for label, total in sorted(profiler.totals.items(), key=lambda kv: -kv[1])
+    }
+    return {
+        "frames": len(times),
+        "mean_ms": round(statistics.fmean(times), 3),
+        "p50_ms": round(_percentile(ordered, 0.50), 3),
+        "p99_ms": round(_percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+        "breakdown": breakdown,
+    }
+
+
+def compare(report, baseline, tolerance, min_ms):
+    """Return regression messages for mean/p99 against a baseline report"""
+    regressions = []
+    for name, old in baseline.get("scenes", {}).items():
+        new = report["scenes"].get(name)
+        if not new or "error" in new or "error" in old:
+            continue
+        for m in ("mean_ms", "p99_ms"):
+            delta = new[m] - old[m]
+            if delta > min_ms and new[m] > old[m] * (1 + tolerance):
+                regressions.append(f"{name}: {m} {old[m]:.2f} → {new[m]:.2f} ms (+{delta:.2f})")
+    return regressions
+
+
+def print_report(report, top):
+    print(f"{'scene':18}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}  (ms, {report['frames']} frames)")
+    for name, row in report["scenes"].items():
+        if "error" in row:
+            print(f"{name:18}  FAILED: {row['error']}")
+            continue
+        print(f"{name:18}{row['mean_ms']:>9.2f}{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['max_ms']:>9.2f}")
+        for label, b in list(row["breakdown"].items())[:top]:
+            print(f"{'':20}{b['ms_per_frame']:>8.3f} ms/frame  {b['calls_per_frame']:>7.1f} calls  {label}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scene")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured frames first")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--only", action="append", choices=sorted(CASES), help="scene(s) to run")
+    parser.add_argument("--top", type=int, default=5, help="breakdown rows to print per scene")
+    parser.add_argument("--out", default="frames_report.json", help="JSON report path")
+    parser.add_argument("--baseline", help="compare against this report")
+    parser.add_argument("--save-baseline", help="also write the report here")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="allowed relative slowdown")
+    parser.add_argument("--min-ms", type=float, default=0.5, help="ignore slowdowns below this")
+    args = parser.parse_args()
+
+    os.chdir(REPO_DIR)  # asset paths are relative to the repo root
+    profiler = Profiler()
+    manager = SceneManager()
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "frames": args.frames,
+        "seed": args.seed,
+        "scenes": {},
+    }
+    for name in args.only or CASES:
+        report["scenes"][name] = run_case(manager, name, args.frames, args.warmup, args.seed, profiler)
+    pygame.quit()
+
+    print_report(report, args.top)
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.min_ms)
+        if regressions:
+            print("Frame-time regressions:")
+            for r in regressions:
+                print("  " + r)
+            sys.exit(1)
+        print("No frame-time regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Engine Benchmark - Headless Cosmic Café games per second
+
+Plays --games seeded games through engine.step() with each scripted policy
+below (an interest tick every --tick actions, like the 30-second timer) and
+reports games/s, steps/s and the outcome mix. Every game is replayed once
+from its seed to check that the engine is deterministic (exit 1 if not).
+
+The game's starting debt to "Wizard of Woe" has no Repay option and accrues
+25% per tick, so with the default start no policy can win; --no-start-debts
+starts from zero debt to compare the policies themselves.
+
+Run from the repo root:
+    python src/bench/games.py
+    python src/bench/games.py --games 100000 --policy saver
+    python src/bench/games.py --no-start-debts
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import engine
+
+SALE = ("Coffee Shop", "Generate a Sale")
+
+
+def saver(state):
+    """Sell, restock from the Farmer, pay the costliest debts off first"""
+    for menu in ("Witch", "Poultry", "Farmer", "Banker"):
+        debt = state.debts.get(engine.REPAY[menu], 0)
+        if 0 < debt <= state.money:
+            return (menu, "Repay Debt")
+    if state.stock < engine.SALE_STOCK:
+        return ("Farmer", "Buy 5 Stock")
+    return SALE
+
+
+def borrower(state):
+    """Sell, and borrow stock on credit instead of buying it"""
+    if state.stock < engine.SALE_STOCK:
+        return ("Poultry", "Borrow 25 stock")
+    if state.money >= state.total_debt > 0:
+        for menu in ("Witch", "Poultry", "Farmer", "Banker"):
+            if state.debts.get(engine.REPAY[menu], 0) > 0:
+                return (menu, "Repay Debt")
+    return SALE
+
+
+def gambler(state):
+    """Takes the Witch's money whenever cash runs low"""
+    if state.money < 100:
+        return ("Witch", "Borrow 100 gold")
+    if state.stock < engine.SALE_STOCK:
+        return ("Poultry", "Buy 10 Stock")
+    if state.money > 300 and state.debts.get("Witch of Woe", 0) > 0:
+        return ("Witch", "Repay Debt")
+    return SALE
+
+
+def make_random(seed):
+    rng = random.Random(seed)
+    options = [SALE, SALE, SALE] + list(engine.LOANS) + list(engine.PURCHASES) + \
+              [(menu, "Repay Debt") for menu in engine.REPAY]
+    return lambda state: options[rng.randrange(len(options))]
+
+
+POLICIES = {"saver": saver, "borrower": borrower, "gambler": gambler, "random": None}
+
+
+def play(policy_name, games, seed, max_turns, tick, debts=None):
+    """Run `games` games; returns (seconds, steps, outcomes, finals)"""
+    outcomes = {"WIN": 0, "LOSE": 0, "PLAYING": 0}
+    finals = []
+    steps = 0
+    start = time.perf_counter()
+    for g in range(games):
+        policy = POLICIES[policy_name] or make_random(seed + g)
+        state, _ = engine.run(seed + g, policy, max_turns, tick, debts)
+        steps += state.turn
+        outcomes[state.outcome] += 1
+        finals.append(state)
+    return time.perf_counter() - start, steps, outcomes, finals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=10_000, help="games per policy")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-turns", type=int, default=500, help="actions before a game is cut off")
+    parser.add_argument("--tick", type=int, default=5, help="interest tick every N actions (0 = never)")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES), help="policy (default all)")
+    parser.add_argument("--no-start-debts", action="store_true", help="start with no debts")
+    args = parser.parse_args()
+    debts = {} if args.no_start_debts else None
+
+    print(f"{'policy':10}{'games/s':>12}{'steps/s':>14}{'win':>8}{'lose':>8}{'open':>8}  "
+          f"({args.games:,} games, max {args.max_turns} actions)")
+    for name in args.policy or POLICIES:
+        seconds, steps, outcomes, finals = play(name, args.games, args.seed, args.max_turns, args.tick, debts)
+        print(f"{name:10}{args.games / seconds:>12,.0f}{steps / seconds:>14,.0f}"
+              f"{outcomes['WIN'] / args.games:>8.1%}{outcomes['LOSE'] / args.games:>8.1%}"
+              f"{outcomes['PLAYING'] / args.games:>8.1%}")
+
+        _, _, _, replay = play(name, min(args.games, 200), args.seed, args.max_turns, args.tick, debts)
+        if replay != finals[:len(replay)]:
+            print(f"{name}: replaying the same seeds gave different games")
+            sys.exit(1)
+    print("Determinism check: replays match")
+
+
+if __name__ == "__main__":
+    main()
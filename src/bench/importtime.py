@@ -0,0 +1,119 @@
+"""
+Startup Report - Where does the Cosmic Café spend its time before the first frame?
+
+Runs the game module under `python -X importtime`, sums the self time of every
+imported module by top-level package, then launches the game headless (SDL
+dummy driver) and measures wall-clock time until the first frame is shown.
+
+Run from the repo root:
+    python src/bench/importtime.py
+    python src/bench/importtime.py --module credit --script src/credit.py
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(SRC_DIR)
+
+# Packages that should only load on first advisor use (see ai/bedrock.py)
+HEAVY_AI = ("boto3", "botocore", "dotenv", "langchain_aws")
+
+
+def _env(extra_path=()):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYTHONPATH"] = os.pathsep.join([SRC_DIR, *extra_path, env.get("PYTHONPATH", "")])
+    return env
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output
+
+    Returns:
+        List of (module, self_us, cumulative_us, depth)
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            rows.append((name.strip(), int(self_us), int(cum_us), depth))
+        except ValueError:
+            continue
+    return rows
+
+
+def import_report(module, extra_path=()):
+    """Import `module` in a fresh interpreter and return its importtime rows"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR, env=_env(extra_path), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import failed")
+    return parse_importtime(result.stderr)
+
+
+def time_to_first_frame(script):
+    """Launch `script` headless and time it until SceneManager presents frame 1"""
+    env = _env()
+    env["CREDITWISE_EXIT_AFTER_FIRST_FRAME"] = "1"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, script], cwd=REPO_DIR, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    for line in proc.stdout:
+        if line.startswith("[startup] first frame"):
+            elapsed = time.perf_counter() - start
+            proc.wait()
+            return elapsed, line.strip()
+    proc.wait()
+    return None, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="loans_main", help="module to import")
+    parser.add_argument("--script", default="src/loans_main.py", help="game script to launch")
+    parser.add_argument("--path", action="append", default=[],
+                        help="extra folder for sys.path (e.g. src/whack)")
+    parser.add_argument("--top", type=int, default=15, help="packages to list")
+    args = parser.parse_args()
+
+    rows = import_report(args.module, args.path)
+    if rows:
+        by_package = {}
+        for name, self_us, _, _ in rows:
+            top = name.split(".")[0]
+            by_package[top] = by_package.get(top, 0) + self_us
+        total_us = sum(by_package.values())
+
+        print(f"===== import {args.module}: {total_us / 1000:.1f} ms, {len(rows)} modules =====")
+        for name, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:args.top]:
+            print(f"{us / 1000:9.1f} ms  {100 * us / total_us:5.1f}%  {name}")
+
+        loaded = [p for p in HEAVY_AI if p in by_package]
+        if loaded:
+            print(f"Heavy AI packages imported at startup: {', '.join(loaded)}")
+        else:
+            print("Heavy AI packages imported at startup: none")
+
+    elapsed, line = time_to_first_frame(args.script)
+    print(f"===== {args.script} =====")
+    if elapsed is None:
+        print("No frame presented (game failed to start)")
+    else:
+        print(f"Time to first frame: {elapsed * 1000:.1f} ms (process start → first flip)")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Load Benchmark - Simulated café players driving the real action handlers
+
+Spawns --bots scripted players per concurrency level. Each one has its own
+Player, ActionTracker and a stub UI, and plays the café through the same
+functions.*_action handlers the game uses (sales, stock purchases, Banker
+loans, repayments, account checks) with exponential think-times. Bedrock
+is replaced by a built-in fake client that sleeps for a log-normal latency
+(--ai-ms median) and answers with valid JSON, so no network is used.
+
+The blocking handlers run on a thread pool (at most --max-threads threads);
+bots think on asyncio. Events published by a handler are routed to the
+calling bot's own tracker.
+
+Reported per concurrency level:
+    actions/s           completed handler calls per second
+    p50 / p95 / p99     handler latency, queueing for a thread included
+    heap KB/session     Python allocations per bot (tracemalloc, setup + warm-up)
+    rss KB/session      process RSS growth per bot (includes pygame surfaces)
+
+Run from the repo root:
+    python src/bench/load.py
+    python src/bench/load.py --bots 100 --bots 1000 --bots 5000 --duration 20
+    python src/bench/load.py --think 0.5 --ai-ms 400 --max-threads 1024
+"""
+import argparse
+import asyncio
+import gc
+import io
+import json
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import functions
+from action_tracker import ActionTracker, action_tracker
+from ai import bedrock
+from events import event_bus
+from player import Player
+
+# One answer with every key the ai.* helpers read
+FAKE_ANSWER = json.dumps({
+    "decision": True, "amount": 40, "interest": 0.05, "reason": "Steady sales, low debt.",
+    "feedback": "Reasonable move.", "severity": "neutral", "emoji": "💡", "tip": "Keep selling.",
+    "suggestions": ["Sell more", "Repay the Witch first", "Avoid new debt"],
+    "priority": "advisory", "next_steps": ["Sell", "Repay"], "health": "good",
+    "assessment": "On track.", "sales_needed": 3, "risk_level": "low",
+    "repayment_strategy": "Repay after two sales", "warning": "", "recommendation": "Fine.",
+})
+
+
+class FakeBedrock:
+    """Stands in for the bedrock-runtime client: sleeps, then answers FAKE_ANSWER"""
+
+    def __init__(self, median_ms, sigma=0.5, seed=0):
+        self.mu = math.log(max(median_ms, 0.001) / 1000)
+        self.sigma = sigma
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def invoke_model(self, modelId, contentType, accept, body):
+        with self.lock:
+            self.calls += 1
+            delay = self.rng.lognormvariate(self.mu, self.sigma)
+        time.sleep(delay)
+        payload = {"content": [{"type": "text", "text": FAKE_ANSWER}]}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+class StubUI:
+    """Just the attributes the handlers set (show_popup, pending_loan)"""
+
+    def __init__(self):
+        self.popup_title = ""
+        self.popup_description = ""
+        self.popup_buttons = []
+        self.showing_popup = False
+
+
+# Events published on the shared bus go to the tracker of the bot whose
+# handler is running on this thread
+_current = threading.local()
+
+
+def _route(event):
+    tracker = getattr(_current, "tracker", None)
+    if tracker is not None:
+        tracker.record(event)
+
+
+class Bot:
+    __slots__ = ("player", "tracker", "ui", "rng")
+
+    def __init__(self, seed):
+        self.player = Player((0, 0))
+        self.tracker = ActionTracker()
+        self.ui = StubUI()
+        self.rng = random.Random(seed)
+
+    def next_action(self):
+        """(handler, option) picked like a casual player would"""
+        player, ui, roll = self.player, self.ui, self.rng.random()
+        if hasattr(ui, "pending_loan"):
+            return functions.banker_action, "Accept Loan"
+        if player.stock < 20:
+            return (functions.poultry_action, "Buy 10 Stock") if player.money >= 20 \
+                else (functions.poultry_action, "Borrow 25 stock")
+        if roll < 0.55:
+            return functions.coffee_shop_action, "Generate a Sale"
+        if roll < 0.65:
+            return functions.coffee_shop_action, "Check Account"
+        if roll < 0.75:
+            return functions.banker_action, "Request Loan"
+        if roll < 0.85:
+            handler = self.rng.choice([functions.banker_action, functions.poultry_action,
+                                       functions.farmer_action, functions.witch_action])
+            return handler, "Repay Debt"
+        if roll < 0.95:
+            return functions.farmer_action, "Buy 5 Stock"
+        return functions.witch_action, "Borrow 50 gold"
+
+    def act(self):
+        """Run one handler on the calling thread; returns its latency in seconds"""
+        handler, option = self.next_action()
+        _current.tracker = self.tracker
+        start = time.perf_counter()
+        try:
+            handler(self.ui, self.player, option)
+        finally:
+            _current.tracker = None
+        return time.perf_counter() - start
+
+
+def rss_kb():
+    """Current resident set size (Linux /proc), else the peak from getrusage"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(round(p * (len(sorted_values) - 1))))]
+
+
+async def run_level(n_bots, duration, think, max_threads, seed):
+    gc.collect()
+    rss_before = rss_kb()
+    tracemalloc.start()
+    heap_before = tracemalloc.get_traced_memory()[0]
+    bots = [Bot(seed + i) for i in range(n_bots)]
+    for bot in bots[:min(n_bots, 50)]:
+        bot.act()   # warm-up so trackers and players hold a few actions
+    heap_per_bot = (tracemalloc.get_traced_memory()[0] - heap_before) / n_bots
+    tracemalloc.stop()
+    rss_per_bot = (rss_kb() - rss_before) / n_bots
+
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=min(n_bots, max_threads), thread_name_prefix="bot")
+    latencies = []
+    deadline = time.perf_counter() + duration
+
+    async def drive(bot):
+        rng = bot.rng
+        await asyncio.sleep(rng.random() * think)   # spread the first actions
+        while time.perf_counter() < deadline:
+            queued = time.perf_counter()
+            await loop.run_in_executor(pool, bot.act)
+            latencies.append(time.perf_counter() - queued)
+            await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(drive(bot) for bot in bots))
+    elapsed = time.perf_counter() - start
+    pool.shutdown(wait=True)
+
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "bots": n_bots,
+        "actions": len(latencies),
+        "actions_per_s": len(latencies) / elapsed,
+        "p50_ms": 1000 * _percentile(ordered, 0.50),
+        "p95_ms": 1000 * _percentile(ordered, 0.95),
+        "p99_ms": 1000 * _percentile(ordered, 0.99),
+        "heap_kb": heap_per_bot / 1024,
+        "rss_kb": rss_per_bot,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bots", type=int, action="append", help="concurrency level(s) (default 100, 1000)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think-time between actions (s)")
+    parser.add_argument("--ai-ms", type=float, default=150.0, help="median fake Bedrock latency (ms)")
+    parser.add_argument("--max-threads", type=int, default=512, help="handler threads")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(SRC_DIR))
+    fake = FakeBedrock(args.ai_ms, seed=args.seed)
+    bedrock._client = fake
+
+    # the bots keep their own trackers instead of the game's global ones
+    event_bus.unsubscribe(action_tracker.record)
+    event_bus.subscribe(_route)
+
+    print(f"{'bots':>7}{'actions/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'heap KB/s':>11}{'rss KB/s':>10}   (think {args.think}s, fake AI {args.ai_ms} ms)")
+    for n_bots in args.bots or [100, 1000]:
+        r = asyncio.run(run_level(n_bots, args.duration, args.think, args.max_threads, args.seed))
+        print(f"{r['bots']:>7,}{r['actions_per_s']:>12,.1f}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+              f"{r['p99_ms']:>10.1f}{r['heap_kb']:>11.1f}{r['rss_kb']:>10.1f}")
+    print(f"Fake Bedrock calls: {fake.calls:,}")
+
+
+if __name__ == "__main__":
+    main()
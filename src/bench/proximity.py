@@ -0,0 +1,105 @@
+"""
+Proximity Benchmark - Linear distance scans vs the spatial hash
+
+Scatters --entities NPC-sized (150x150) rects over the café world
+(WORLD_WIDTH x WORLD_HEIGHT) and times, per frame:
+    radius   everything within 150 px of the player (UI.check_proximity):
+             the old sqrt-per-entity scan vs SpatialHash.query_radius
+    point    everything under the mouse: rect.collidepoint over all
+             entities vs SpatialHash.query_point
+    move     re-filing --moving entities that moved a few pixels
+and checks that both ways find the same entities.
+
+Run from the repo root:
+    python src/bench/proximity.py
+    python src/bench/proximity.py --entities 1000 --entities 10000 --cell 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import pygame
+
+from settings import WORLD_HEIGHT, WORLD_WIDTH
+from spatial import SpatialHash
+
+RADIUS = 150
+SIZE = 150
+
+
+def linear_radius(rects, x, y):
+    """What check_proximity used to do for every entity"""
+    found = []
+    for i, rect in enumerate(rects):
+        distance = ((rect.centerx - x) ** 2 + (rect.centery - y) ** 2) ** 0.5
+        if distance <= RADIUS:
+            found.append(i)
+    return found
+
+
+def linear_point(rects, x, y):
+    return [i for i, rect in enumerate(rects) if rect.collidepoint(x, y)]
+
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    results = [fn(x, y) for x, y in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def run(n, cell, moving, queries, rng):
+    rects = [pygame.Rect(rng.randrange(WORLD_WIDTH - SIZE), rng.randrange(WORLD_HEIGHT - SIZE), SIZE, SIZE)
+             for _ in range(n)]
+    grid = SpatialHash(cell_size=cell)
+    start = time.perf_counter()
+    for i, rect in enumerate(rects):
+        grid.insert(i, rect)
+    build = time.perf_counter() - start
+    points = [(rng.randrange(WORLD_WIDTH), rng.randrange(WORLD_HEIGHT)) for _ in range(queries)]
+
+    lin_r, expected_r = timed(lambda x, y: linear_radius(rects, x, y), points)
+    grid_r, got_r = timed(lambda x, y: grid.query_radius(x, y, RADIUS), points)
+    lin_p, expected_p = timed(lambda x, y: linear_point(rects, x, y), points)
+    grid_p, got_p = timed(grid.query_point, points)
+    same = (all(sorted(e) == sorted(i for i, _ in g) for e, g in zip(expected_r, got_r))
+            and all(sorted(e) == sorted(g) for e, g in zip(expected_p, got_p)))
+
+    movers = rng.sample(range(n), min(moving, n))
+    start = time.perf_counter()
+    for i in movers:
+        rects[i].move_ip(rng.randint(-4, 4), rng.randint(-4, 4))
+        grid.move(i, rects[i])
+    move = time.perf_counter() - start
+
+    print(f"{n:>8,}{1e6 * lin_r:>12.1f}{1e6 * grid_r:>10.1f}{1e6 * lin_p:>12.1f}{1e6 * grid_p:>10.1f}"
+          f"{1e6 * move:>11.1f}{1e3 * build:>10.2f}  {'ok' if same else 'MISMATCH'}")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entities", type=int, action="append", help="entity counts (default 10, 1000, 10000)")
+    parser.add_argument("--cell", type=int, default=200, help="grid cell size in px")
+    parser.add_argument("--moving", type=int, default=100, help="entities moved per frame")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"===== {WORLD_WIDTH}x{WORLD_HEIGHT} world, radius {RADIUS}, cell {args.cell} (µs per query) =====")
+    print(f"{'entities':>8}{'scan r':>12}{'grid r':>10}{'scan pt':>12}{'grid pt':>10}"
+          f"{'move':>11}{'build ms':>10}")
+    ok = all([run(n, args.cell, args.moving, args.queries, rng) for n in args.entities or [10, 1000, 10000]])
+    if not ok:
+        print("Grid queries disagree with the linear scans")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Startup Benchmark - Time-to-first-frame for every entry point
+
+Launches each game headless (SDL dummy driver) in a fresh interpreter and
+records, up to the first display.flip():
+    interpreter_ms   process spawn → first line of Python
+    import_ms        importing pygame + executing the entry module
+    font_ms          time inside pygame.font.SysFont / Font
+    asset_ms         time inside image.load, transform.(smooth)scale, load_emoji
+    first_frame_ms   process spawn → first flip
+Each entry point is run --runs times and the median is reported.
+
+Run from the repo root:
+    python src/bench/startup.py                         # writes startup_report.json
+    python src/bench/startup.py --save-baseline src/bench/startup_baseline.json
+    python src/bench/startup.py --baseline src/bench/startup_baseline.json
+
+With --baseline the exit code is 1 when any metric regressed by more than
+--tolerance (relative) and --min-ms (absolute).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(SRC_DIR)
+
+ENTRY_POINTS = [
+    "src/main.py",
+    "src/credit.py",
+    "src/loans_main.py",
+    "src/CredCity/credcity.py",
+    "src/whack/main.py",
+]
+
+METRICS = ("interpreter_ms", "import_ms", "font_ms", "asset_ms", "first_frame_ms")
+
+MARKER = "STARTUP_JSON "
+
+
+# ============ CHILD: runs inside the launched interpreter ============
+
+def _child(script):
+    """Import and run `script` like `python script` would, timing each phase"""
+    spawn_wall = float(os.environ.get("CREDITWISE_SPAWN_WALL", time.time()))
+    t0 = time.perf_counter()
+    interpreter_ms = (time.time() - spawn_wall) * 1000
+
+    import importlib.abc
+    import importlib.util
+    import runpy
+
+    totals = {"font": 0.0, "asset": 0.0}
+    depth = {"font": 0, "asset": 0}
+    result = {}
+
+    def timed(category, fn):
+        # only the outermost call counts (load_emoji calls image.load, SysFont calls Font)
+        def wrapper(*args, **kwargs):
+            depth[category] += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                depth[category] -= 1
+                if depth[category] == 0:
+                    totals[category] += time.perf_counter() - start
+        return wrapper
+
+    class PatchOnImport(importlib.abc.MetaPathFinder):
+        """Wrap a function of a module the moment the game imports it"""
+        def __init__(self, name, patch):
+            self.name, self.patch = name, patch
+
+        def find_spec(self, fullname, path, target=None):
+            if fullname != self.name:
+                return None
+            sys.meta_path.remove(self)
+            spec = importlib.util.find_spec(fullname)
+            if spec is None or spec.loader is None:
+                return spec
+            exec_module = spec.loader.exec_module
+
+            def exec_and_patch(module):
+                exec_module(module)
+                self.patch(module)
+            spec.loader.exec_module = exec_and_patch
+            return spec
+
+    def patch_emojis(module):
+        module.load_emoji = timed("asset", module.load_emoji)
+    sys.meta_path.insert(0, PatchOnImport("pygame_emojis", patch_emojis))
+
+    import pygame
+    pygame.font.SysFont = timed("font", pygame.font.SysFont)
+    pygame.font.Font = timed("font", pygame.font.Font)
+    pygame.image.load = timed("asset", pygame.image.load)
+    pygame.transform.scale = timed("asset", pygame.transform.scale)
+    pygame.transform.smoothscale = timed("asset", pygame.transform.smoothscale)
+
+    flip = pygame.display.flip
+
+    def first_flip():
+        flip()
+        if "first_frame_ms" not in result:
+            result["first_frame_ms"] = interpreter_ms + (time.perf_counter() - t0) * 1000
+    pygame.display.flip = first_flip
+
+    # Same sys.path / cwd layout as `python <script>` from the repo root
+    script_path = os.path.abspath(script)
+    sys.path.insert(0, os.path.dirname(script_path))
+    sys.argv = [script_path]
+
+    namespace = runpy.run_path(script_path, run_name="__startup__")
+    result["import_ms"] = (time.perf_counter() - t0) * 1000
+
+    entry = namespace.get("run") or namespace.get("main")
+    try:
+        entry()
+    except SystemExit:
+        pass
+
+    result["interpreter_ms"] = interpreter_ms
+    result["font_ms"] = totals["font"] * 1000
+    result["asset_ms"] = totals["asset"] * 1000
+    print(MARKER + json.dumps(result), flush=True)
+
+
+# ============ PARENT: launches the children and compares ============
+
+def measure(script, runs):
+    """Run one entry point `runs` times; return median metrics (or an error)"""
+    samples = []
+    for _ in range(runs):
+        env = dict(os.environ)
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+        env["CREDITWISE_EXIT_AFTER_FIRST_FRAME"] = "1"
+        env["CREDITWISE_SPAWN_WALL"] = repr(time.time())
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", script],
+            cwd=REPO_DIR, env=env, capture_output=True, text=True
+        )
+        lines = [l for l in proc.stdout.splitlines() if l.startswith(MARKER)]
+        if not lines or "first_frame_ms" not in lines[-1]:
+            err = proc.stderr.strip().splitlines()
+            return {"error": err[-1] if err else f"exit code {proc.returncode}"}
+        samples.append(json.loads(lines[-1][len(MARKER):]))
+    return {m: round(statistics.median(s[m] for s in samples), 2) for m in METRICS}
+
+
+def compare(report, baseline, tolerance, min_ms):
+    """Return a list of regression messages (empty when everything is within budget)"""
+    regressions = []
+    for script, old in baseline.get("entries", {}).items():
+        new = report["entries"].get(script)
+        if not new or "error" in new or "error" in old:
+            continue
+        for m in METRICS:
+            if m not in old:
+                continue
+            delta = new[m] - old[m]
+            if delta > min_ms and new[m] > old[m] * (1 + tolerance):
+                regressions.append(f"{script}: {m} {old[m]:.1f} → {new[m]:.1f} ms (+{delta:.1f})")
+    return regressions
+
+
+def print_table(report):
+    print(f"{'entry point':28}" + "".join(f"{m[:-3]:>14}" for m in METRICS))
+    for script, row in report["entries"].items():
+        if "error" in row:
+            print(f"{script:28}  FAILED: {row['error']}")
+        else:
+            print(f"{script:28}" + "".join(f"{row[m]:>14.1f}" for m in METRICS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--runs", type=int, default=3, help="runs per entry point (median)")
+    parser.add_argument("--only", action="append", help="entry point(s) to run")
+    parser.add_argument("--out", default="startup_report.json", help="JSON report path")
+    parser.add_argument("--baseline", help="compare against this report")
+    parser.add_argument("--save-baseline", help="also write the report here")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="allowed relative slowdown")
+    parser.add_argument("--min-ms", type=float, default=10.0, help="ignore slowdowns below this")
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+        return
+
+    import pygame
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "entries": {},
+    }
+    for script in args.only or ENTRY_POINTS:
+        report["entries"][script] = measure(script, args.runs)
+
+    print_table(report)
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.min_ms)
+        if regressions:
+            print("Startup regressions:")
+            for r in regressions:
+                print("  " + r)
+            sys.exit(1)
+        print("No startup regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+ActionTracker Benchmark - Logging and query cost for long sessions
+
+Logs --actions realistic actions (same detail shapes as functions.py) into a
+fresh ActionTracker, then times the queries the game makes: the summary for
+"Check Account", lender history and the formatted history for AI prompts.
+The full-rescan summary is timed alongside for comparison, and the
+incremental aggregates are checked against it (exit 1 on mismatch).
+
+--memory also measures bytes per action (tracemalloc) for the tracker's
+own storage, next to the old layout of one dict + strftime string per
+action. The details dicts belong to the callers and are not counted.
+
+--log PATH streams the same actions to a JSON-lines action log (action_log.py)
+and times logging with the sink attached and rebuilding a tracker from it.
+
+The same actions are also published through an EventBus with the game's
+subscriber (the tracker) to time the publish path.
+
+--window N bounds the in-memory history to the last N actions (max_actions),
+like settings.ACTION_HISTORY_LIMIT does for the game.
+
+Run from the repo root:
+    python src/bench/tracker.py
+    python src/bench/tracker.py --actions 1000000
+    python src/bench/tracker.py --memory
+    python src/bench/tracker.py --memory --window 5000
+    python src/bench/tracker.py --log /tmp/actions.jsonl
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import action_log
+from action_tracker import ActionTracker
+from events import EventBus
+
+LENDERS = ["Banker Bard", "Poultry Guy Pip", "Farmer Finn", "Witch of Woe"]
+
+
+def random_action(rng):
+    """Return (action_type, details) shaped like the ones functions.py logs"""
+    roll = rng.random()
+    lender = rng.choice(LENDERS)
+    if roll < 0.45:
+        amount = rng.randint(10, 50)
+        return "sale", {"amount": amount, "stock_used": 20,
+                        "remaining_money": rng.randint(0, 600), "remaining_stock": rng.randint(0, 100)}
+    if roll < 0.65:
+        amount = rng.choice([20, 50, 100])
+        rate = {"Banker Bard": 0.05, "Poultry Guy Pip": 0.10,
+                "Farmer Finn": 0.08, "Witch of Woe": 0.25}[lender]
+        return "loan", {"lender": lender, "amount": amount, "interest_rate": rate,
+                        "amount_owed": round(amount * (1 + rate), 2),
+                        "remaining_money": rng.randint(0, 600), "total_debt": rng.randint(0, 500)}
+    if roll < 0.80:
+        return "repayment", {"lender": lender, "amount": rng.randint(10, 120),
+                             "remaining_money": rng.randint(0, 600), "total_debt": rng.randint(0, 500)}
+    if roll < 0.95:
+        return "purchase", {"item": "stock", "amount": 20, "cost": 20,
+                            "remaining_stock": rng.randint(0, 100), "remaining_money": rng.randint(0, 600)}
+    return "loan_rejected", {"lender": "Banker Bard", "reason": "Too much outstanding debt"}
+
+
+def timed(fn, repeat):
+    """Average seconds per call over `repeat` calls"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def legacy_entry(action_type, details):
+    """One action as the tracker used to store it (dict + preformatted datetime)"""
+    return {
+        "timestamp": time.time(),
+        "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "action_type": action_type,
+        "details": details
+    }
+
+
+def measure_memory(events, window=None):
+    """Bytes per action for the legacy list of dicts and for ActionTracker"""
+    results = {}
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    legacy = [legacy_entry(action_type, details) for action_type, details in events]
+    results["list of dicts (old)"] = (tracemalloc.get_traced_memory()[0] - base) / len(events)
+    del legacy
+
+    base = tracemalloc.get_traced_memory()[0]
+    tracker = ActionTracker(max_actions=window)
+    for action_type, details in events:
+        tracker.log_action(action_type, details)
+    results["ActionTracker"] = (tracemalloc.get_traced_memory()[0] - base) / len(events)
+    tracemalloc.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--actions", type=int, default=100_000, help="actions to log")
+    parser.add_argument("--repeat", type=int, default=200, help="calls per timed query")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--memory", action="store_true", help="measure bytes per action")
+    parser.add_argument("--log", help="also stream to this JSON-lines file and reload it")
+    parser.add_argument("--window", type=int, help="keep only this many recent actions in memory")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    events = [random_action(rng) for _ in range(args.actions)]
+    tracker = ActionTracker(max_actions=args.window)
+
+    start = time.perf_counter()
+    for action_type, details in events:
+        tracker.log_action(action_type, details)
+    log_s = time.perf_counter() - start
+
+    window = f", window {args.window:,}" if args.window else ""
+    print(f"===== ActionTracker, {args.actions:,} actions{window} =====")
+    print(f"log_action              {1e6 * log_s / args.actions:10.2f} µs/action  "
+          f"({args.actions / log_s:,.0f} actions/s)")
+
+    bus = EventBus()
+    bus.subscribe(ActionTracker(max_actions=args.window).record)
+    start = time.perf_counter()
+    for action_type, details in events:
+        bus.publish(action_type, details)
+    publish_s = time.perf_counter() - start
+    print(f"event_bus.publish       {1e6 * publish_s / args.actions:10.2f} µs/action  "
+          f"(tracker subscriber)")
+
+    scan_repeat = max(1, min(args.repeat, 2_000_000 // max(1, args.actions)))
+    rows = [
+        ("get_action_summary", lambda: tracker.get_action_summary(), args.repeat),
+        ("scan_summary (rescan)", lambda: tracker.scan_summary(), scan_repeat),
+        ("get_lender_history", lambda: tracker.get_lender_history("Witch of Woe"), args.repeat),
+        ("get_recent_actions", lambda: tracker.get_recent_actions(10), args.repeat),
+        ("get_actions_since", lambda: tracker.get_actions_since(0.01), args.repeat),
+        ("get_formatted_history", lambda: tracker.get_formatted_history(10), args.repeat),
+    ]
+    for label, fn, repeat in rows:
+        print(f"{label:22}  {1e6 * timed(fn, repeat):10.2f} µs/call")
+
+    if args.memory:
+        print(f"===== Memory, {args.actions:,} actions (details dicts excluded) =====")
+        for label, per_action in measure_memory(events, args.window).items():
+            print(f"{label:22}  {per_action:10.1f} bytes/action  "
+                  f"({per_action * args.actions / 2**20:,.1f} MiB total)")
+
+    if args.log:
+        for path in action_log.segment_paths(args.log):
+            os.remove(path)
+        logged = ActionTracker(max_actions=args.window)
+        writer = action_log.attach(logged, args.log)
+        start = time.perf_counter()
+        for action_type, details in events:
+            logged.log_action(action_type, details)
+        writer.close()
+        sink_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded = action_log.load_tracker(args.log, ActionTracker(max_actions=args.window))
+        load_s = time.perf_counter() - start
+        size = sum(os.path.getsize(p) for p in action_log.segment_paths(args.log))
+
+        print(f"===== Action log, {args.log} ({size / 2**20:,.1f} MiB) =====")
+        print(f"log_action + sink       {1e6 * sink_s / args.actions:10.2f} µs/action")
+        print(f"load_tracker            {1e3 * load_s:10.1f} ms  ({args.actions / load_s:,.0f} actions/s)")
+        if reloaded.get_action_summary() != logged.get_action_summary():
+            print("Reloaded tracker does not match the logged one")
+            sys.exit(1)
+
+    problems = tracker.check_consistency()
+    if problems:
+        print("Consistency check FAILED:")
+        for p in problems:
+            print("  " + p)
+        sys.exit(1)
+    print("Consistency check: incremental aggregates match a full rescan")
+
+
+if __name__ == "__main__":
+    main()
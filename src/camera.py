@@ -0,0 +1,92 @@
+"""
+Camera - Scrolling view over a world larger than the screen
+
+Camera follows a rect and clamps to the world, and CameraGroup draws the
+sprites of a scrolling world through it:
+
+    culling   only sprites whose rect overlaps the camera view are drawn;
+              the overlap test is one Rect.collidelistall() call in C
+    batching  the visible sprites go to the screen in a single
+              Surface.blits() call, in layer order (LayeredUpdates layers)
+    smoothing the camera and the sprites passed to remember() are drawn
+              between their last two fixed-step positions (SceneManager.alpha)
+
+pygame's LayeredDirty only pays off when most of the screen stays still;
+with a camera that scrolls every sprite moves on screen whenever the player
+walks, so the group redraws the visible ones each frame instead.
+"""
+from bisect import bisect_left
+
+import pygame
+
+
+class Camera:
+    def __init__(self, view_size, world_size):
+        self.view_size = view_size
+        self.world_size = world_size
+        self.x = 0
+        self.y = 0
+        self.prev_x = 0   # position before the last follow(), for interpolation
+        self.prev_y = 0
+
+    @property
+    def view(self):
+        """The part of the world on screen, in world coordinates"""
+        return pygame.Rect(self.x, self.y, *self.view_size)
+
+    def follow(self, rect):
+        """Center on `rect`, without showing anything outside the world"""
+        view_w, view_h = self.view_size
+        world_w, world_h = self.world_size
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x = max(0, min(rect.centerx - view_w // 2, world_w - view_w))
+        self.y = max(0, min(rect.centery - view_h // 2, world_h - view_h))
+
+    def snap(self, rect):
+        """follow(rect) with nothing to interpolate from (first frame, teleports)"""
+        self.follow(rect)
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def offset(self, alpha=1.0):
+        """World -> screen offset `alpha` of the way from the previous position to the current one"""
+        return (round(self.prev_x + (self.x - self.prev_x) * alpha),
+                round(self.prev_y + (self.y - self.prev_y) * alpha))
+
+    def to_screen(self, rect):
+        return rect.move(-self.x, -self.y)
+
+    def visible(self, rect):
+        return self.view.colliderect(rect)
+
+
+class CameraGroup(pygame.sprite.LayeredUpdates):
+    """Layered sprite group drawn through a Camera (culled, one blits() call)"""
+
+    def __init__(self, *sprites, **kwargs):
+        super().__init__(*sprites, **kwargs)
+        self.drawn = 0       # sprites drawn by the last draw()
+        self.previous = {}   # sprite -> rect.topleft before its last move (remember())
+
+    def remember(self, *sprites):
+        """Call before moving `sprites` in an update, so draw() can interpolate them"""
+        for sprite in sprites:
+            self.previous[sprite] = sprite.rect.topleft
+
+    def remove_internal(self, sprite):
+        self.previous.pop(sprite, None)
+        super().remove_internal(sprite)
+
+    def draw(self, surface, camera, alpha=1.0):
+        sprites = self.sprites()
+        view = camera.view
+        ox, oy = camera.offset(alpha)
+        visible = view.collidelistall([sprite.rect for sprite in sprites])
+        self.drawn = len(visible)
+        blits = [(sprites[i].image, sprites[i].rect.move(-ox, -oy)) for i in visible]
+        if alpha < 1:
+            for sprite, (px, py) in self.previous.items():
+                n = bisect_left(visible, sprites.index(sprite))
+                if n < len(visible) and sprites[visible[n]] is sprite:
+                    x, y = sprite.rect.topleft
+                    blits[n] = (sprite.image, (round(px + (x - px) * alpha) - ox, round(py + (y - py) * alpha) - oy))
+        surface.blits(blits, doreturn=False)
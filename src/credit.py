@@ -3,23 +3,10 @@ import sys
 import random
 import os
 
-pygame.init()
+from scene import Scene, SceneManager, assets
 
-# Get screen info and set responsive dimensions
-info = pygame.display.Info()
-SCREEN_WIDTH = info.current_w
-SCREEN_HEIGHT = info.current_h
-
-# Use a reasonable default size but allow for different screen sizes
-WIDTH = min(1200, SCREEN_WIDTH - 100)  # Max 1200px wide, leave some margin
-HEIGHT = min(800, SCREEN_HEIGHT - 100)  # Max 800px tall, leave some margin
-
-# If screen is too small, use minimum viable size
-WIDTH = max(800, WIDTH)
-HEIGHT = max(600, HEIGHT)
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("Grocery Budget Adventure")
+# Window size; init() fits it to the desktop
+WIDTH, HEIGHT = 1200, 800
 
 # Colors - Grocery Store Theme
 DARK_OVERLAY = (0, 0, 0, 180)
@@ -61,8 +48,32 @@ def refresh_fonts():
     POPUP_FONT = pygame.font.SysFont("arial", scale_font_size(24))
     SMALL_FONT = pygame.font.SysFont("arial", scale_font_size(20))
 
-# Initialize responsive fonts
-refresh_fonts()
+TITLE_FONT = FONT = POPUP_FONT = SMALL_FONT = None
+
+_initialized = False
+
+def init():
+    """Initialise pygame, size the window to the desktop and create the fonts (safe to call more than once)"""
+    global WIDTH, HEIGHT, _initialized
+    if _initialized:
+        return
+    pygame.init()
+
+    # Get screen info and set responsive dimensions
+    # (desktop size, not the current window, so it is right when hosted by the launcher)
+    screen_width, screen_height = pygame.display.get_desktop_sizes()[0]
+
+    # Use a reasonable default size but allow for different screen sizes
+    WIDTH = min(1200, screen_width - 100)  # Max 1200px wide, leave some margin
+    HEIGHT = min(800, screen_height - 100)  # Max 800px tall, leave some margin
+
+    # If screen is too small, use minimum viable size
+    WIDTH = max(800, WIDTH)
+    HEIGHT = max(600, HEIGHT)
+
+    # Initialize responsive fonts
+    refresh_fonts()
+    _initialized = True
 
 # Game States
 MAIN_MENU = "main_menu"
@@ -84,10 +95,8 @@ completed_levels = set()
 # Load background image
 def load_background():
     try:
-        background = pygame.image.load("./src/assets/background.webp")
-        # Scale background to fit screen
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-        return background
+        # Scaled copy is cached per window size, so this is only decoded once
+        return assets.image("./src/assets/background.webp", (WIDTH, HEIGHT))
     except:
         # Fallback to solid color if image not found
         surf = pygame.Surface((WIDTH, HEIGHT))
@@ -659,6 +668,15 @@ level5_game = Level5Game()
 level6_game = Level6Game()
 popup_manager = PopupManager()
 
+def reset():
+    """Back to the main menu at level 1 (the module state outlives a GroceryScene)"""
+    global current_game_state, current_level, total_points, popup_manager
+    current_game_state = MAIN_MENU
+    current_level = 1
+    total_points = 0
+    completed_levels.clear()
+    popup_manager = PopupManager()
+
 # EDUCATIONAL CONTENT FOR EACH LEVEL
 level_popups = {
     1: [
@@ -720,44 +738,42 @@ level_popups = {
     ]
 }
 
-# Main game loop
-clock = pygame.time.Clock()
-running = True
-
-while running:
-    buttons = []
-    
-    # Draw current game state
-    if current_game_state == MAIN_MENU:
-        buttons = draw_main_menu(screen)
-    elif current_game_state == LEVEL_1_GAME:
-        buttons = draw_level1_game(screen)
-    elif current_game_state == LEVEL_2_GAME:
-        buttons = draw_level2_game(screen)
-    elif current_game_state == LEVEL_3_GAME:
-        buttons = draw_level3_game(screen)
-    else:
-        draw_background(screen)
-    
-    # Draw active popup
-    popup_buttons = []
-    if popup_manager.active_popup:
-        popup_buttons = popup_manager.draw_popup(screen)
-    
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.VIDEORESIZE:
+class GroceryScene(Scene):
+    """Grocery Budget Adventure hosted by the SceneManager"""
+    flags = pygame.RESIZABLE
+    caption = "Grocery Budget Adventure"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        init()
+        self.size = (WIDTH, HEIGHT)
+        self.buttons = []
+        self.popup_buttons = []
+        self.started = False
+
+    def enter(self):
+        if self.started:
+            return  # resumed, keep the player's progress
+        self.started = True
+        reset()
+
+    def handle(self, event):
+        global WIDTH, HEIGHT, current_game_state
+
+        if event.type == pygame.VIDEORESIZE:
             # Handle window resize
             WIDTH, HEIGHT = event.w, event.h
-            screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+            self.size = (WIDTH, HEIGHT)
+            self.manager.set_mode(self.size, self.flags)
             # Refresh fonts with new scale factor
             refresh_fonts()
-            
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if popup_manager.active_popup and popup_buttons:
-                for btn_rect, action in popup_buttons:
+            if popup_manager.active_popup and self.popup_buttons:
+                for btn_rect, action in self.popup_buttons:
                     if btn_rect.collidepoint(event.pos):
                         if action == "next":
                             popup_manager.show_next_popup()
@@ -791,16 +807,16 @@ while running:
                         elif action == "back_to_menu":
                             popup_manager.active_popup = None
                             current_game_state = MAIN_MENU
-                            
+
             else:
-                for btn_rect, action in buttons:
+                for btn_rect, action in self.buttons:
                     if btn_rect.collidepoint(event.pos):
                         if current_game_state == MAIN_MENU and action.startswith("level_"):
                             level = int(action.split("_")[1])
                             if level_popups.get(level):
                                 popup_manager.set_popups(level_popups[level])
                                 popup_manager.show_next_popup()
-                                
+
                         elif current_game_state == LEVEL_1_GAME:
                             if action.startswith("alloc_"):
                                 parts = action.split("_")
@@ -816,7 +832,7 @@ while running:
                                     "content": f"Budget Planning Score: {score}/100 You earned 100 points! Moving to Smart Shopping!",
                                     "choices": [{"text": "Continue", "action": "back_to_menu", "primary": True}]
                                 }
-                                
+
                         elif current_game_state == LEVEL_2_GAME:
                             if action.startswith("add_"):
                                 item_index = int(action.split("_")[1])
@@ -829,7 +845,7 @@ while running:
                                     "content": f"Shopping Score: {score:.0f}/100 You earned 100 points! Moving to Needs vs Wants!",
                                     "choices": [{"text": "Continue", "action": "back_to_menu", "primary": True}]
                                 }
-                                
+
                         elif current_game_state == LEVEL_3_GAME:
                             if action in ["choice_need", "choice_want"]:
                                 choice = "need" if action == "choice_need" else "want"
@@ -842,9 +858,34 @@ while running:
                                     "content": f"Needs vs Wants Score: {score:.0f}% You earned 100 points! Moving to next level!",
                                     "choices": [{"text": "Continue", "action": "back_to_menu", "primary": True}]
                                 }
-    
-    pygame.display.flip()
-    clock.tick(60)
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+    def draw(self, screen):
+        # Draw current game state
+        if current_game_state == MAIN_MENU:
+            self.buttons = draw_main_menu(screen)
+        elif current_game_state == LEVEL_1_GAME:
+            self.buttons = draw_level1_game(screen)
+        elif current_game_state == LEVEL_2_GAME:
+            self.buttons = draw_level2_game(screen)
+        elif current_game_state == LEVEL_3_GAME:
+            self.buttons = draw_level3_game(screen)
+        else:
+            self.buttons = []
+            draw_background(screen)
+
+        # Draw active popup
+        self.popup_buttons = []
+        if popup_manager.active_popup:
+            self.popup_buttons = popup_manager.draw_popup(screen)
+
+
+def run():
+    init()
+    manager = SceneManager((WIDTH, HEIGHT), "Grocery Budget Adventure")
+    manager.push(GroceryScene(manager))
+    manager.run()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    run()
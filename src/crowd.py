@@ -0,0 +1,151 @@
+"""
+Customer Crowd - Hundreds of walking café customers, updated in bulk
+
+Every customer is a row in a few NumPy arrays (position, velocity, state,
+timer), so one frame is a handful of array operations whatever the crowd
+size, instead of a Python call per sprite like NPC.random_move:
+
+    WANDER    walk around the world, turning at random and bouncing off
+              its edges; each second a customer heads for the café with
+              probability visits_per_minute / 60 / size, scaled by the
+              shop's customer_satisfaction
+    TO_CAFE   walk straight to the café door
+    INSIDE    (not drawn) buys one item through CoffeeShop.sell_item on
+              arrival, stays a few seconds, then wanders off again
+
+Only the customers arriving this frame are handled one by one (the sales).
+With a `bus`, each purchase is published as a "sale" action like the ones
+functions.py logs, so the tracker, the action log and snapshots count it.
+"""
+import numpy as np
+import pygame
+
+WANDER, TO_CAFE, INSIDE = 0, 1, 2
+
+COLORS = {WANDER: (230, 200, 150), TO_CAFE: (255, 223, 0)}
+
+
+class Crowd:
+    def __init__(self, size, world_size, door, speed=(30, 60), visits_per_minute=6,
+                 stay=(2, 6), arrive_radius=20, seed=None, bus=None):
+        """
+        Args:
+            size: Number of customers
+            world_size: (width, height) they walk around in
+            door: (x, y) customers walk to when they visit the café
+            speed: (min, max) walking speed in px per second
+            visits_per_minute: Café visits per minute by the whole crowd at
+                full customer satisfaction
+            stay: (min, max) seconds spent inside
+            bus: events.EventBus the purchases are published on (None = not tracked)
+        """
+        self.size = size
+        self.world = np.array(world_size, dtype=np.float32)
+        self.door = np.array(door, dtype=np.float32)
+        self.visits_per_minute = visits_per_minute
+        self.stay = stay
+        self.arrive_sq = arrive_radius * arrive_radius
+        self.rng = np.random.default_rng(seed)
+        self.bus = bus
+
+        rng = self.rng
+        self.pos = rng.random((size, 2), dtype=np.float32) * self.world
+        self.speed = rng.uniform(speed[0], speed[1], size).astype(np.float32)
+        self.vel = self._headings(size) * self.speed[:, None]
+        self.state = np.full(size, WANDER, dtype=np.uint8)
+        self.timer = rng.uniform(1, 4, size).astype(np.float32)   # seconds until the next turn / exit
+
+        self.sales = 0
+        self.revenue = 0
+        self.dots = {state: self._dot(color) for state, color in COLORS.items()}
+
+    def _headings(self, n):
+        angle = self.rng.uniform(0, 2 * np.pi, n).astype(np.float32)
+        return np.stack([np.cos(angle), np.sin(angle)], axis=1)
+
+    @staticmethod
+    def _dot(color, radius=5):
+        dot = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(dot, color, (radius, radius), radius)
+        pygame.draw.circle(dot, (40, 30, 20), (radius, radius), radius, 1)
+        return dot
+
+    def update(self, dt, coffee_shop=None, player=None):
+        """Advance the crowd by `dt` seconds; arrivals buy from `coffee_shop` for `player`"""
+        state, timer, rng = self.state, self.timer, self.rng
+        timer -= dt
+
+        # wanderers: some turn, a few decide to visit the café
+        wander = state == WANDER
+        turning = np.flatnonzero(wander & (timer <= 0))
+        if turning.size:
+            self.vel[turning] = self._headings(turning.size) * self.speed[turning, None]
+            timer[turning] = rng.uniform(1, 4, turning.size)
+
+        satisfaction = coffee_shop.customer_satisfaction / 100 if coffee_shop is not None else 1.0
+        chance = self.visits_per_minute / 60 / max(1, self.size) * satisfaction * dt
+        visiting = np.flatnonzero(wander & (rng.random(self.size, dtype=np.float32) < chance))
+        if visiting.size:
+            state[visiting] = TO_CAFE
+
+        # walkers head for the door
+        walking = np.flatnonzero(state == TO_CAFE)
+        if walking.size:
+            offset = self.door - self.pos[walking]
+            dist_sq = np.einsum("ij,ij->i", offset, offset)
+            arrived = dist_sq <= self.arrive_sq
+            self.vel[walking] = offset / np.sqrt(np.maximum(dist_sq, 1e-6))[:, None] * self.speed[walking, None]
+            self._arrive(walking[arrived], coffee_shop, player)
+
+        # customers inside leave when their stay is over
+        leaving = np.flatnonzero((state == INSIDE) & (timer <= 0))
+        if leaving.size:
+            state[leaving] = WANDER
+            self.vel[leaving] = self._headings(leaving.size) * self.speed[leaving, None]
+            timer[leaving] = rng.uniform(1, 4, leaving.size)
+
+        # move everyone outside, bouncing off the world edges
+        moving = state != INSIDE
+        self.pos[moving] += self.vel[moving] * dt
+        low, high = self.pos < 0, self.pos > self.world
+        if low.any() or high.any():
+            np.clip(self.pos, 0, self.world, out=self.pos)
+            self.vel[low | high] *= -1
+
+    def _arrive(self, indices, coffee_shop, player):
+        if not indices.size:
+            return
+        self.state[indices] = INSIDE
+        self.vel[indices] = 0
+        self.timer[indices] = self.rng.uniform(self.stay[0], self.stay[1], indices.size)
+        if coffee_shop is None or player is None:
+            return
+        items = list(coffee_shop.inventory)
+        for choice in self.rng.integers(len(items), size=indices.size):
+            money = player.money
+            coffee_shop.sell_item(player, items[choice])
+            self.sales += 1
+            self.revenue += player.money - money
+            if self.bus is not None:
+                self.bus.publish("sale", {
+                    "amount": player.money - money,
+                    "stock_used": 0,
+                    "item": items[choice],
+                    "customer": True,
+                    "remaining_money": player.money,
+                    "remaining_stock": player.stock
+                })
+
+    def draw(self, surface, camera, alpha=1.0):
+        """Blit the customers the camera can see (one blits() call), at the camera's interpolated offset"""
+        x0, y0 = camera.offset(alpha)
+        w, h = camera.view_size
+        pos = self.pos
+        visible = ((self.state != INSIDE) & (pos[:, 0] >= x0 - 5) & (pos[:, 0] < x0 + w + 5)
+                   & (pos[:, 1] >= y0 - 5) & (pos[:, 1] < y0 + h + 5))
+        indices = np.flatnonzero(visible)
+        if not indices.size:
+            return
+        screen_pos = (pos[indices] - (x0 + 5, y0 + 5)).astype(np.int32).tolist()
+        dots = self.dots
+        surface.blits([(dots[s], p) for s, p in zip(self.state[indices].tolist(), screen_pos)], doreturn=False)
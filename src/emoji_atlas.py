@@ -0,0 +1,215 @@
+"""
+Emoji Atlas - Emoji glyphs loaded once, packed into one sheet, cached on disk
+
+pygame_emojis.load_emoji() finds and decodes (or rasterises, for SVG) an
+image file on every call. An EmojiAtlas loads each glyph the first time it
+is asked for, packs it into a sheet of `size` x `size` cells and hands out
+subsurfaces of it. The sheet and its index are written to EMOJI_CACHE_DIR
+at exit (PNG + JSON, replaced atomically), so the next run starts with every
+glyph it has seen before and decodes nothing.
+
+Glyphs pygame_emojis has no file for are remembered as missing (and not
+retried); text renderers then fall back to the font.
+
+render_text() draws a line mixing text and emoji in one pass: the line is
+split into runs (cached per text), text runs go through font.render and
+emoji runs come from the atlas, sized to the font's height.
+"""
+import atexit
+import json
+import os
+from functools import lru_cache
+
+import emoji
+import pygame
+import pygame_emojis
+
+from settings import EMOJI_CACHE_DIR
+
+FORMAT_VERSION = 1
+
+
+class EmojiAtlas:
+    def __init__(self, size, path=None, columns=16):
+        """
+        Args:
+            size: Cell size in px (glyphs are loaded at size x size)
+            path: Cache file prefix (<path>.png + <path>.json), None = memory only
+            columns: Cells per sheet row
+        """
+        self.size = size
+        self.path = path
+        self.columns = columns
+        self.sheet = pygame.Surface((columns * size, size), pygame.SRCALPHA)
+        self.slots = {}       # emoji -> cell index
+        self.glyphs = {}      # emoji -> subsurface of the sheet
+        self.missing = set()
+        self.dirty = False
+        if path:
+            self._load()
+            atexit.register(self.save)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, emoji_):
+        return emoji_ in self.slots
+
+    def _cell(self, index):
+        size = self.size
+        return pygame.Rect((index % self.columns) * size, (index // self.columns) * size, size, size)
+
+    def _load(self):
+        try:
+            with open(f"{self.path}.json") as f:
+                index = json.load(f)
+            if index.get("version") != FORMAT_VERSION or index.get("size") != self.size:
+                return
+            sheet = pygame.image.load(f"{self.path}.png")
+        except (OSError, ValueError, pygame.error):
+            return
+        self.columns = index["columns"]
+        self.sheet = sheet
+        self.slots = {e: i for i, e in enumerate(index["emojis"])}
+
+    def get(self, emoji_):
+        """Surface for one emoji, or None when pygame_emojis has no image for it"""
+        glyph = self.glyphs.get(emoji_)
+        if glyph is not None:
+            return glyph
+        if emoji_ in self.missing:
+            return None
+
+        index = self.slots.get(emoji_)
+        if index is None:
+            try:
+                image = pygame_emojis.load_emoji(emoji_, (self.size, self.size))
+            except Exception as e:
+                print(f"Warning: no image for emoji {emoji_!r}: {e}")
+                self.missing.add(emoji_)
+                return None
+            index = len(self.slots)
+            cell = self._cell(index)
+            if cell.bottom > self.sheet.get_height():
+                self._grow(cell.bottom)
+            self.sheet.fill((0, 0, 0, 0), cell)
+            self.sheet.blit(image, cell)
+            self.slots[emoji_] = index
+            self.dirty = True
+        glyph = self.glyphs[emoji_] = self.sheet.subsurface(self._cell(index))
+        return glyph
+
+    def _grow(self, height):
+        """Double the sheet's height (at least to `height`); glyphs already handed out stay valid"""
+        sheet = pygame.Surface((self.sheet.get_width(), max(height, 2 * self.sheet.get_height())),
+                               pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+        sheet.blit(self.sheet, (0, 0))
+        self.sheet = sheet
+        self.glyphs.clear()
+
+    def save(self):
+        """Write the sheet and its index if glyphs were added"""
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        order = sorted(self.slots, key=self.slots.get)
+        rows = (len(order) + self.columns - 1) // self.columns or 1
+        sheet = self.sheet.subsurface((0, 0, self.sheet.get_width(), rows * self.size))
+        try:
+            pygame.image.save(sheet, f"{self.path}.tmp.png")
+            os.replace(f"{self.path}.tmp.png", f"{self.path}.png")
+            with open(f"{self.path}.json.tmp", "w") as f:
+                json.dump({"version": FORMAT_VERSION, "size": self.size,
+                           "columns": self.columns, "emojis": order}, f, ensure_ascii=False)
+            os.replace(f"{self.path}.json.tmp", f"{self.path}.json")
+        except (OSError, pygame.error) as e:
+            print(f"Warning: could not save the emoji atlas: {e}")
+            return
+        self.dirty = False
+
+
+_atlases = {}
+
+
+def get_atlas(size):
+    """The shared atlas for `size` px glyphs (cached under EMOJI_CACHE_DIR)"""
+    atlas = _atlases.get(size)
+    if atlas is None:
+        path = os.path.join(EMOJI_CACHE_DIR, f"emoji_{size}") if EMOJI_CACHE_DIR else None
+        atlas = _atlases[size] = EmojiAtlas(size, path)
+    return atlas
+
+
+class Icons(dict):
+    """name -> glyph mapping that loads each glyph from the atlas on first use"""
+
+    def __init__(self, atlas, names):
+        super().__init__()
+        self.atlas = atlas
+        self.names = names
+
+    def __missing__(self, name):
+        glyph = self.atlas.get(self.names[name])
+        if glyph is None:
+            glyph = pygame.Surface((self.atlas.size, self.atlas.size), pygame.SRCALPHA)
+        self[name] = glyph
+        return glyph
+
+
+# ============ TEXT WITH EMOJI ============
+
+@lru_cache(maxsize=1024)
+def split_runs(text):
+    """((is_emoji, run), ...) for a line of text"""
+    runs = []
+    pos = 0
+    for match in emoji.emoji_list(text):
+        start, end = match["match_start"], match["match_end"]
+        if start > pos:
+            runs.append((False, text[pos:start]))
+        runs.append((True, match["emoji"]))
+        pos = end
+    if pos < len(text):
+        runs.append((False, text[pos:]))
+    return tuple(runs)
+
+
+def _run_surfaces(font, text, color):
+    atlas = None
+    surfaces = []
+    for is_emoji, run in split_runs(text):
+        glyph = None
+        if is_emoji:
+            atlas = atlas or get_atlas(font.get_height())
+            glyph = atlas.get(run)
+        surfaces.append(glyph if glyph is not None else font.render(run, True, color))
+    return surfaces
+
+
+def text_width(font, text):
+    """Width of render_text(font, text) without rendering the text runs"""
+    runs = split_runs(text)
+    if not any(is_emoji for is_emoji, _ in runs):
+        return font.size(text)[0]
+    height = font.get_height()
+    atlas = get_atlas(height)
+    return sum(height if is_emoji and atlas.get(run) is not None else font.size(run)[0]
+               for is_emoji, run in runs)
+
+
+def render_text(font, text, color):
+    """font.render(text, True, color) with emoji drawn from the atlas"""
+    runs = split_runs(text)
+    if not any(is_emoji for is_emoji, _ in runs):
+        return font.render(text, True, color)
+    surfaces = _run_surfaces(font, text, color)
+    height = max(s.get_height() for s in surfaces)
+    line = pygame.Surface((sum(s.get_width() for s in surfaces), height), pygame.SRCALPHA)
+    x = 0
+    blits = []
+    for surface in surfaces:
+        blits.append((surface, (x, (height - surface.get_height()) // 2)))
+        x += surface.get_width()
+    line.blits(blits, doreturn=False)
+    return line
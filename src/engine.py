@@ -0,0 +1,312 @@
+"""
+Café Engine - The Cosmic Café economy without a window
+
+The rules of the loans game (functions.py menus, Player.update_debts and
+check_game_status) as pure functions over a small immutable state:
+
+    state = new_game(seed=7)
+    state, events = step(state, ("Coffee Shop", "Generate a Sale"))
+    state, events = step(state, ("Witch", "Borrow 50 gold"))
+    state, events = step(state, ACCRUE)        # the 30-second interest tick
+    state, events = step(state, ACCRUE + ({"periods": 10},))   # ten ticks at once
+
+Actions are (menu, option) pairs with the same names the UI menus use. The
+Banker's loan terms come from the AI in the game, so here they are passed
+in: ("Banker", "Accept Loan", {"amount": 100, "interest": 0.05}).
+
+Events are (action_type, details) pairs shaped like the ones functions.py
+publishes, so they can be fed to events.event_bus / an ActionTracker.
+
+The sale roll uses a splitmix64 counter kept in the state, so a game is
+fully determined by its seed and its actions. No pygame or Bedrock imports.
+"""
+from ledger import DebtLedger
+
+# ============ RULES ============
+
+START_MONEY = 200
+START_STOCK = 100
+START_DEBTS = {
+    "Wizard of Woe": 50,
+    "Banker Bard": 20,
+    "Poultry Guy Pip": 10
+}
+
+WIN_MONEY = 500        # with zero debt
+LOSE_DEBT = 500        # total debt above this is a debt spiral
+
+# Applied by every interest tick (Player.update_debts). The keys are the
+# ones the game has always used, so a lender missing here accrues nothing.
+INTEREST_RATES = {
+    "Banker Bard": 0.02,
+    "Poultry Guy": 0.10,
+    "Farmer Finn": 0.08,
+    "Wizard of Woe": 0.25
+}
+
+SALE_STOCK = 20
+SALE_MIN, SALE_MAX = 10, 50
+
+# Fixed-term loans from the NPC menus: (menu, option) -> (lender, amount, rate, kind)
+LOANS = {
+    ("Witch", "Borrow 50 gold"): ("Witch of Woe", 50, 0.25, "gold"),
+    ("Witch", "Borrow 100 gold"): ("Witch of Woe", 100, 0.25, "gold"),
+    ("Poultry", "Borrow 25 stock"): ("Poultry Guy Pip", 25, 0.10, "stock"),
+    ("Poultry", "Borrow 15 stock"): ("Poultry Guy Pip", 15, 0.10, "stock"),
+    ("Farmer", "Borrow 10 stock"): ("Farmer Finn", 10, 0.08, "stock"),
+    ("Farmer", "Borrow 5 stock"): ("Farmer Finn", 5, 0.08, "stock"),
+}
+
+# Stock purchases: (menu, option) -> (stock, price)
+PURCHASES = {
+    ("Poultry", "Buy 10 Stock"): (10, 20),
+    ("Farmer", "Buy 5 Stock"): (5, 10),
+}
+
+# Menu -> lender for "Repay Debt"
+REPAY = {
+    "Banker": "Banker Bard",
+    "Poultry": "Poultry Guy Pip",
+    "Farmer": "Farmer Finn",
+    "Witch": "Witch of Woe",
+}
+
+ACCRUE = ("Time", "Accrue Interest")
+
+# Options that only show information in the game
+NO_OPS = {"Check Account", "View Suggestions", "Back"}
+
+
+def debt_ledger(debts, rounding="final"):
+    """DebtLedger holding `debts` at tick 0, with a clock that counts interest ticks"""
+    return DebtLedger.from_debts(debts, INTEREST_RATES, now=0, interval=1, rounding=rounding)
+
+
+def accrue_interest(debts, periods=1, rounding="final"):
+    """
+    Interest for `periods` ticks at once (closed form, see ledger.py):
+    new debts dict, rounded to cents like the game
+    """
+    return debt_ledger(debts, rounding).balances(now=periods)
+
+
+def game_outcome(money, total_debt):
+    """WIN / LOSE / PLAYING for the given totals (check_game_status rules)"""
+    if money >= WIN_MONEY and total_debt == 0:
+        return "WIN"
+    if total_debt > LOSE_DEBT:
+        return "LOSE"
+    return "PLAYING"
+
+
+# ============ RANDOMNESS ============
+
+_MASK = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """Next (state, random 64-bit value)"""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    z = x
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x, z ^ (z >> 31)
+
+
+# ============ STATE ============
+
+class CafeState:
+    """One game at one point in time (treat as immutable; step() returns a new one)"""
+    __slots__ = ("money", "stock", "debts", "turn", "rng", "outcome")
+
+    def __init__(self, money, stock, debts, turn=0, rng=0, outcome="PLAYING"):
+        self.money = money
+        self.stock = stock
+        self.debts = debts
+        self.turn = turn
+        self.rng = rng
+        self.outcome = outcome
+
+    @property
+    def total_debt(self):
+        return sum(self.debts.values())
+
+    def replace(self, **changes):
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return CafeState(**fields)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return isinstance(other, CafeState) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return (f"CafeState(money={self.money}, stock={self.stock}, debts={self.debts}, "
+                f"turn={self.turn}, outcome={self.outcome!r})")
+
+
+def new_game(seed=0, money=START_MONEY, stock=START_STOCK, debts=None):
+    """Starting state of a game (same numbers as a new Player)"""
+    return CafeState(money, stock, dict(START_DEBTS if debts is None else debts),
+                     rng=seed & _MASK)
+
+
+# ============ STEP ============
+
+def step(state, action):
+    """
+    Apply one action
+
+    Args:
+        state: CafeState
+        action: (menu, option) or (menu, option, params); see the module docstring
+
+    Returns:
+        (new state, list of (action_type, details) events). Once the game is
+        won or lost the state no longer changes.
+
+    Raises ValueError for an action the engine does not know.
+    """
+    if state.outcome != "PLAYING":
+        return state, []
+
+    menu, option = action[0], action[1]
+    key = (menu, option)
+    money, stock, rng = state.money, state.stock, state.rng
+    debts = state.debts
+    events = []
+
+    if key == ("Coffee Shop", "Generate a Sale"):
+        if stock < SALE_STOCK:
+            events.append(("sale_failed", {"reason": "Insufficient stock", "stock": stock}))
+        else:
+            rng, r = _splitmix64(rng)
+            sale = SALE_MIN + r % (SALE_MAX - SALE_MIN + 1)
+            money += sale
+            stock = max(0, stock - SALE_STOCK)
+            events.append(("sale", {
+                "amount": sale,
+                "stock_used": SALE_STOCK,
+                "remaining_money": money,
+                "remaining_stock": stock
+            }))
+
+    elif key in LOANS:
+        lender, amount, rate, kind = LOANS[key]
+        owed = round(amount * (1 + rate), 2)
+        debts = dict(debts)
+        debts[lender] = debts.get(lender, 0) + owed
+        details = {"lender": lender, "amount": amount, "interest_rate": rate, "amount_owed": owed}
+        if kind == "gold":
+            money += amount
+            details["remaining_money"] = money
+        else:
+            stock += amount
+            details["remaining_stock"] = stock
+        details["total_debt"] = sum(debts.values())
+        events.append(("loan", details))
+
+    elif key == ("Banker", "Accept Loan"):
+        params = action[2] if len(action) > 2 else {}
+        amount = params.get("amount", 0)
+        interest = params.get("interest", 0.02)
+        owed = round(amount * (1 + interest), 2)
+        money += amount
+        debts = dict(debts)
+        debts["Banker Bard"] = debts.get("Banker Bard", 0) + owed
+        events.append(("loan", {
+            "lender": "Banker Bard",
+            "amount": amount,
+            "interest_rate": interest,
+            "amount_owed": owed,
+            "remaining_money": money,
+            "total_debt": sum(debts.values())
+        }))
+
+    elif option == "Repay Debt" and menu in REPAY:
+        lender = REPAY[menu]
+        debt = debts.get(lender, 0)
+        if debt > 0 and money >= debt:
+            money -= debt
+            debts = dict(debts)
+            debts[lender] = 0
+            events.append(("repayment", {
+                "lender": lender,
+                "amount": debt,
+                "remaining_money": money,
+                "total_debt": sum(debts.values())
+            }))
+        elif debt > 0:
+            events.append(("repayment_failed", {"lender": lender, "amount": debt, "money": money}))
+
+    elif key in PURCHASES:
+        amount, price = PURCHASES[key]
+        if money >= price:
+            money -= price
+            stock += amount
+            events.append(("purchase", {
+                "item": "stock",
+                "amount": amount,
+                "cost": price,
+                "remaining_stock": stock,
+                "remaining_money": money
+            }))
+        else:
+            events.append(("purchase_failed", {"cost": price, "money": money}))
+
+    elif key == ACCRUE:
+        periods = action[2].get("periods", 1) if len(action) > 2 else 1
+        debts = accrue_interest(debts, periods)
+        events.append(("interest", {"total_debt": sum(debts.values())}))
+
+    elif option not in NO_OPS:
+        raise ValueError(f"unknown action {action!r}")
+
+    total_debt = sum(debts.values())
+    outcome = game_outcome(money, total_debt)
+    if outcome == "WIN":
+        events.append(("game_end", {
+            "result": "WIN",
+            "final_money": money,
+            "final_stock": stock,
+            "final_debt": total_debt
+        }))
+    elif outcome == "LOSE":
+        events.append(("game_end", {
+            "result": "LOSE",
+            "final_money": money,
+            "final_stock": stock,
+            "final_debt": total_debt,
+            "reason": "Debt spiral exceeded 500 gold"
+        }))
+
+    return CafeState(money, stock, debts, state.turn + 1, rng, outcome), events
+
+
+def run(seed, policy, max_turns=1000, ticks_every=None, debts=None):
+    """
+    Play one game to the end (or max_turns)
+
+    Args:
+        seed: Game seed
+        policy: Function (state) -> action
+        max_turns: Stop after this many actions
+        ticks_every: Insert an ACCRUE tick after every N actions (None = never)
+        debts: Starting debts (default START_DEBTS)
+
+    Returns:
+        (final state, number of events)
+    """
+    state = new_game(seed, debts=debts)
+    n_events = 0
+    for turn in range(1, max_turns + 1):
+        state, events = step(state, policy(state))
+        n_events += len(events)
+        if ticks_every and turn % ticks_every == 0 and state.outcome == "PLAYING":
+            state, events = step(state, ACCRUE)
+            n_events += len(events)
+        if state.outcome != "PLAYING":
+            break
+    return state, n_events
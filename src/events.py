@@ -0,0 +1,88 @@
+"""
+Events - One stream for everything the player does
+
+Game code publishes each action once:
+
+    event_bus.publish("sale", {"amount": 30, "stock_used": 20, ...})
+
+and every consumer subscribes to the bus instead of keeping its own copy:
+the ActionTracker (aggregates, queries and the AI prompt history) and,
+when ACTION_LOG_PATH is set, the action log writer (action_log.py).
+Subscribers get the same ActionEvent object, so an action is allocated once
+however many consumers there are.
+"""
+import time
+from datetime import datetime
+
+
+def format_datetime(timestamp):
+    """Same format the tracker always used for the "datetime" field"""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ActionEvent:
+    """One published action (read-only by convention)"""
+    __slots__ = ("action_type", "details", "timestamp")
+
+    def __init__(self, action_type, details, timestamp):
+        self.action_type = action_type
+        self.details = details
+        self.timestamp = timestamp
+
+    @property
+    def datetime(self):
+        return format_datetime(self.timestamp)
+
+    def to_dict(self):
+        """Same shape as the action log lines"""
+        return {"timestamp": self.timestamp, "action_type": self.action_type, "details": self.details}
+
+    def __repr__(self):
+        return f"ActionEvent({self.action_type!r}, {self.details!r}, {self.timestamp!r})"
+
+
+class EventBus:
+    """Synchronous publish / subscribe for ActionEvents"""
+
+    def __init__(self):
+        self._subscribers = []   # (callback, action types or None for all)
+        self._routes = {}        # action type -> callbacks, rebuilt on (un)subscribe
+
+    def subscribe(self, callback, types=None):
+        """
+        Call `callback(event)` for every published event
+
+        Args:
+            callback: Function taking an ActionEvent
+            types: Only these action types (None = all)
+        """
+        self._subscribers.append((callback, frozenset(types) if types else None))
+        self._routes.clear()
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(cb, types) for cb, types in self._subscribers if cb != callback]
+        self._routes.clear()
+
+    def _route(self, action_type):
+        callbacks = tuple(cb for cb, types in self._subscribers if types is None or action_type in types)
+        self._routes[action_type] = callbacks
+        return callbacks
+
+    def publish(self, action_type, details, timestamp=None):
+        """Create the event and hand it to each subscriber in subscription order"""
+        event = ActionEvent(action_type, details, time.time() if timestamp is None else timestamp)
+        callbacks = self._routes.get(action_type)
+        if callbacks is None:
+            callbacks = self._route(action_type)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                # a broken consumer (e.g. a full disk) must not stop the game
+                print(f"Warning: event subscriber {getattr(callback, '__qualname__', callback)} failed: {e}")
+        return event
+
+
+# Global bus shared by the game
+event_bus = EventBus()
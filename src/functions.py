@@ -6,11 +6,24 @@ import random
 from ai.lending_check import lending_decision
 from ai.action_feedback import get_action_feedback, get_financial_suggestions, get_loan_analysis
 from action_tracker import action_tracker
+from engine import game_outcome
+from events import event_bus
 
 class GameState:
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Back to a new game (tutorial not shown, no outcome)"""
         self.tutorial_shown = False
         self.days_passed = 0
+        self.reset_outcome()
+
+    def reset_outcome(self, player=None):
+        """Start a new game outcome: PLAYING until a WIN / LOSE is latched"""
+        self.outcome = "PLAYING"
+        self.outcome_player = player
+        self._status_key = None
 
 game_state = GameState()
 
@@ -32,10 +45,10 @@ def coffee_shop_action(ui, player, action):
         if player.stock >= 20:
             sale = random.randint(10, 50)
             player.money += sale
-            player.spend_stock(20, "Generated a Sale")
+            player.spend_stock(20)
             
             # Log the action
-            action_tracker.log_action("sale", {
+            event_bus.publish("sale", {
                 "amount": sale,
                 "stock_used": 20,
                 "remaining_money": player.money,
@@ -140,7 +153,7 @@ def banker_action(ui, player, action):
             reason = decision.get("reason", "Risk assessment failed.")
             
             # Log the rejected loan attempt
-            action_tracker.log_action("loan_rejected", {
+            event_bus.publish("loan_rejected", {
                 "lender": "Banker Bard",
                 "reason": reason
             })
@@ -210,7 +223,7 @@ ANALYSIS:
             player.debts["Banker Bard"] = player.debts.get("Banker Bard", 0) + loan['owed']
             
             # Log the loan action
-            action_tracker.log_action("loan", {
+            event_bus.publish("loan", {
                 "lender": "Banker Bard",
                 "amount": loan['amount'],
                 "interest_rate": loan['interest'],
@@ -253,7 +266,7 @@ TIP: {feedback.get('tip', 'Use this wisely!')}""",
             player.debts["Banker Bard"] = 0
             
             # Log the repayment
-            action_tracker.log_action("repayment", {
+            event_bus.publish("repayment", {
                 "lender": "Banker Bard",
                 "amount": debt,
                 "remaining_money": player.money,
@@ -298,7 +311,7 @@ def poultry_action(ui, player, action):
         player.debts['Poultry Guy Pip'] = player.debts.get('Poultry Guy Pip', 0) + owed
         
         # Log the loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Poultry Guy Pip",
             "amount": amount,
             "interest_rate": rate,
@@ -335,7 +348,7 @@ TIP: {feedback.get('tip', 'Pay this back quickly!')}""",
         player.debts['Poultry Guy Pip'] = player.debts.get('Poultry Guy Pip', 0) + owed
         
         # Log the loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Poultry Guy Pip",
             "amount": amount,
             "interest_rate": rate,
@@ -375,7 +388,7 @@ You will owe: {owed} gold (10% interest)
             player.debts['Poultry Guy Pip'] = 0
             
             # Log repayment
-            action_tracker.log_action("repayment", {
+            event_bus.publish("repayment", {
                 "lender": "Poultry Guy Pip",
                 "amount": debt,
                 "remaining_money": player.money,
@@ -413,7 +426,7 @@ Remaining: {int(player.money)} gold
             player.stock += stock_amount
             
             # Log purchase
-            action_tracker.log_action("purchase", {
+            event_bus.publish("purchase", {
                 "item": "stock",
                 "amount_bought": stock_amount,
                 "cost": total_price,
@@ -461,7 +474,7 @@ def farmer_action(ui, player, action):
         player.debts['Farmer Finn'] = player.debts.get('Farmer Finn', 0) + owed
         
         # Log the loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Farmer Finn",
             "amount": amount,
             "interest_rate": rate,
@@ -497,7 +510,7 @@ TIP: {feedback.get('tip', '')}""",
         player.debts['Farmer Finn'] = player.debts.get('Farmer Finn', 0) + owed
         
         # Log the loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Farmer Finn",
             "amount": amount,
             "interest_rate": rate,
@@ -537,7 +550,7 @@ You will owe: {owed} gold (8% interest)
             player.debts['Farmer Finn'] = 0
             
             # Log repayment
-            action_tracker.log_action("repayment", {
+            event_bus.publish("repayment", {
                 "lender": "Farmer Finn",
                 "amount": debt,
                 "remaining_money": player.money,
@@ -573,7 +586,7 @@ Remaining: {int(player.money)} gold
             player.stock += stock_amount
             
             # Log purchase
-            action_tracker.log_action("purchase", {
+            event_bus.publish("purchase", {
                 "item": "stock",
                 "amount": stock_amount,
                 "cost": stock_cost,
@@ -615,7 +628,7 @@ def witch_action(ui, player, action):
         player.debts['Witch of Woe'] = player.debts.get('Witch of Woe', 0) + 62.5
         
         # Log the predatory loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Witch of Woe",
             "amount": 50,
             "interest_rate": 0.25,
@@ -648,7 +661,7 @@ You will owe: 62.5 gold (25% INTEREST)
         player.debts['Witch of Woe'] = player.debts.get('Witch of Woe', 0) + 125
         
         # Log the predatory loan
-        action_tracker.log_action("loan", {
+        event_bus.publish("loan", {
             "lender": "Witch of Woe",
             "amount": 100,
             "interest_rate": 0.25,
@@ -689,7 +702,7 @@ You will owe: 125 gold (25% INTEREST)
             player.debts['Witch of Woe'] = 0
             
             # Log escaping predatory debt
-            action_tracker.log_action("repayment", {
+            event_bus.publish("repayment", {
                 "lender": "Witch of Woe",
                 "amount": debt,
                 "remaining_money": player.money,
@@ -726,12 +739,31 @@ LESSON: Predatory lenders trap desperate people!""",
 # ============ GAME ENDING CONDITIONS ============
 
 def check_game_status(player):
-    """Check win/lose conditions"""
+    """
+    Check win/lose conditions (called every frame)
+
+    PLAYING -> WIN / LOSE is latched: the game_end action is logged once and
+    the outcome never changes afterwards. While PLAYING the result is
+    memoised until the player's money or debts change.
+    """
+    if game_state.outcome_player is not player:
+        game_state.reset_outcome(player)
+
+    if game_state.outcome != "PLAYING":
+        return game_state.outcome
+
+    status_key = (player.money, tuple(player.debts.items()) if player.debts else ())
+    if status_key == game_state._status_key:
+        return "PLAYING"
+    game_state._status_key = status_key
+
     total_debt = sum(player.debts.values()) if player.debts else 0
-    
-    if player.money >= 500 and total_debt == 0:
+    outcome = game_outcome(player.money, total_debt)
+
+    if outcome == "WIN":
         # Log victory
-        action_tracker.log_action("game_end", {
+        game_state.outcome = "WIN"
+        event_bus.publish("game_end", {
             "result": "WIN",
             "final_money": player.money,
             "final_stock": player.stock,
@@ -739,9 +771,10 @@ def check_game_status(player):
         })
         return "WIN"
     
-    if total_debt > 500:
+    if outcome == "LOSE":
         # Log loss
-        action_tracker.log_action("game_end", {
+        game_state.outcome = "LOSE"
+        event_bus.publish("game_end", {
             "result": "LOSE",
             "final_money": player.money,
             "final_stock": player.stock,
@@ -755,7 +788,7 @@ def check_game_status(player):
 def show_tutorial(ui, player):
     """Show initial tutorial popup"""
     # Log game start
-    action_tracker.log_action("game_start", {
+    event_bus.publish("game_start", {
         "starting_money": player.money,
         "starting_stock": player.stock,
         "starting_debt": sum(player.debts.values())
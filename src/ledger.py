@@ -0,0 +1,156 @@
+"""
+Debt Ledger - Interest accrual in closed form
+
+Instead of compounding every balance once per DEBT_UPDATE_INTERVAL, each
+loan stores its principal, its rate per period and when it was last
+accrued. Balances are computed when they are read:
+
+    balance = principal * (1 + rate) ** periods_since_last_accrual
+
+so fast-forwarding a session by hours (or catching up after a restore) is
+O(lenders) instead of O(ticks). engine.accrue_interest (Player.update_debts,
+the engine's interest tick, the server's catch-up) and snapshot.catch_up
+read their balances from a ledger whose clock counts ticks.
+
+Balances saturate at MAX_BALANCE: a snapshot left for days would otherwise
+overflow a float, and any balance that large is long past the LOSE
+threshold anyway.
+
+Rounding is configurable:
+    "final"  exact compounding, rounded to cents when a balance is read or
+             settled (the default; identical to the game for one period)
+    "tick"   round to cents after every period, like Player.update_debts
+             always did, for exact parity over long spans
+    "none"   no rounding
+
+Rounding every tick has no closed form, so "tick" still loops, but never
+for long: it stops at a balance the rounding no longer changes (interest
+under half a cent) and at MAX_BALANCE, which is at most ~2,000 ticks at
+the game's lowest rate (2%) and ~200 at the Witch's 25%.
+"""
+import math
+import time
+
+ROUNDING = ("final", "tick", "none")
+
+MAX_BALANCE = 1e15   # gold; balances stop growing here
+
+
+def compound(amount, rate, periods, rounding="final", digits=2):
+    """`amount` after `periods` periods at `rate` per period (at most MAX_BALANCE)"""
+    if periods <= 0 or not rate or not amount:
+        return round(amount, digits) if rounding != "none" else amount
+    if rounding == "tick":
+        for _ in range(periods):
+            grown = round(amount * (1 + rate), digits)
+            if grown == amount:
+                break   # the interest rounds away; every later tick does the same
+            if abs(grown) >= MAX_BALANCE:
+                return math.copysign(MAX_BALANCE, amount)
+            amount = grown
+        return amount
+    if rate > 0 and periods * math.log1p(rate) >= math.log(MAX_BALANCE / abs(amount)):
+        return math.copysign(MAX_BALANCE, amount)
+    amount = amount * (1 + rate) ** periods
+    return round(amount, digits) if rounding == "final" else amount
+
+
+class Loan:
+    __slots__ = ("lender", "principal", "rate", "last_accrual")
+
+    def __init__(self, lender, principal, rate, last_accrual):
+        self.lender = lender
+        self.principal = principal        # balance as of last_accrual
+        self.rate = rate                  # interest per period
+        self.last_accrual = last_accrual  # timestamp the principal is valid for
+
+    def __repr__(self):
+        return f"Loan({self.lender!r}, {self.principal}, rate={self.rate}, last_accrual={self.last_accrual})"
+
+
+class DebtLedger:
+    """Per-lender balances accrued lazily in whole periods"""
+
+    def __init__(self, rates, interval=30, rounding="final", clock=time.time):
+        """
+        Args:
+            rates: Interest per period by lender (missing lenders accrue nothing)
+            interval: Seconds per period (DEBT_UPDATE_INTERVAL)
+            rounding: One of ROUNDING
+            clock: Time source for `now` when it is not passed
+        """
+        if rounding not in ROUNDING:
+            raise ValueError(f"rounding must be one of {ROUNDING}, not {rounding!r}")
+        self.rates = rates
+        self.interval = interval
+        self.rounding = rounding
+        self.clock = clock
+        self.loans = {}   # lender -> Loan
+
+    @classmethod
+    def from_debts(cls, debts, rates, now=None, **kwargs):
+        """Ledger holding `debts` ({lender: balance}) as of `now`"""
+        ledger = cls(rates, **kwargs)
+        now = ledger.clock() if now is None else now
+        for lender, amount in debts.items():
+            ledger.loans[lender] = Loan(lender, amount, rates.get(lender, 0), now)
+        return ledger
+
+    def _periods(self, loan, now):
+        return max(0, math.floor((now - loan.last_accrual) / self.interval))
+
+    def _settle(self, loan, now):
+        """Fold the elapsed whole periods into the principal (keeps the partial period)"""
+        periods = self._periods(loan, now)
+        if periods:
+            loan.principal = compound(loan.principal, loan.rate, periods, self.rounding)
+            loan.last_accrual += periods * self.interval
+        return loan
+
+    # ---------- queries (O(1) per lender) ----------
+    def balance(self, lender, now=None):
+        loan = self.loans.get(lender)
+        if loan is None:
+            return 0
+        now = self.clock() if now is None else now
+        return compound(loan.principal, loan.rate, self._periods(loan, now), self.rounding)
+
+    def balances(self, now=None):
+        """{lender: balance} like Player.debts"""
+        now = self.clock() if now is None else now
+        return {lender: self.balance(lender, now) for lender in self.loans}
+
+    def total(self, now=None):
+        return sum(self.balances(now).values())
+
+    # ---------- changes ----------
+    def borrow(self, lender, owed, now=None):
+        """Add `owed` to the lender's balance"""
+        now = self.clock() if now is None else now
+        loan = self.loans.get(lender)
+        if loan is None:
+            loan = self.loans[lender] = Loan(lender, 0, self.rates.get(lender, 0), now)
+        self._settle(loan, now).principal += owed
+        return loan.principal
+
+    def repay(self, lender, amount=None, now=None):
+        """Pay `amount` (default everything) off the lender's balance; returns what was paid"""
+        now = self.clock() if now is None else now
+        loan = self.loans.get(lender)
+        if loan is None:
+            return 0
+        balance = self._settle(loan, now).principal
+        paid = balance if amount is None else min(amount, balance)
+        loan.principal = balance - paid
+        return paid
+
+    def accrue(self, now=None):
+        """Settle every loan up to `now` (O(lenders))"""
+        now = self.clock() if now is None else now
+        for loan in self.loans.values():
+            self._settle(loan, now)
+
+    def fast_forward(self, seconds):
+        """Let `seconds` more time pass for every loan (O(lenders), nothing is compounded yet)"""
+        for loan in self.loans.values():
+            loan.last_accrual -= seconds
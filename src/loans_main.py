@@ -1,55 +1,21 @@
-import pygame, sys
+import pygame, sys, random
 from settings import *
 from player import Player
 from npc import NPC
 from ui import UI
 from store import CoffeeShop
+from scene import Scene, SceneManager
 import functions
+from ai import bedrock
+import action_log
+from snapshot import SessionSnapshot
+from spatial import SpatialHash
+from camera import Camera, CameraGroup
+from crowd import Crowd
 from action_tracker import action_tracker
+from events import event_bus
 
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("☕ Cosmic Café – Financial Literacy Game")
-clock = pygame.time.Clock()
-
-# Camera/scroll system
-camera_x = 0
-camera_y = 0
-
-# Player
-player = Player((WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
-all_sprites = pygame.sprite.Group(player)
-
-# Initialize player debts dictionary if not exists
-if not hasattr(player, 'debts'):
-    player.debts = {
-        'Banker Bard': 0,
-        'Poultry Guy Pip': 0,
-        'Farmer Finn': 0,
-        'Witch of Woe': 0
-    }
-
-# Coffee Shop
-coffee_shop = CoffeeShop((WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
-
-# NPCs
-npcs = pygame.sprite.Group()
-farmer = NPC("Farmer Finn", "./src/assets/farmer.png", pos=(300, 200))
-poultry = NPC("Poultry Guy Pip", "./src/assets/poultry-guy.png", pos=(800, 600))
-witch = NPC("Witch of Woe", "./src/assets/evil-wizard.png", pos=(1200, 300))
-banker = NPC("Banker Bard", "./src/assets/banker.png", pos=(1600, 800))
-npcs.add(farmer, poultry, witch, banker)
-
-# Character list for UI
-characters = ["Farmer Finn", "Poultry Guy Pip", "Witch of Woe", "Banker Bard"]
-
-# UI
-ui = UI(screen)
-
-# Show tutorial on first run
-if not functions.game_state.tutorial_shown:
-    functions.show_tutorial(ui, player)
-    functions.game_state.tutorial_shown = True
+DEBT_UPDATE_INTERVAL = 30  # seconds
 
 def draw_gradient_background(screen):
     """Farm/mystical small-town background with visible dark objects."""
@@ -88,89 +54,241 @@ def draw_game_status(screen, player):
     """Display game status messages"""
     total_debt = sum(player.debts.values()) if player.debts else 0
     status = functions.check_game_status(player)
-    
+
     font = pygame.font.SysFont("arial", 14)
-    
+
     if status == "WIN":
         msg = "🎉 YOU WON! Goal achieved: 500+ gold, 0 debt!"
         color = (0, 255, 0)
-        
-        actions = action_tracker.get_action_summary()
-        full_msg = msg 
+
+        full_msg = msg
         text = font.render(full_msg, True, color)
         screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 20))
-        
+
     elif status == "LOSE":
         msg = f"💀 GAME OVER! Debt spiral: {int(total_debt)} gold owed"
         color = (255, 0, 0)
-        
-        full_msg = msg 
+
+        full_msg = msg
         text = font.render(full_msg, True, color)
         screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 20))
 
-# Main loop
-running = True
-last_debt_update = 0
-DEBT_UPDATE_INTERVAL = 30  # seconds
+action_log_writer = None
+
+def start_session():
+    """
+    Forget what an earlier visit left in the process-wide tracker and game
+    state, so every café visit starts like a fresh launch of the game
+    """
+    close_action_log()
+    action_tracker.reset()
+    functions.game_state.reset()
+
+def open_action_log():
+    """
+    Stream this session's actions to ACTION_LOG_PATH. A fresh session gets a
+    header of its own, so earlier visits stay in the log but are never
+    loaded next to a new player; a session picked up from the snapshot
+    already has its actions and carries on under its old header.
+    """
+    global action_log_writer
+    if not ACTION_LOG_PATH or action_log_writer is not None:
+        return
+    action_log_writer = action_log.subscribe(event_bus, ACTION_LOG_PATH, action_tracker.session_start)
+
+def close_action_log():
+    global action_log_writer
+    if action_log_writer is None:
+        return
+    event_bus.unsubscribe(action_log_writer.record)
+    action_log_writer.close()
+    action_log_writer = None
+
+class CosmicCafeScene(Scene):
+    """The Cosmic Café loans & debt game, hosted by the SceneManager"""
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    flags = pygame.RESIZABLE
+    caption = "☕ Cosmic Café – Financial Literacy Game"
+
+    def __init__(self, manager, crowd=0):
+        """
+        Args:
+            crowd: Extra wandering NPCs that are only drawn (stress mode)
+        """
+        super().__init__(manager)
+
+        # Camera/scroll system
+        self.camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (WORLD_WIDTH, WORLD_HEIGHT))
+
+        # Player
+        self.player = Player((WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
+        self.camera.snap(self.player.rect)
+
+        # Initialize player debts dictionary if not exists
+        if not hasattr(self.player, 'debts'):
+            self.player.debts = {
+                'Banker Bard': 0,
+                'Poultry Guy Pip': 0,
+                'Farmer Finn': 0,
+                'Witch of Woe': 0
+            }
+
+        # Coffee Shop
+        self.coffee_shop = CoffeeShop((WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
+
+        # NPCs
+        self.npcs = pygame.sprite.Group()
+        farmer = NPC("Farmer Finn", "./src/assets/farmer.png", pos=(300, 200))
+        poultry = NPC("Poultry Guy Pip", "./src/assets/poultry-guy.png", pos=(800, 600))
+        witch = NPC("Witch of Woe", "./src/assets/evil-wizard.png", pos=(1200, 300))
+        banker = NPC("Banker Bard", "./src/assets/banker.png", pos=(1600, 800))
+        self.npcs.add(farmer, poultry, witch, banker)
+
+        # Stress mode: a crowd of small lookalikes wandering the world
+        self.crowd = pygame.sprite.Group()
+        images = ["./src/assets/farmer.png", "./src/assets/poultry-guy.png",
+                  "./src/assets/evil-wizard.png", "./src/assets/banker.png"]
+        for i in range(crowd):
+            self.crowd.add(NPC(f"Customer {i}", images[i % len(images)], size=(48, 48),
+                               pos=(random.randrange(WORLD_WIDTH), random.randrange(WORLD_HEIGHT))))
+
+        # Walking customers (NumPy arrays, drawn as dots); visits become café sales
+        self.customers = Crowd(CAFE_CUSTOMERS, (WORLD_WIDTH, WORLD_HEIGHT), self.coffee_shop.rect.midbottom,
+                               visits_per_minute=CUSTOMER_VISITS_PER_MINUTE, bus=event_bus)
+
+        # Everything in the world, drawn through the camera (culled, one blits() per frame)
+        self.all_sprites = CameraGroup()
+        self.all_sprites.add(self.coffee_shop, layer=0)
+        self.all_sprites.add(self.npcs, self.crowd, layer=1)
+        self.all_sprites.add(self.player, layer=2)
+
+        # Grid of everything the player can walk up to (UI.check_proximity)
+        self.world = SpatialHash(cell_size=200)
+        self.world.insert(self.coffee_shop, self.coffee_shop.rect)
+        for npc in self.npcs:
+            self.world.insert(npc, npc.rect)
 
-while running:
-    clock.tick(FPS)
-
-    # Update debts
-    current_time = pygame.time.get_ticks() / 1000  # convert ms → seconds
-    if current_time - last_debt_update >= DEBT_UPDATE_INTERVAL:
-        last_debt_update = current_time
-        total_debt = player.update_debts()
-        print("Updated debts:", player.debts)
-        print("Total debt:", total_debt)
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        
+        # Character list for UI
+        self.characters = ["Farmer Finn", "Poultry Guy Pip", "Witch of Woe", "Banker Bard"]
+
+        # Debt timer (scene-relative, the process may have been up for a while)
+        self.last_debt_update = pygame.time.get_ticks() / 1000
+        self.ui = None
+        self.ai_warming = False
+        self.snapshot = None
+        self.last_snapshot = 0
+
+    def restore_snapshot(self):
+        """Pick up the session saved at SNAPSHOT_PATH (before the action log is opened)"""
+        self.snapshot = SessionSnapshot(SNAPSHOT_PATH, action_tracker)
+        try:
+            restored = self.snapshot.restore(self.player, functions.game_state, self.coffee_shop,
+                                             interval=DEBT_UPDATE_INTERVAL)
+        except (OSError, ValueError, OverflowError) as e:
+            # nothing was restored: play a fresh session, the next save replaces the snapshot
+            print(f"Warning: could not restore {SNAPSHOT_PATH}: {e}")
+            self.snapshot = SessionSnapshot(SNAPSHOT_PATH, action_tracker)
+            return
+        if restored:
+            self.last_debt_update = pygame.time.get_ticks() / 1000 - restored["debt_elapsed"]
+            print(f"Restored session ({restored['offline']:.0f}s offline, "
+                  f"{restored['periods']} interest ticks applied)")
+
+    def save_snapshot(self):
+        if self.snapshot is None:
+            return
+        self.last_snapshot = pygame.time.get_ticks() / 1000
+        try:
+            self.snapshot.save(self.player, functions.game_state, self.coffee_shop,
+                               debt_elapsed=self.last_snapshot - self.last_debt_update)
+        except OSError as e:
+            print(f"Warning: could not save {SNAPSHOT_PATH}: {e}")
+
+    def enter(self):
+        if self.ui is not None:
+            return  # resumed, the session is still ours
+        start_session()
+        if SNAPSHOT_PATH:
+            self.restore_snapshot()
+            self.camera.snap(self.player.rect)
+        open_action_log()
+
+        # UI
+        self.ui = UI(self.manager.screen)
+
+        # Show tutorial on first run
+        if not functions.game_state.tutorial_shown:
+            functions.show_tutorial(self.ui, self.player)
+            functions.game_state.tutorial_shown = True
+
+    def exit(self):
+        self.save_snapshot()
+        close_action_log()
+
+    def handle(self, event):
         # MOUSE CLICK - Pass to UI handler
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
-            ui.handle_click(mouse_pos, player)
-
-    keys = pygame.key.get_pressed()
-    player.move(keys)
-
-    # Update camera to follow player
-    camera_x = player.rect.centerx - SCREEN_WIDTH // 2
-    camera_y = player.rect.centery - SCREEN_HEIGHT // 2
-    camera_x = max(0, min(camera_x, WORLD_WIDTH - SCREEN_WIDTH))
-    camera_y = max(0, min(camera_y, WORLD_HEIGHT - SCREEN_HEIGHT))
-
-    # Draw background
-    draw_gradient_background(screen)
-
-    # Draw coffee shop
-    coffee_shop_offset = coffee_shop.rect.copy()
-    coffee_shop_offset.x -= camera_x
-    coffee_shop_offset.y -= camera_y
-    screen.blit(coffee_shop.image, coffee_shop_offset)
-
-    # Draw NPCs
-    for npc in npcs:
-        npc_offset = npc.rect.copy()
-        npc_offset.x -= camera_x
-        npc_offset.y -= camera_y
-        screen.blit(npc.image, npc_offset)
-
-    # Draw player
-    player_offset = player.rect.copy()
-    player_offset.x -= camera_x
-    player_offset.y -= camera_y
-    screen.blit(player.image, player_offset)
-
-    # Draw UI (panels + menus + popups)
-    ui.draw_all(player, characters, coffee_shop=coffee_shop, npcs=list(npcs))
-    
-    # Draw game status
-    draw_game_status(screen, player)
-
-    pygame.display.flip()
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+            self.ui.handle_click(mouse_pos, self.player)
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            if not self.ui.showing_popup and not self.ui.active_menu:
+                self.manager.pop()
+
+    def update(self):
+        player = self.player
+
+        # Update debts
+        current_time = pygame.time.get_ticks() / 1000  # convert ms → seconds
+        elapsed = current_time - self.last_debt_update
+        if elapsed >= DEBT_UPDATE_INTERVAL:
+            # catch up on every missed tick at once (e.g. after a long stall)
+            periods = int(elapsed // DEBT_UPDATE_INTERVAL)
+            self.last_debt_update += periods * DEBT_UPDATE_INTERVAL
+            total_debt = player.update_debts(periods)
+            print("Updated debts:", player.debts)
+            print("Total debt:", total_debt)
+
+        if self.snapshot is not None and current_time - self.last_snapshot >= SNAPSHOT_INTERVAL:
+            self.save_snapshot()
+
+        keys = pygame.key.get_pressed()
+        self.all_sprites.remember(player)
+        player.move(keys)
+        for npc in self.crowd:
+            npc.random_move()
+        self.customers.update(self.manager.step, self.coffee_shop, player)
+
+        # Update camera to follow player
+        self.camera.follow(player.rect)
+
+    def draw(self, screen):
+        # Draw background
+        draw_gradient_background(screen)
+
+        # Draw customers, then coffee shop, NPCs and player (only what the camera sees)
+        self.customers.draw(screen, self.camera, self.manager.alpha)
+        self.all_sprites.draw(screen, self.camera, self.manager.alpha)
+
+        # Draw UI (panels + menus + popups)
+        self.ui.screen = screen
+        self.ui.draw_all(self.player, self.characters, coffee_shop=self.coffee_shop, npcs=list(self.npcs),
+                         world=self.world)
+
+        # Draw game status
+        draw_game_status(screen, self.player)
+
+        # Window is up: load boto3 + the Bedrock client in the background
+        if not self.ai_warming:
+            self.ai_warming = True
+            bedrock.warm_up()
+
+def run(crowd=0):
+    manager = SceneManager((SCREEN_WIDTH, SCREEN_HEIGHT), "☕ Cosmic Café – Financial Literacy Game", fps=FPS)
+    manager.push(CosmicCafeScene(manager, crowd=crowd))
+    manager.run()
+    sys.exit()
+
+if __name__ == "__main__":
+    # python src/loans_main.py --stress 3000  (stress mode: a crowd of extra NPCs)
+    run(int(sys.argv[sys.argv.index("--stress") + 1]) if "--stress" in sys.argv else 0)
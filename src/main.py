@@ -1,14 +1,13 @@
 import pygame
 import sys
-import subprocess
 import os
+import importlib
+import threading
 
 from settings import PURPLE
+from scene import Scene, SceneManager
 
-pygame.init()
 WIDTH, HEIGHT = 1000, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Financial Learning Adventure")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,78 +19,121 @@ BLUE = (52, 152, 219)
 # Fonts
 BASE_FONT_SIZE = 48
 FONT_NAME = None  # Default font
-SMALL_FONT = pygame.font.SysFont(None, 28)
-
-# Background
-background = pygame.image.load("./src/assets/mainimg.jpg")
-background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-def draw_button(text, color, x, y, width=200, height=100):
-    rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(screen, color, rect, border_radius=15)
-    pygame.draw.rect(screen, BLACK, rect, 3, border_radius=15)
-
-    # Dynamically scale font to fit text inside button
-    font_size = BASE_FONT_SIZE
-    font = pygame.font.SysFont(FONT_NAME, font_size)
-    text_render = font.render(text, True, BLACK)
-    while (text_render.get_width() > width - 10 or text_render.get_height() > height - 10) and font_size > 10:
-        font_size -= 2
-        font = pygame.font.SysFont(FONT_NAME, font_size)
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Topic buttons -> (module, scene class, folder the module lives in)
+GAMES = {
+    "Budgeting": ("credit", "GroceryScene", SRC_DIR),
+    "Scams": ("level_select", "LevelSelectScene", os.path.join(SRC_DIR, "whack")),
+    "Loans & Debt": ("loans_main", "CosmicCafeScene", SRC_DIR),
+    "Credit Basics": ("credcity", "CredCityScene", os.path.join(SRC_DIR, "CredCity")),
+}
+
+
+def load_game(name):
+    """Import a game module in-process (once) and return its Scene class"""
+    module_name, class_name, folder = GAMES[name]
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def preload_games():
+    """
+    Import every game module on a background thread while the menu is up
+
+    Game modules are import-safe (no window, fonts or images until init()),
+    so this only pays the Python import cost ahead of the first click. A
+    click that races the preload just waits on the import lock.
+    """
+    def _worker():
+        for name in GAMES:
+            try:
+                load_game(name)
+            except Exception as e:
+                print(f"Warning: could not preload {name}: {e}")
+
+    thread = threading.Thread(target=_worker, name="preload-games", daemon=True)
+    thread.start()
+    return thread
+
+
+class MenuScene(Scene):
+    """Topic picker that hosts the four games in the same window"""
+    size = (WIDTH, HEIGHT)
+    caption = "Financial Learning Adventure"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.buttons = {}
+        self.background = None
+
+    def enter(self):
+        # Background
+        self.background = self.manager.assets.image("./src/assets/mainimg.jpg", (WIDTH, HEIGHT))
+
+    def draw_button(self, screen, text, color, x, y, width=200, height=100):
+        rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(screen, color, rect, border_radius=15)
+        pygame.draw.rect(screen, BLACK, rect, 3, border_radius=15)
+
+        # Dynamically scale font to fit text inside button
+        font_size = BASE_FONT_SIZE
+        font = self.manager.assets.font(FONT_NAME, font_size)
+        while (font.size(text)[0] > width - 10 or font.get_height() > height - 10) and font_size > 10:
+            font_size -= 2
+            font = self.manager.assets.font(FONT_NAME, font_size)
         text_render = font.render(text, True, BLACK)
 
-    # Center text
-    screen.blit(text_render, (x + width//2 - text_render.get_width()//2,
-                              y + height//2 - text_render.get_height()//2))
-    return rect
-
-running = True
-while running:
-    screen.blit(background, (0, 0))
-
-    # Title
-    title_font = pygame.font.SysFont(FONT_NAME, 48)
-    title = title_font.render("Welcome to Your Financial Learning Adventure!", True, BLACK)
-    screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
-
-    # Description
-    desc = SMALL_FONT.render("Choose a topic to begin your learning journey:", True, WHITE)
-    screen.blit(desc, (WIDTH//2 - desc.get_width()//2, 160))
-
-    # Buttons - same width and height for consistency
-    button_width = 200
-    button_height = 100
-    spacing = 50
-    start_x = (WIDTH - (4 * button_width + 3 * spacing)) // 2  # space for 4 buttons
-    y_pos = 400
-
-    budgeting_btn = draw_button("Budgeting", GREEN, start_x, y_pos, button_width, button_height)
-    scams_btn = draw_button("Scams", RED, start_x + button_width + spacing, y_pos, button_width, button_height)
-    loans_btn = draw_button("Loans & Debt", BLUE, start_x + 2 * (button_width + spacing), y_pos, button_width, button_height)
-    basics_btn = draw_button("Credit Basics", PURPLE, start_x + 3 * (button_width + spacing), y_pos, button_width, button_height)
-
-    pygame.display.update()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if budgeting_btn.collidepoint(event.pos):
-                pygame.quit()
-                subprocess.run(["python", os.path.join("src", "credit.py")])
-                sys.exit()
-            elif scams_btn.collidepoint(event.pos):
-                pygame.quit()
-                subprocess.run(["python", os.path.join("src", "whack", "main.py")])
-                sys.exit()
-            elif loans_btn.collidepoint(event.pos):
-                pygame.quit()
-                subprocess.run(["python", os.path.join("src", "loans_main.py")])
-                sys.exit()
-            elif basics_btn.collidepoint(event.pos):
-                pygame.quit()
-                subprocess.run(["python", os.path.join("src", "CredCity","credcity.py")])
-                sys.exit()
-
-pygame.quit()
-sys.exit()
+        # Center text
+        screen.blit(text_render, (x + width//2 - text_render.get_width()//2,
+                                  y + height//2 - text_render.get_height()//2))
+        return rect
+
+    def handle(self, e):
+        if e.type == pygame.MOUSEBUTTONDOWN:
+            for name, rect in self.buttons.items():
+                if rect.collidepoint(e.pos):
+                    scene_class = load_game(name)
+                    self.manager.push(scene_class(self.manager))
+                    return
+
+    def draw(self, screen):
+        screen.blit(self.background, (0, 0))
+
+        # Title
+        title_font = self.manager.assets.font(FONT_NAME, 48)
+        title = title_font.render("Welcome to Your Financial Learning Adventure!", True, BLACK)
+        screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
+
+        # Description
+        small_font = self.manager.assets.font(None, 28)
+        desc = small_font.render("Choose a topic to begin your learning journey:", True, WHITE)
+        screen.blit(desc, (WIDTH//2 - desc.get_width()//2, 160))
+
+        # Buttons - same width and height for consistency
+        button_width = 200
+        button_height = 100
+        spacing = 50
+        start_x = (WIDTH - (4 * button_width + 3 * spacing)) // 2  # space for 4 buttons
+        y_pos = 400
+
+        colors = {"Budgeting": GREEN, "Scams": RED, "Loans & Debt": BLUE, "Credit Basics": PURPLE}
+        for i, name in enumerate(GAMES):
+            x = start_x + i * (button_width + spacing)
+            self.buttons[name] = self.draw_button(screen, name, colors[name], x, y_pos,
+                                                  button_width, button_height)
+
+
+def main():
+    manager = SceneManager((WIDTH, HEIGHT), "Financial Learning Adventure")
+    manager.push(MenuScene(manager))
+    preload_games()
+    manager.run()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
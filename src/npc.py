@@ -1,14 +1,14 @@
 import pygame
 import random
+from scene import assets
 
 class NPC(pygame.sprite.Sprite):
     def __init__(self, name, image_path, pos=(0,0), size=(150, 150)):
         super().__init__()
         self.name = name
         
-        # Load and scale image
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        # Load and scale image (shared cache, decoded once per process)
+        self.image = assets.image(image_path, size, alpha=True)
         
         self.rect = self.image.get_rect(center=pos)
         self.pos = pygame.Vector2(pos)
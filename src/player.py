@@ -3,6 +3,8 @@ import pygame
 import os
 import time  # NEW: For energy regen timing
 
+from engine import START_DEBTS, START_MONEY, START_STOCK, accrue_interest
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__()
@@ -19,20 +21,15 @@ class Player(pygame.sprite.Sprite):
         
         self.rect = self.image.get_rect(center=pos)
 
-        self.money = 200
-        self.debts = {
-            "Wizard of Woe": 50,
-            "Banker Bard": 20,
-            "Poultry Guy Pip": 10
-        }
+        self.money = START_MONEY
+        self.debts = dict(START_DEBTS)
 
         # ===== NEW ATTRIBUTES =====
-        self.stock = 100             # Player energy (0-100)
+        self.stock = START_STOCK     # Player energy (0-100)
         self.last_stock_update = time.time()  # For regen calculation
-        self.actions_log = []         # Track all actions for analytics
 
     def move(self, keys_pressed):
-        speed = 4
+        speed = 4  # px per update (SceneManager runs updates at a fixed 1 / FPS step)
         
         # Arrow keys
         if keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_a]:
@@ -58,39 +55,17 @@ class Player(pygame.sprite.Sprite):
             self.energy = min(100, self.energy + 1)
             self.last_energy_update = current_time
 
-    def spend_stock(self, amount, action_name):
-        """Reduce energy and log the action"""
+    # Actions are published once by functions.py (events.event_bus); the
+    # event already carries the stock change, so these only update the value.
+    def spend_stock(self, amount):
+        """Reduce stock"""
         self.stock = max(0, self.stock - amount)
-        self.actions_log.append({
-            "action": action_name,
-            "energy_change": -amount,
-            "money_change": 0,
-            "timestamp": time.time()
-        })
 
-    def gain_energy(self, amount, action_name):
-        """Increase energy (e.g., coffee) and log the action"""
-        self.energy = min(100, self.energy + amount)
-        self.actions_log.append({
-            "action": action_name,
-            "energy_change": amount,
-            "money_change": 0,
-            "timestamp": time.time()
-        })
+    def gain_energy(self, amount):
+        """Increase stock (e.g., coffee)"""
+        self.stock = min(100, self.stock + amount)
 
-    def update_debts(self):
-        """Apply interest to all current debts and return total debt"""
-        interest_rates = {
-            "Banker Bard": 0.02,
-            "Poultry Guy": 0.10,
-            "Farmer Finn": 0.08,
-            "Wizard of Woe": 0.25
-        }
-        
-        total_debt = 0
-        for lender, amount in self.debts.items():
-            rate = interest_rates.get(lender, 0)
-            self.debts[lender] = round(amount * (1 + rate), 2)
-            total_debt += self.debts[lender]
-        
-        return total_debt
+    def update_debts(self, periods=1):
+        """Apply `periods` interest ticks to all current debts and return total debt"""
+        self.debts.update(accrue_interest(self.debts, periods))
+        return sum(self.debts.values())
@@ -0,0 +1,251 @@
+"""
+Scene Manager - Hosts every mini-game in one window and one process
+
+Each game exposes a Scene (handle / update / draw). The SceneManager keeps a
+stack of them, so the launcher pushes a game and the game pops itself to go
+back. Fonts and images live in a shared AssetCache, so switching topics never
+re-enumerates fonts or decodes the same file twice.
+
+The loop runs the simulation at a fixed timestep: every update() advances the
+game by exactly `step` = 1 / fps seconds, and each frame runs as many updates
+as real time has passed (an accumulator), so a stalled frame (e.g. a blocking
+Bedrock call) is caught up instead of slowing the game down. What is left in
+the accumulator is exposed as `alpha` (0..1) for scenes that interpolate
+between the last two updates when drawing. Drawing can be throttled on its
+own with render_fps.
+
+Set CREDITWISE_EXIT_AFTER_FIRST_FRAME=1 to quit right after the first frame
+is presented (used by the startup reports in src/bench/).
+"""
+import os
+import time
+
+import pygame
+
+EXIT_AFTER_FIRST_FRAME = "CREDITWISE_EXIT_AFTER_FIRST_FRAME"
+
+
+class AssetCache:
+    """Shared font and image cache used by every scene"""
+
+    def __init__(self):
+        self.fonts = {}
+        self.images = {}
+
+    def font(self, name, size, bold=False):
+        """Get a SysFont, creating it only the first time it is asked for"""
+        key = (name, size, bold)
+        f = self.fonts.get(key)
+        if f is None:
+            f = pygame.font.SysFont(name, size, bold=bold)
+            self.fonts[key] = f
+        return f
+
+    def image(self, path, size=None, alpha=False):
+        """
+        Load an image once (optionally scaled) and reuse it afterwards
+
+        Args:
+            path: File path of the image
+            size: Optional (width, height) to scale to
+            alpha: Convert with per-pixel alpha
+
+        Raises pygame.error / FileNotFoundError like pygame.image.load, so
+        callers keep their own fallback handling.
+        """
+        key = (path, size, alpha)
+        img = self.images.get(key)
+        if img is None:
+            img = self.images.get((path, None, alpha))
+            if img is None:
+                img = pygame.image.load(path)
+                if pygame.display.get_surface() is not None:
+                    img = img.convert_alpha() if alpha else img.convert()
+                self.images[(path, None, alpha)] = img
+            if size is not None:
+                img = pygame.transform.scale(img, size)
+                self.images[key] = img
+        return img
+
+    def clear(self):
+        self.fonts.clear()
+        self.images.clear()
+
+
+# Global cache shared by all scenes in the process
+assets = AssetCache()
+
+
+class Scene:
+    """
+    Base class for anything the SceneManager can host
+
+    Subclasses set size/flags/caption for the window they want and override
+    handle(event), update() and draw(screen).
+    """
+    size = (1000, 800)
+    flags = 0
+    caption = "Financial Learning Adventure"
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def enter(self):
+        """Called when the scene becomes the top of the stack"""
+
+    def exit(self):
+        """Called when the scene is popped or replaced"""
+
+    def handle(self, e):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+
+class SceneManager:
+    """Stack of scenes sharing one display, one clock and one asset cache"""
+
+    def __init__(self, size=(1000, 800), caption="Financial Learning Adventure", fps=60,
+                 render_fps=None, max_lag=2.0):
+        """
+        Args:
+            fps: Simulation updates per second (the fixed timestep is 1 / fps)
+            render_fps: Draw at most this often (None = after every loop pass)
+            max_lag: Seconds of simulation caught up after a stall at most;
+                anything longer is dropped (e.g. a paused debugger)
+        """
+        self.created = time.perf_counter()
+        pygame.init()
+        self.fps = fps
+        self.step = 1 / fps
+        self.render_fps = render_fps
+        self.max_lag = max_lag
+        self.accumulator = 0.0
+        self.alpha = 1.0               # position between the last two updates, for drawing
+        self._last_frame = None
+        self._last_draw = None
+        self.clock = pygame.time.Clock()
+        self.assets = assets
+        self.stack = []
+        self.running = False
+        self.frames = 0
+        self._mode = (tuple(size), 0)
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+    # ---------- display ----------
+    def set_mode(self, size, flags=0):
+        """Resize the shared window (same window, no new process)"""
+        mode = (tuple(size), flags)
+        if mode != self._mode or pygame.display.get_surface() is None:
+            try:
+                self.screen = pygame.display.set_mode(size, flags)
+            except pygame.error:
+                # SCALED needs a renderer (not available on e.g. the dummy driver)
+                self.screen = pygame.display.set_mode(size, flags & ~pygame.SCALED)
+            self._mode = mode
+        return self.screen
+
+    def _activate(self, scene):
+        self.set_mode(scene.size, scene.flags)
+        pygame.display.set_caption(scene.caption)
+        scene.enter()
+        # loading the scene is not simulation time
+        self._last_frame = None
+        self.accumulator = 0.0
+
+    # ---------- stack ----------
+    @property
+    def current(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self.stack.append(scene)
+        self._activate(scene)
+
+    def pop(self):
+        """Leave the current scene and resume the one underneath"""
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self._activate(self.stack[-1])
+        return scene
+
+    def replace(self, scene):
+        """Swap the current scene for another one (e.g. next level)"""
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(scene)
+
+    def quit(self):
+        self.running = False
+
+    # ---------- loop ----------
+    def frame(self, dt=None):
+        """
+        Run one frame: events, the fixed-step updates due, draw, flip (no cap)
+
+        Args:
+            dt: Seconds of simulation to advance (default: real time since
+                the previous frame; the benchmarks pass `step`)
+
+        Returns:
+            False once the loop should stop (QUIT or empty stack)
+        """
+        now = time.perf_counter()
+        if dt is None:
+            dt = now - self._last_frame if self._last_frame is not None else self.step
+        self._last_frame = now
+        self.accumulator = min(self.accumulator + dt, self.max_lag)
+
+        scene = self.stack[-1]
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                self.running = False
+                break
+            scene.handle(e)
+            if self.current is not scene:
+                break  # scene switched, drop the rest of this batch
+
+        if not self.running or not self.stack:
+            return False
+
+        scene = self.stack[-1]
+        step = self.step
+        while self.accumulator >= step - 1e-9:
+            self.accumulator -= step
+            scene.update()
+            if self.current is not scene:
+                self.accumulator = 0.0
+                return self.running
+        self.alpha = min(1.0, max(0.0, self.accumulator / step))
+
+        if self.render_fps and self._last_draw is not None and now - self._last_draw < 1 / self.render_fps:
+            return self.running
+        self._last_draw = now
+        scene.draw(self.screen)
+        pygame.display.flip()
+        self.frames += 1
+        if self.frames == 1 and os.environ.get(EXIT_AFTER_FIRST_FRAME):
+            ms = (time.perf_counter() - self.created) * 1000
+            print(f"[startup] first frame {ms:.1f} ms after SceneManager()", flush=True)
+            self.running = False
+        return self.running
+
+    def run(self):
+        self.running = True
+        self._last_frame = None
+        while self.running and self.stack:
+            self.clock.tick(max(self.fps, self.render_fps or 0))
+            if not self.frame():
+                break
+
+        while self.stack:
+            self.stack.pop().exit()
+        pygame.quit()
@@ -0,0 +1,267 @@
+"""
+Café Server - Many Cosmic Café sessions in one asyncio process
+
+Each session is a headless engine.CafeState plus its own small ActionTracker
+(no pygame, no sprites), so a seat costs kilobytes instead of a process.
+Interest is accrued lazily in closed form from the session's clock whenever
+it is touched, so idle sessions cost nothing. AI calls (lending decisions,
+feedback, suggestions) go through one shared AIGateway: a single thread
+pool, cache and rate limit for the whole room.
+
+JSON over HTTP/1.1 (keep-alive) on a local port:
+
+    POST   /sessions                     {"seed": 7}            -> new session
+    GET    /sessions/<id>                                       -> state + summary
+    POST   /sessions/<id>/actions        {"menu": "Coffee Shop", "option": "Generate a Sale"}
+    DELETE /sessions/<id>
+    GET    /stats
+
+Actions use the menu / option names of the game UI (see engine.py). The
+Banker's "Request Loan" asks the AI for an offer, which "Accept Loan" then
+takes. Add "feedback": false to an action to skip the AI feedback.
+
+Run from the repo root:
+    python src/server.py --port 8765
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import time
+
+import engine
+from action_tracker import ActionTracker
+from ai.action_feedback import get_action_feedback, get_financial_suggestions
+from ai.gateway import AIGateway
+from ai.lending_check import lending_decision
+
+DEBT_UPDATE_INTERVAL = 30        # seconds per interest tick, as in loans_main
+SESSION_HISTORY = 200            # actions each session keeps in memory
+FEEDBACK_TYPES = ("sale", "loan", "repayment", "purchase")
+
+REJECTED_LOAN = {"decision": False, "amount": 0, "interest": 0, "reason": "Risk assessment failed."}
+
+
+def _bucket(value, size=25):
+    return int(value // size)
+
+
+class CafeSession:
+    """One player's game on the server"""
+    __slots__ = ("id", "state", "tracker", "last_tick", "last_seen", "pending_loan", "lock")
+
+    def __init__(self, session_id, seed, now):
+        self.id = session_id
+        self.state = engine.new_game(seed)
+        self.tracker = ActionTracker(max_actions=SESSION_HISTORY)
+        self.last_tick = now
+        self.last_seen = now
+        self.pending_loan = None
+        self.lock = asyncio.Lock()
+
+    def catch_up(self, now):
+        """Apply the interest ticks that passed since the session was last touched"""
+        periods = math.floor((now - self.last_tick) / DEBT_UPDATE_INTERVAL)
+        if periods > 0:
+            self.last_tick += periods * DEBT_UPDATE_INTERVAL
+            self.apply(engine.ACCRUE + ({"periods": periods},))
+
+    def apply(self, action):
+        """engine.step + record the events; returns the events"""
+        self.state, events = engine.step(self.state, action)
+        for action_type, details in events:
+            self.tracker.log_action(action_type, details)
+        return events
+
+    def view(self):
+        state = self.state
+        return {
+            "id": self.id,
+            "money": state.money,
+            "stock": state.stock,
+            "debts": state.debts,
+            "total_debt": state.total_debt,
+            "turn": state.turn,
+            "outcome": state.outcome,
+            "pending_loan": self.pending_loan,
+        }
+
+
+class CafeServer:
+    def __init__(self, gateway, idle_timeout=3600, clock=time.time):
+        self.gateway = gateway
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.sessions = {}
+        self._ids = itertools.count(1)
+        self.started = clock()
+        self.requests = 0
+
+    # ---------- sessions ----------
+    def create(self, seed=None):
+        session_id = str(next(self._ids))
+        seed = seed if seed is not None else hash((session_id, self.started)) & 0xFFFFFFFF
+        session = self.sessions[session_id] = CafeSession(session_id, seed, self.clock())
+        return session
+
+    def reap(self):
+        """Drop sessions idle for longer than idle_timeout"""
+        cutoff = self.clock() - self.idle_timeout
+        for session_id in [sid for sid, s in self.sessions.items() if s.last_seen < cutoff]:
+            del self.sessions[session_id]
+
+    # ---------- actions ----------
+    async def act(self, session, menu, option, feedback=True):
+        """Run one menu action for a session; returns the JSON response dict"""
+        async with session.lock:
+            now = self.clock()
+            session.last_seen = now
+            session.catch_up(now)
+            state = session.state
+            response = {}
+
+            if (menu, option) == ("Banker", "Request Loan"):
+                key = ("lend", _bucket(state.money, 10), _bucket(state.total_debt, 10))
+                decision = await self.gateway.call(key, lending_decision, state, fallback=REJECTED_LOAN)
+                if decision.get("decision"):
+                    session.pending_loan = {"amount": decision.get("amount", 0),
+                                            "interest": decision.get("interest", 0.02),
+                                            "reason": decision.get("reason", "Loan approved.")}
+                else:
+                    session.pending_loan = None
+                    session.tracker.log_action("loan_rejected", {
+                        "lender": "Banker Bard",
+                        "reason": decision.get("reason", "Risk assessment failed.")
+                    })
+                response["decision"] = decision
+                events = []
+            elif (menu, option) == ("Banker", "Accept Loan"):
+                if session.pending_loan is None:
+                    raise ValueError("no pending loan offer")
+                events = session.apply(("Banker", "Accept Loan", session.pending_loan))
+                session.pending_loan = None
+            elif option == "Check Account":
+                response["summary"] = session.tracker.get_action_summary()
+                events = []
+            elif option == "View Suggestions":
+                key = ("suggest", _bucket(state.money), _bucket(state.total_debt))
+                response["suggestions"] = await self.gateway.call(key, get_financial_suggestions, state)
+                events = []
+            else:
+                events = session.apply((menu, option))
+
+            if feedback:
+                for action_type, details in events:
+                    if action_type in FEEDBACK_TYPES:
+                        key = ("feedback", action_type, details.get("lender"), details.get("amount"),
+                               _bucket(session.state.money), _bucket(session.state.total_debt))
+                        response["feedback"] = await self.gateway.call(
+                            key, get_action_feedback, session.state, action_type, details)
+                        break
+
+            response["events"] = [{"action_type": t, "details": d} for t, d in events]
+            response["state"] = session.view()
+            return response
+
+    # ---------- HTTP ----------
+    async def route(self, method, path, body):
+        """Returns (status, payload)"""
+        parts = [p for p in path.split("?")[0].split("/") if p]
+        if not isinstance(body, dict):
+            return 400, {"error": "body must be a JSON object"}
+        if parts == ["stats"] and method == "GET":
+            return 200, {"sessions": len(self.sessions), "requests": self.requests,
+                         "uptime": round(self.clock() - self.started, 1), "ai": self.gateway.stats}
+        if parts == ["sessions"] and method == "POST":
+            seed = body.get("seed")
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+                return 400, {"error": "seed must be an integer"}
+            return 201, self.create(seed).view()
+        if not parts or parts[0] != "sessions" or len(parts) < 2:
+            return 404, {"error": "not found"}
+
+        session = self.sessions.get(parts[1])
+        if session is None:
+            return 404, {"error": f"no session {parts[1]}"}
+        if len(parts) == 2 and method == "GET":
+            session.catch_up(self.clock())
+            return 200, dict(session.view(), summary=session.tracker.get_action_summary())
+        if len(parts) == 2 and method == "DELETE":
+            del self.sessions[parts[1]]
+            return 200, {"deleted": parts[1]}
+        if parts[2:] == ["actions"] and method == "POST":
+            if not isinstance(body.get("menu"), str) or not isinstance(body.get("option"), str):
+                return 400, {"error": "menu and option must be strings"}
+            try:
+                return 200, await self.act(session, body["menu"], body["option"], body.get("feedback", True))
+            except (KeyError, ValueError) as e:
+                return 400, {"error": str(e)}
+        return 404, {"error": "not found"}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+                self.requests += 1
+                try:
+                    status, payload = await self.route(method, path, json.loads(raw) if raw else {})
+                except json.JSONDecodeError:
+                    status, payload = 400, {"error": "body is not JSON"}
+
+                data = json.dumps(payload, separators=(",", ":")).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def reaper(self, every=60):
+        while True:
+            await asyncio.sleep(every)
+            self.reap()
+
+
+async def serve(host, port, **gateway_kwargs):
+    server = CafeServer(AIGateway(**gateway_kwargs))
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    asyncio.get_running_loop().create_task(server.reaper())
+    print(f"Cosmic Café server on http://{host}:{port}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ai-concurrency", type=int, default=8, help="Bedrock requests in flight")
+    parser.add_argument("--ai-rate", type=float, default=5.0, help="Bedrock requests per second")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, max_concurrency=args.ai_concurrency, rate=args.ai_rate))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 # settings.py
+import os
+
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 900
 FPS = 60
@@ -17,3 +19,28 @@ PURPLE = (150, 80, 200)
 GRAY = (220, 220, 220)
 
 FONT_NAME = 'arial'
+
+# Stream every logged action to this JSON-lines file (and restore it on the
+# next start), e.g. "player_actions.jsonl". None keeps actions in memory only.
+ACTION_LOG_PATH = None
+
+# Recent actions the tracker keeps in memory; older ones are dropped (they
+# stay in the ACTION_LOG_PATH log when it is set). None keeps everything.
+ACTION_HISTORY_LIMIT = 5000
+
+# Save the session (player, game state, café metrics, actions) to this binary
+# snapshot every SNAPSHOT_INTERVAL seconds and on exit, and restore it on the
+# next start, e.g. "cafe_session.snap". None disables snapshots.
+SNAPSHOT_PATH = None
+SNAPSHOT_INTERVAL = 10
+
+# Walking customers in the café world (crowd.Crowd); their visits are sold
+# through CoffeeShop.sell_item, paid to the player and logged as sales. This
+# is extra income the game's balance (engine.py, simulator.py) does not model,
+# so it is off by default; e.g. 200 customers earn ~70 gold per minute.
+CAFE_CUSTOMERS = 0
+CUSTOMER_VISITS_PER_MINUTE = 6
+
+# Emoji glyphs are packed into an atlas that is saved here at exit and reused
+# on the next start (emoji_atlas.EmojiAtlas). None keeps the atlas in memory.
+EMOJI_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "creditwise")
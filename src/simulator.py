@@ -0,0 +1,218 @@
+"""
+Simulator - Vectorised Monte Carlo of the Cosmic Café economy
+
+Runs many simulated players at once as NumPy arrays (money, stock and a
+players x lenders debt matrix) under the rules in engine.py: the 10-50 gold
+sale, the NPC loans and purchases, repayments, an interest tick every
+`tick_every` actions, and the WIN (500 gold, no debt) / LOSE (debt > 500)
+checks. Strategies are vectorised too: they map the arrays to one action
+code per player.
+
+Finished players are compacted out of the arrays as the run goes on, so a
+turn only costs time for the players still playing.
+
+Run from the repo root:
+    python src/simulator.py                             # every strategy, 100k players
+    python src/simulator.py --players 1000000 --strategy saver
+    python src/simulator.py --no-start-debts --tick-every 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+import engine
+
+# ============ ACTION CODES ============
+
+SALE = ("Coffee Shop", "Generate a Sale")
+ACTIONS = [SALE] + list(engine.LOANS) + list(engine.PURCHASES) + \
+          [(menu, "Repay Debt") for menu in engine.REPAY]
+CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Debt matrix columns: the starting lenders plus everyone who lends in a menu
+LENDERS = list(dict.fromkeys(list(engine.START_DEBTS) +
+                             [lender for lender, _, _, _ in engine.LOANS.values()] +
+                             list(engine.REPAY.values())))
+COLUMN = {lender: i for i, lender in enumerate(LENDERS)}
+
+
+def _code(menu, option):
+    return CODES[(menu, option)]
+
+
+# ============ STRATEGIES ============
+# Each takes (money, stock, debts, rng) for the players still playing and
+# returns an int array of action codes.
+
+def saver(money, stock, debts, rng):
+    """Repay the costliest affordable debt, restock from the Farmer, else sell"""
+    codes = np.full(len(money), _code(*SALE))
+    codes[stock < engine.SALE_STOCK] = _code("Farmer", "Buy 5 Stock")
+    for menu in ("Banker", "Farmer", "Poultry", "Witch"):   # last assignment wins
+        debt = debts[:, COLUMN[engine.REPAY[menu]]]
+        codes[(debt > 0) & (debt <= money)] = _code(menu, "Repay Debt")
+    return codes
+
+
+def borrower(money, stock, debts, rng):
+    """Borrow stock on credit when out, clear debts once the cash covers them"""
+    codes = np.full(len(money), _code(*SALE))
+    total = debts.sum(axis=1)
+    can_clear = (total > 0) & (money >= total)
+    for menu in ("Banker", "Farmer", "Poultry", "Witch"):
+        codes[can_clear & (debts[:, COLUMN[engine.REPAY[menu]]] > 0)] = _code(menu, "Repay Debt")
+    codes[stock < engine.SALE_STOCK] = _code("Poultry", "Borrow 25 stock")
+    return codes
+
+
+def gambler(money, stock, debts, rng):
+    """Takes the Witch's 100 gold whenever cash runs low"""
+    codes = np.full(len(money), _code(*SALE))
+    codes[(money > 300) & (debts[:, COLUMN["Witch of Woe"]] > 0)] = _code("Witch", "Repay Debt")
+    codes[stock < engine.SALE_STOCK] = _code("Poultry", "Buy 10 Stock")
+    codes[money < 100] = _code("Witch", "Borrow 100 gold")
+    return codes
+
+
+def random_play(money, stock, debts, rng):
+    """Any menu option, sales three times as likely"""
+    choices = np.array([CODES[SALE]] * 2 + list(range(len(ACTIONS))))
+    return choices[rng.integers(0, len(choices), len(money))]
+
+
+STRATEGIES = {"saver": saver, "borrower": borrower, "gambler": gambler, "random": random_play}
+
+
+# ============ SIMULATION ============
+
+def _apply(codes, money, stock, debts, sale_roll, purchases):
+    """Apply one action code per player in place (engine.step rules)"""
+    for code in np.unique(codes):
+        menu, option = ACTIONS[code]
+        mask = codes == code
+        if code == CODES[SALE]:
+            ok = mask & (stock >= engine.SALE_STOCK)
+            money[ok] += sale_roll[ok]
+            stock[ok] -= engine.SALE_STOCK
+        elif (menu, option) in engine.LOANS:
+            lender, amount, rate, kind = engine.LOANS[(menu, option)]
+            debts[mask, COLUMN[lender]] += round(amount * (1 + rate), 2)
+            if kind == "gold":
+                money[mask] += amount
+            else:
+                stock[mask] += amount
+        elif (menu, option) in purchases:
+            amount, price = purchases[(menu, option)]
+            ok = mask & (money >= price)
+            money[ok] -= price
+            stock[ok] += amount
+        else:
+            col = COLUMN[engine.REPAY[menu]]
+            debt = debts[:, col]
+            ok = mask & (debt > 0) & (money >= debt)
+            money[ok] -= debt[ok]
+            debts[ok, col] = 0
+
+
+def simulate(strategy, players=100_000, turns=500, seed=0, tick_every=5,
+             rates=None, win_money=engine.WIN_MONEY, lose_debt=engine.LOSE_DEBT,
+             start_debts=None, start_money=engine.START_MONEY, start_stock=engine.START_STOCK,
+             sale_min=engine.SALE_MIN, sale_max=engine.SALE_MAX, purchases=None):
+    """
+    Simulate `players` independent games of one strategy
+
+    Args:
+        strategy: Name in STRATEGIES or a strategy function
+        players: Number of simulated players
+        turns: Actions per player before a game counts as still open
+        seed: NumPy seed (same seed, same results)
+        tick_every: Interest tick after every N actions (0 = never)
+        rates: Interest per tick by lender (default engine.INTEREST_RATES)
+        win_money, lose_debt: WIN / LOSE thresholds
+        start_debts, start_money, start_stock: Starting position (engine defaults)
+        sale_min, sale_max: Range of the sale roll (inclusive)
+        purchases: (menu, option) -> (stock, price) (default engine.PURCHASES)
+
+    Returns:
+        dict with win_rate, spiral_rate (LOSE), open_rate, time-to-win and
+        time-to-spiral stats (in actions) and the wall time
+    """
+    start = time.perf_counter()
+    policy = STRATEGIES[strategy] if isinstance(strategy, str) else strategy
+    rng = np.random.default_rng(seed)
+    rates = engine.INTEREST_RATES if rates is None else rates
+    growth = np.array([1 + rates.get(lender, 0) for lender in LENDERS])
+    start_debts = engine.START_DEBTS if start_debts is None else start_debts
+    purchases = engine.PURCHASES if purchases is None else purchases
+
+    money = np.full(players, float(start_money))
+    stock = np.full(players, float(start_stock))
+    debts = np.zeros((players, len(LENDERS)))
+    for lender, amount in start_debts.items():
+        debts[:, COLUMN[lender]] = amount
+    ids = np.arange(players)             # original player of each row
+
+    win_turn = np.full(players, -1)
+    lose_turn = np.full(players, -1)
+
+    for turn in range(1, turns + 1):
+        sale_roll = rng.integers(sale_min, sale_max + 1, len(money))
+        _apply(policy(money, stock, debts, rng), money, stock, debts, sale_roll, purchases)
+        if tick_every and turn % tick_every == 0:
+            debts = np.round(debts * growth, 2)
+
+        total = debts.sum(axis=1)
+        won = (money >= win_money) & (total == 0)
+        lost = ~won & (total > lose_debt)
+        done = won | lost
+        if done.any():
+            win_turn[ids[won]] = turn
+            lose_turn[ids[lost]] = turn
+            keep = ~done
+            money, stock, debts, ids = money[keep], stock[keep], debts[keep], ids[keep]
+            if not len(ids):
+                break
+
+    wins = win_turn[win_turn > 0]
+    losses = lose_turn[lose_turn > 0]
+
+    def stats(values):
+        if not len(values):
+            return None
+        return {"mean": round(float(values.mean()), 1), "p50": int(np.median(values)),
+                "p90": int(np.percentile(values, 90))}
+
+    return {
+        "players": players,
+        "win_rate": len(wins) / players,
+        "spiral_rate": len(losses) / players,
+        "open_rate": len(ids) / players,
+        "time_to_win": stats(wins),
+        "time_to_spiral": stats(losses),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--turns", type=int, default=500, help="actions per player")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick-every", type=int, default=5, help="interest tick every N actions")
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES), help="default all")
+    parser.add_argument("--no-start-debts", action="store_true", help="start with no debts")
+    args = parser.parse_args()
+
+    start_debts = {} if args.no_start_debts else None
+    print(f"{'strategy':10}{'win':>8}{'spiral':>8}{'open':>8}{'win p50':>9}{'spiral p50':>12}{'players/s':>13}")
+    for name in args.strategy or STRATEGIES:
+        r = simulate(name, args.players, args.turns, args.seed, args.tick_every, start_debts=start_debts)
+        win_p50 = r["time_to_win"]["p50"] if r["time_to_win"] else "-"
+        spiral_p50 = r["time_to_spiral"]["p50"] if r["time_to_spiral"] else "-"
+        print(f"{name:10}{r['win_rate']:>8.1%}{r['spiral_rate']:>8.1%}{r['open_rate']:>8.1%}"
+              f"{win_p50:>9}{spiral_p50:>12}{r['players'] / r['seconds']:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Session Snapshot - Compact binary save / restore of a running café session
+
+A snapshot is two files next to each other:
+
+    <path>              the session state: player (money, stock, debts,
+                        position), functions.game_state, the coffee shop
+                        metrics and the tracker's counters. Small, rewritten
+                        whole on every save (temp file + fsync + os.replace)
+    <path>.actions.<N>  the tracked actions, appended incrementally: a save
+                        only writes the actions logged since the last one
+
+The state records how many bytes of the actions file belong to it, so a
+crash half-way through an append (or before the state was replaced) leaves
+a consistent, slightly older session. When the actions file holds too many
+actions the tracker has already spilled, the next save writes the in-memory
+window to a new generation N instead and drops the old file once the new
+state is in place.
+
+Everything is encoded with struct, no pickle: a small tagged format for
+None / bool / int / float / str / list / dict (tuples become lists, other
+values their str()), little-endian, behind a magic and a format version.
+The state carries a CRC32.
+
+restore() rebuilds the session in place and catches up the debt interest
+for the time the kiosk was off (whole DEBT_UPDATE_INTERVAL periods, at the
+phase the interval was in when the snapshot was taken). The catch-up stops
+at the tick that turns the game into a LOSE, so a snapshot left for days
+ends the game instead of compounding for thousands of ticks.
+"""
+import os
+import struct
+import time
+import zlib
+
+from engine import LOSE_DEBT, debt_ledger
+
+MAGIC = b"CCSNAP"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<6sHI")     # magic, version, crc32 of the payload
+_RECORD = struct.Struct("<dI")       # action timestamp, payload length
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+
+# ============ VALUE ENCODING ============
+
+def _encode(value, out):
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+        out += b"i" + _I64.pack(value)
+    elif isinstance(value, float):
+        out += b"f" + _F64.pack(value)
+    elif isinstance(value, (list, tuple)):
+        out += b"l" + _U32.pack(len(value))
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out += b"d" + _U32.pack(len(value))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    else:
+        data = (value if isinstance(value, str) else str(value)).encode()
+        out += b"s" + _U32.pack(len(data)) + data
+
+
+def encode(value):
+    """bytes for a value built from None / bool / int / float / str / list / dict"""
+    out = bytearray()
+    _encode(value, out)
+    return bytes(out)
+
+
+def _decode(data, pos):
+    tag = data[pos]
+    pos += 1
+    if tag == 0x4E:    # N
+        return None, pos
+    if tag == 0x54:    # T
+        return True, pos
+    if tag == 0x46:    # F
+        return False, pos
+    if tag == 0x69:    # i
+        return _I64.unpack_from(data, pos)[0], pos + 8
+    if tag == 0x66:    # f
+        return _F64.unpack_from(data, pos)[0], pos + 8
+    if tag == 0x73:    # s
+        size = _U32.unpack_from(data, pos)[0]
+        pos += 4
+        return data[pos:pos + size].decode(), pos + size
+    if tag == 0x6C:    # l
+        count = _U32.unpack_from(data, pos)[0]
+        pos += 4
+        items = []
+        for _ in range(count):
+            item, pos = _decode(data, pos)
+            items.append(item)
+        return items, pos
+    if tag == 0x64:    # d
+        count = _U32.unpack_from(data, pos)[0]
+        pos += 4
+        result = {}
+        for _ in range(count):
+            key, pos = _decode(data, pos)
+            result[key], pos = _decode(data, pos)
+        return result, pos
+    raise ValueError(f"bad snapshot value tag {tag!r} at byte {pos - 1}")
+
+
+def decode(data):
+    value, pos = _decode(data, 0)
+    if pos != len(data):
+        raise ValueError(f"{len(data) - pos} trailing bytes after snapshot value")
+    return value
+
+
+# ============ FILES ============
+
+def _write_atomic(path, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_state(path):
+    """The decoded state dict of a snapshot, or None when there is none"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is too short to be a snapshot")
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a session snapshot")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"{path} is snapshot version {version}, newer than {FORMAT_VERSION}")
+    payload = data[_HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        raise ValueError(f"{path} failed its checksum")
+    return decode(payload)
+
+
+def read_actions(path, size):
+    """Yield (timestamp, action_type, details) from the first `size` bytes of an actions file"""
+    with open(path, "rb") as f:
+        data = f.read(size)
+    pos = 0
+    while pos + _RECORD.size <= len(data):
+        timestamp, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        action_type, details = decode(data[pos:pos + length])
+        pos += length
+        yield timestamp, action_type, details
+
+
+class SessionSnapshot:
+    """Saves / restores one session (player + game state + shop + tracker) at `path`"""
+
+    def __init__(self, path, tracker, compact_after=None):
+        """
+        Args:
+            path: State file path (the actions files sit next to it)
+            tracker: The ActionTracker whose actions are saved incrementally
+            compact_after: Spilled actions tolerated in the actions file before
+                it is rewritten (default: the tracker's max_actions, or never)
+        """
+        self.path = path
+        self.tracker = tracker
+        self.compact_after = compact_after if compact_after is not None else tracker.max_actions
+
+        self.generation = 0      # N of the current <path>.actions.N
+        self.first = 0           # absolute index of the first action in that file
+        self.written = 0         # absolute index after the last action written
+        self.size = 0            # committed bytes of the actions file
+        self.spilled = None      # tracker counters of the actions before `first`
+
+    def actions_path(self, generation=None):
+        return f"{self.path}.actions.{self.generation if generation is None else generation}"
+
+    # ---------- save ----------
+    def _append_actions(self, path, start, mode):
+        """Write tracker actions [start, end) to `path`; returns the bytes written"""
+        tracker = self.tracker
+        names, types, timestamps, details = (tracker._type_names, tracker._types,
+                                             tracker._timestamps, tracker._details)
+        out = bytearray()
+        for pos in range(start - tracker._base, len(types)):
+            payload = encode((names[types[pos]], details[pos]))
+            out += _RECORD.pack(timestamps[pos], len(payload)) + payload
+        with open(path, mode) as f:
+            if mode == "r+b":
+                f.seek(self.size)
+                f.truncate()     # drop a torn append left by a crash
+            f.write(out)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(out)
+
+    def save(self, player, game_state, shop=None, debt_elapsed=0, now=None):
+        """
+        Write the session: new actions first, then the state that commits them
+
+        Args:
+            debt_elapsed: Seconds into the current debt interval (carried over
+                so restore() keeps accruing at the same phase)
+        """
+        tracker = self.tracker
+        end = tracker._base + len(tracker._types)
+        old_path = None
+        if self.size == 0 or self.written < tracker._base or (
+                self.compact_after is not None and tracker._base - self.first > self.compact_after):
+            # start a new generation holding just the in-memory window
+            if self.size:
+                old_path = self.actions_path()
+                self.generation += 1
+            self.first = tracker._base
+            self.spilled = dict(tracker._spilled)
+            self.size = self._append_actions(self.actions_path(), self.first, "wb")
+        elif self.written < end:
+            self.size += self._append_actions(self.actions_path(), self.written, "r+b")
+        self.written = end
+
+        state = {
+            "saved_at": time.time() if now is None else now,
+            "debt_elapsed": debt_elapsed,
+            "player": {
+                "money": player.money,
+                "stock": player.stock,
+                "debts": player.debts,
+                "pos": player.rect.center,
+            },
+            "game": {
+                "tutorial_shown": game_state.tutorial_shown,
+                "days_passed": game_state.days_passed,
+                "outcome": game_state.outcome,
+            },
+            "shop": None if shop is None else {
+                "daily_sales": shop.daily_sales,
+                "customer_satisfaction": shop.customer_satisfaction,
+                "reputation": shop.reputation,
+                "player_inventory": shop.player_inventory,
+            },
+            "tracker": {
+                "session_start": tracker.session_start,
+                "spilled": self.spilled,
+                "generation": self.generation,
+                "first": self.first,
+                "count": end - self.first,
+                "size": self.size,
+            },
+        }
+        payload = encode(state)
+        _write_atomic(self.path, _HEADER.pack(MAGIC, FORMAT_VERSION, zlib.crc32(payload)) + payload)
+        if old_path is not None and os.path.exists(old_path):
+            os.remove(old_path)
+        return len(payload) + self.size
+
+    # ---------- restore ----------
+    def restore(self, player, game_state, shop=None, now=None, interval=30):
+        """
+        Rebuild the saved session into `player`, `game_state`, `shop` and the
+        (empty) tracker, then apply the interest ticks missed while offline.
+        Everything is read and computed before anything is changed, so a
+        snapshot that fails to load leaves the session as it was.
+
+        Returns:
+            None without a snapshot, else a dict with "offline" seconds,
+            interest "periods" applied and "debt_elapsed" (seconds into the
+            current interval, to restart the debt timer from)
+        """
+        state = read_state(self.path)
+        if state is None:
+            return None
+        saved_player, game, shop_state, saved = state["player"], state["game"], state["shop"], state["tracker"]
+        actions = list(read_actions(self.actions_path(saved["generation"]), saved["size"]))
+
+        # interest for the time the session was offline, at the saved phase
+        now = time.time() if now is None else now
+        offline = max(0.0, now - state["saved_at"])
+        elapsed = state["debt_elapsed"] + offline
+        periods = int(elapsed // interval)
+        debts, applied = catch_up(saved_player["debts"], periods, game["outcome"])
+        debt_elapsed = elapsed - periods * interval if applied == periods else 0.0
+
+        player.money = saved_player["money"]
+        player.stock = saved_player["stock"]
+        player.debts = debts
+        player.rect.center = tuple(saved_player["pos"])
+
+        game_state.tutorial_shown = game["tutorial_shown"]
+        game_state.days_passed = game["days_passed"]
+        game_state.reset_outcome(player)
+        game_state.outcome = game["outcome"]
+
+        if shop is not None and shop_state is not None:
+            shop.daily_sales = shop_state["daily_sales"]
+            shop.customer_satisfaction = shop_state["customer_satisfaction"]
+            shop.reputation = shop_state["reputation"]
+            shop.player_inventory = dict(shop_state["player_inventory"])
+
+        tracker = self.tracker
+        tracker.session_start = saved["session_start"]
+        tracker._base = saved["first"]
+        tracker._spilled = dict(saved["spilled"])
+        tracker._summary = dict(saved["spilled"])
+        append = tracker._append
+        for timestamp, action_type, details in actions:
+            append(action_type, details, timestamp)
+
+        self.generation = saved["generation"]
+        self.first = saved["first"]
+        self.size = saved["size"]
+        self.spilled = saved["spilled"]
+        self.written = self.first + saved["count"]
+        return {"offline": offline, "periods": applied, "debt_elapsed": debt_elapsed}
+
+
+def catch_up(debts, periods, outcome="PLAYING"):
+    """
+    `debts` after up to `periods` offline interest ticks, stopping at the
+    tick that first pushes the total past LOSE_DEBT (the game is over from
+    there on, however long the kiosk stayed off)
+
+    Returns:
+        (new debts dict, ticks applied)
+    """
+    debts = dict(debts)
+    if not periods or outcome != "PLAYING" or sum(debts.values()) > LOSE_DEBT:
+        return debts, 0
+    ledger = debt_ledger(debts)   # balances after any number of ticks, in closed form
+    if ledger.total(now=periods) <= LOSE_DEBT:
+        return ledger.balances(now=periods), periods
+    low, high = 0, periods   # still PLAYING after `low` ticks, LOSE after `high`
+    while high - low > 1:
+        mid = (low + high) // 2
+        if ledger.total(now=mid) > LOSE_DEBT:
+            high = mid
+        else:
+            low = mid
+    return ledger.balances(now=high), high
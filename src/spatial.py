@@ -0,0 +1,139 @@
+"""
+Spatial Hash - Uniform grid for "what is near here?" queries
+
+The world is cut into square cells of `cell_size` pixels; every entity is
+listed in each cell its rect overlaps. A query only looks at the cells it
+touches, so it costs O(nearby entities) instead of O(all entities):
+
+    query_radius(x, y, r)   entities whose centre is within r of (x, y),
+                            compared as squared distances (no sqrt)
+    query_point(x, y)       entities whose rect contains the point
+    query_rect(rect)        entities whose rect overlaps rect
+
+Entities are any hashable object (sprites, names, ...) with a rect given
+as a pygame.Rect or (x, y, w, h). Moving entities call move() with their
+new rect; it only touches the cell lists when the entity changed cells.
+
+Used by the café world (UI.check_proximity) and the CredCity hub.
+"""
+
+
+class SpatialHash:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}      # (cx, cy) -> set of entities
+        self.entries = {}    # entity -> (left, top, right, bottom, centerx, centery, cell range)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, entity):
+        return entity in self.entries
+
+    def _cell_range(self, left, top, right, bottom):
+        size = self.cell_size
+        return (int(left // size), int(top // size), int((right - 1) // size), int((bottom - 1) // size))
+
+    @staticmethod
+    def _bounds(rect):
+        x, y, w, h = rect
+        w, h = max(w, 1), max(h, 1)   # zero-size rects still occupy their cell
+        return x, y, x + w, y + h
+
+    # ---------- changes ----------
+    def insert(self, entity, rect):
+        if entity in self.entries:
+            self.move(entity, rect)
+            return
+        left, top, right, bottom = self._bounds(rect)
+        cell_range = self._cell_range(left, top, right, bottom)
+        self.entries[entity] = (left, top, right, bottom, (left + right) // 2, (top + bottom) // 2, cell_range)
+        self._link(entity, cell_range)
+
+    def move(self, entity, rect):
+        """Update an entity's rect (inserts it when it is new)"""
+        entry = self.entries.get(entity)
+        if entry is None:
+            self.insert(entity, rect)
+            return
+        left, top, right, bottom = self._bounds(rect)
+        cell_range = self._cell_range(left, top, right, bottom)
+        self.entries[entity] = (left, top, right, bottom, (left + right) // 2, (top + bottom) // 2, cell_range)
+        if cell_range != entry[6]:
+            self._unlink(entity, entry[6])
+            self._link(entity, cell_range)
+
+    def remove(self, entity):
+        entry = self.entries.pop(entity, None)
+        if entry is not None:
+            self._unlink(entity, entry[6])
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def _link(self, entity, cell_range):
+        cells = self.cells
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = set()
+                bucket.add(entity)
+
+    def _unlink(self, entity, cell_range):
+        cells = self.cells
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells[(cx, cy)]
+                bucket.discard(entity)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    # ---------- queries ----------
+    def _candidates(self, left, top, right, bottom):
+        """Entities listed in the cells overlapping the box (each once)"""
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def query_radius(self, x, y, radius):
+        """[(entity, squared distance)] for entities whose centre is within `radius`, nearest first"""
+        limit = radius * radius
+        entries = self.entries
+        found = []
+        for entity in self._candidates(x - radius, y - radius, x + radius + 1, y + radius + 1):
+            entry = entries[entity]
+            dx, dy = entry[4] - x, entry[5] - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= limit:
+                found.append((entity, dist_sq))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def query_point(self, x, y):
+        """Entities whose rect contains (x, y)"""
+        entries = self.entries
+        return [entity for entity in self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+                if entries[entity][0] <= x < entries[entity][2] and entries[entity][1] <= y < entries[entity][3]]
+
+    def query_rect(self, rect):
+        """Entities whose rect overlaps `rect`"""
+        left, top, right, bottom = self._bounds(rect)
+        entries = self.entries
+        found = []
+        for entity in self._candidates(left, top, right, bottom):
+            entry = entries[entity]
+            if entry[0] < right and left < entry[2] and entry[1] < bottom and top < entry[3]:
+                found.append(entity)
+        return found
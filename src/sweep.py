@@ -0,0 +1,173 @@
+"""
+Sweep - Parameter grid runner for tuning the Cosmic Café economy
+
+Runs simulator.simulate() for every point of a parameter grid (the
+Wizard's start debt, interest rates per tick, the interest interval, the
+sale range and the stock price) and strategy, spread over a process pool.
+Results are appended to a CSV file as they finish, one row per (point,
+strategy), so a sweep can be stopped at any time: running the same command
+again skips the rows that are already in the file (a torn last line is
+dropped first).
+
+Each point gets a seed derived from its parameters, so a resumed or
+re-ordered sweep gives the same numbers.
+
+Run from the repo root:
+    python src/sweep.py                                  # default 10k-point grid
+    python src/sweep.py --out sweep.csv --workers 8
+    python src/sweep.py --grid rate_wizard=0.1,0.25 --grid tick_every=3,5,10 --players 5000
+    python src/sweep.py --grid start_wizard=0,50         # with the game's unpayable start debt
+"""
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import time
+import zlib
+
+import engine
+import simulator
+
+# Parameter -> values swept by default (5 * 5 * 5 * 4 * 4 * 5 = 10,000 points)
+GRID = {
+    # the Wizard of Woe start debt: no menu repays it, so anything above 0 rules out a WIN
+    "start_wizard": [0],
+    "rate_banker": [0.0, 0.02, 0.04, 0.06, 0.08],
+    "rate_poultry": [0.0, 0.05, 0.10, 0.15, 0.20],
+    "rate_wizard": [0.0, 0.05, 0.10, 0.25, 0.40],
+    "tick_every": [3, 5, 10, 20],            # actions per interest tick (DEBT_UPDATE_INTERVAL)
+    "sale_max": [30, 40, 50, 60],            # sale roll is 10..sale_max
+    "price_scale": [0.5, 0.75, 1.0, 1.5, 2.0],  # multiplies the stock prices
+}
+
+RESULT_COLUMNS = ["win_rate", "spiral_rate", "open_rate",
+                  "win_p50", "win_p90", "spiral_p50", "spiral_p90", "seconds"]
+
+
+def point_kwargs(point):
+    """simulate() keyword arguments for one grid point"""
+    rates = dict(engine.INTEREST_RATES)
+    rates["Banker Bard"] = point.get("rate_banker", rates["Banker Bard"])
+    rates["Poultry Guy Pip"] = point.get("rate_poultry", rates.get("Poultry Guy Pip", 0))
+    rates["Wizard of Woe"] = point.get("rate_wizard", rates["Wizard of Woe"])
+    start_debts = dict(engine.START_DEBTS)
+    start_debts["Wizard of Woe"] = point.get("start_wizard", start_debts["Wizard of Woe"])
+    scale = point.get("price_scale", 1.0)
+    return {
+        "rates": rates,
+        "start_debts": {lender: amount for lender, amount in start_debts.items() if amount},
+        "tick_every": int(point.get("tick_every", 5)),
+        "sale_min": int(point.get("sale_min", engine.SALE_MIN)),
+        "sale_max": int(point.get("sale_max", engine.SALE_MAX)),
+        "purchases": {key: (stock, round(price * scale, 2))
+                      for key, (stock, price) in engine.PURCHASES.items()},
+    }
+
+
+def row_key(values, strategy):
+    """Identity of a result row: the parameter values as written in the CSV + strategy"""
+    return tuple(str(v) for v in values) + (strategy,)
+
+
+def run_point(task):
+    """Worker: simulate one (point, strategy); returns the CSV row"""
+    names, values, strategy, players, turns = task
+    point = dict(zip(names, values))
+    seed = zlib.crc32(repr(row_key(values, strategy)).encode())
+    r = simulator.simulate(strategy, players, turns, seed, **point_kwargs(point))
+    win = r["time_to_win"] or {}
+    spiral = r["time_to_spiral"] or {}
+    return list(values) + [strategy,
+                           round(r["win_rate"], 5), round(r["spiral_rate"], 5), round(r["open_rate"], 5),
+                           win.get("p50", ""), win.get("p90", ""),
+                           spiral.get("p50", ""), spiral.get("p90", ""),
+                           round(r["seconds"], 4)]
+
+
+def _repair_tail(path):
+    """Cut a partially written last line (interrupted run) off the file"""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def read_done(path, header):
+    """Row keys already in `path` (empty if the file is new)"""
+    if not os.path.exists(path):
+        return set()
+    _repair_tail(path)
+    with open(path, newline="") as f:
+        rows = csv.reader(f)
+        existing = next(rows, None)
+        if existing is None:
+            return set()
+        if existing != header:
+            raise SystemExit(f"{path} has different columns; use another --out")
+        n = len(header)
+        split = header.index("strategy")
+        return {row_key(row[:split], row[split]) for row in rows if len(row) == n}
+
+
+def parse_grid(specs):
+    """--grid name=v1,v2 overrides on top of GRID"""
+    grid = dict(GRID)
+    for spec in specs or ():
+        name, _, values = spec.partition("=")
+        grid[name] = [int(v) if v.lstrip("-").isdigit() else float(v) for v in values.split(",")]
+    return grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default="sweep.csv", help="CSV file (appended to / resumed)")
+    parser.add_argument("--grid", action="append", help="name=v1,v2,... (overrides a GRID axis)")
+    parser.add_argument("--strategy", action="append", choices=sorted(simulator.STRATEGIES),
+                        help="strategies per point (default saver and borrower)")
+    parser.add_argument("--players", type=int, default=1000, help="simulated players per point")
+    parser.add_argument("--turns", type=int, default=300, help="actions per player")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes")
+    parser.add_argument("--limit", type=int, help="stop after this many new rows")
+    args = parser.parse_args()
+
+    grid = parse_grid(args.grid)
+    names = list(grid)
+    strategies = args.strategy or ["saver", "borrower"]
+    header = names + ["strategy"] + RESULT_COLUMNS
+
+    done = read_done(args.out, header)
+    tasks = [(names, values, strategy, args.players, args.turns)
+             for values in itertools.product(*grid.values())
+             for strategy in strategies
+             if row_key(values, strategy) not in done]
+    total = len(tasks) + len(done)
+    if args.limit is not None:
+        tasks = tasks[:args.limit]
+    print(f"{total:,} rows in the grid, {len(done):,} already in {args.out}, "
+          f"{len(tasks):,} to run on {args.workers} workers")
+    if not tasks:
+        return
+
+    new_file = not os.path.exists(args.out) or os.path.getsize(args.out) == 0
+    start = time.perf_counter()
+    last_flush = start
+    with open(args.out, "a", newline="") as f, multiprocessing.Pool(args.workers) as pool:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(header)
+        chunksize = max(1, min(32, len(tasks) // (args.workers * 8)))
+        for n, row in enumerate(pool.imap_unordered(run_point, tasks, chunksize), 1):
+            writer.writerow(row)
+            now = time.perf_counter()
+            if now - last_flush >= 1.0 or n == len(tasks):
+                f.flush()
+                last_flush = now
+                rate = n / (now - start)
+                print(f"\r{n:,}/{len(tasks):,} rows  {rate:,.1f} rows/s  "
+                      f"eta {(len(tasks) - n) / rate:,.0f} s", end="", flush=True)
+    print(f"\nDone in {time.perf_counter() - start:,.1f} s → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import pygame
-from pygame_emojis import load_emoji
+from emoji_atlas import Icons, get_atlas, render_text, text_width
 from settings import WHITE, GOLD, RED, PURPLE, BLUE, FONT_NAME, GRAY, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT
 
+PANEL_KEY = (255, 0, 255)  # transparent corners of the pre-rendered panels
+
+
 class UI:
     def __init__(self, screen):
         self.screen = screen
@@ -49,71 +52,87 @@ class UI:
         self.popup_buttons = []
         self.showing_popup = False
         self.popup_button_rects = []
-        
-        # Load emojis
-        EMOJI_SIZE = (24, 24)
-        self.emojis = {
-            "gold": load_emoji("💰", EMOJI_SIZE),
-            "debt": load_emoji("💸", EMOJI_SIZE),
-            "witch": load_emoji("🧙", EMOJI_SIZE),
-            "banker": load_emoji("🏦", EMOJI_SIZE),
-            "poultry": load_emoji("🐔", EMOJI_SIZE),
-            "check": load_emoji("✅", EMOJI_SIZE),
-            "stock": load_emoji("🛒", EMOJI_SIZE),
-        }
-
-    def draw_left_panel(self, player, characters, coffee_shop):
-        """Draw the left panel with stats"""
-        pygame.draw.rect(self.screen, self.bg_color, 
-                        (self.left_panel_x, self.left_panel_y, self.left_panel_width, self.left_panel_height), 
-                        border_radius=12)
-        pygame.draw.rect(self.screen, self.border_color, 
-                        (self.left_panel_x, self.left_panel_y, self.left_panel_width, self.left_panel_height), 
-                        width=2, border_radius=12)
 
-        y_offset = self.left_panel_y + 20
-        title_text = self.title_font.render("Café Finances", True, WHITE)
-        self.screen.blit(title_text, (self.left_panel_x + 15, y_offset))
-        y_offset += 40
-
-        pygame.draw.line(self.screen, self.border_color, 
-                        (self.left_panel_x + 15, y_offset), 
-                        (self.left_panel_x + self.left_panel_width - 15, y_offset), 1)
-        y_offset += 20
-
-        # Gold
-        self.screen.blit(self.emojis["gold"], (self.left_panel_x + 15, y_offset))
-        money_text = self.font.render(f"Gold: {int(player.money)}", True, GOLD)
-        self.screen.blit(money_text, (self.left_panel_x + 50, y_offset))
-        y_offset += 30
+        # Retained-mode panels: the chrome is baked into a surface once and a
+        # panel is only recomposed when one of the values it shows changes
+        self._labels = {}            # (font, text, color) -> rendered Surface
+        self._left_chrome = None     # background, border, title, rule, emojis
+        self._left_panel = None      # (shown values, composed Surface)
+        self._status_chrome = None   # bar background + top line
+        self._status_hint = None     # the static "Move: ... | Click to interact" text
+        self._status_pos = None      # (player position, rendered "Pos: (x, y)")
+        self._overlay = None         # translucent full-screen popup backdrop
+        self._popup = None           # (title, text, buttons), panel Surface, pos, button rects
+        self._wrap_cache = {}        # (font, text, width) -> wrapped lines
+        
+        # Emojis come from the shared atlas, each loaded the first time it is drawn
+        EMOJI_SIZE = 24
+        self.emojis = Icons(get_atlas(EMOJI_SIZE), {
+            "gold": "💰",
+            "debt": "💸",
+            "witch": "🧙",
+            "banker": "🏦",
+            "poultry": "🐔",
+            "check": "✅",
+            "stock": "🛒",
+        })
+
+    # ---------- retained panels ----------
+    def _label(self, font, text, color):
+        """font.render(text), cached (labels repeat: values go up and down)"""
+        key = (font, text, color)
+        surface = self._labels.get(key)
+        if surface is None:
+            if len(self._labels) >= 512:
+                self._labels.clear()
+            surface = self._labels[key] = font.render(text, True, color)
+        return surface
+
+    def _build_left_chrome(self):
+        """The parts of the left panel that never change"""
+        w, h = self.left_panel_width, self.left_panel_height
+        chrome = pygame.Surface((w, h))
+        chrome.fill(PANEL_KEY)
+        pygame.draw.rect(chrome, self.bg_color, (0, 0, w, h), border_radius=12)
+        pygame.draw.rect(chrome, self.border_color, (0, 0, w, h), width=2, border_radius=12)
+        chrome.blit(self.title_font.render("Café Finances", True, WHITE), (15, 20))
+        pygame.draw.line(chrome, self.border_color, (15, 60), (w - 15, 60), 1)
+        for row, emoji in enumerate(("gold", "stock", "debt")):
+            chrome.blit(self.emojis[emoji], (15, 80 + 30 * row))
+        return chrome
+
+    def _compose_left_panel(self, money, stock, total_debt, in_debt, debts):
+        if self._left_chrome is None:
+            self._left_chrome = self._build_left_chrome()
+        panel = self._left_chrome.copy()
+        panel.blit(self._label(self.font, f"Gold: {money}", GOLD), (50, 80))
+        panel.blit(self._label(self.font, f"Stock: {stock}", (255, 100, 100)), (50, 110))  # red-ish
+        debt_color = RED if in_debt else (100, 200, 100)
+        panel.blit(self._label(self.font, f"Debt: {total_debt}", debt_color), (50, 140))
 
-        # Stock
-        self.screen.blit(self.emojis["stock"], (self.left_panel_x + 15, y_offset))
-        stock_text = self.font.render(f"Stock: {int(player.stock)}", True, (255, 100, 100))  # red-ish
-        self.screen.blit(stock_text, (self.left_panel_x + 50, y_offset))
-        y_offset += 30
+        # Individual debts
+        if debts is not None:
+            panel.blit(self._label(self.small_font, "Debts:", WHITE), (15, 170))
+            y_offset = 190
+            for display_name, amount in debts:
+                panel.blit(self._label(self.small_font, f"{display_name}: {amount}", GOLD), (15, y_offset))
+                y_offset += 20
+        # opaque + colorkeyed rounded corners: an RLE blit is several times cheaper than per-pixel alpha
+        panel.set_colorkey(PANEL_KEY, pygame.RLEACCEL)
+        return panel
 
-        # Total Debt
+    def draw_left_panel(self, player, characters, coffee_shop):
+        """Draw the left panel with stats (recomposed only when a shown value changes)"""
         total_debt = sum(player.debts.values()) if player.debts else 0
-        debt_color = RED if total_debt > 0 else (100, 200, 100)
-        self.screen.blit(self.emojis["debt"], (self.left_panel_x + 15, y_offset))
-        debt_text = self.font.render(f"Debt: {int(total_debt)}", True, debt_color)
-        self.screen.blit(debt_text, (self.left_panel_x + 50, y_offset))
-        y_offset += 30
-
-        # Individual debts
+        debts = None
         if player.debts:
-            debt_title = self.small_font.render("Debts:", True, WHITE)
-            self.screen.blit(debt_title, (self.left_panel_x + 15, y_offset))
-            y_offset += 20
-            for lender, amount in player.debts.items():
-                if amount > 0:
-                    prefix = lender.split()[0]
-                    display_name = prefix[:10]
-                    text_surface = self.small_font.render(f"{display_name}: {int(amount)}", True, GOLD)
-                    self.screen.blit(text_surface, (self.left_panel_x + 15, y_offset))
-                    y_offset += 20
-        
+            debts = tuple((lender.split()[0][:10], int(amount))
+                          for lender, amount in player.debts.items() if amount > 0)
+        shown = (int(player.money), int(player.stock), int(total_debt), total_debt > 0, debts)
+        if self._left_panel is None or self._left_panel[0] != shown:
+            self._left_panel = (shown, self._compose_left_panel(*shown))
+        self.screen.blit(self._left_panel[1], (self.left_panel_x, self.left_panel_y))
+
     def get_npc_icon(self, name):
         if "Farmer" in name:
             return "🌾"
@@ -169,31 +188,47 @@ class UI:
     def draw_status_bar(self, player):
         bar_height = 30
         bar_y = self.screen_height - bar_height
-        pygame.draw.rect(self.screen, self.bg_color, (0, bar_y, self.screen_width, bar_height))
-        pygame.draw.line(self.screen, self.border_color, (0, bar_y), (self.screen_width, bar_y), 2)
-        status_text = f"Pos: ({player.rect.centerx}, {player.rect.centery}) | Move: WASD/Arrows | Click to interact"
-        text = self.small_font.render(status_text, True, WHITE)
+        pos = player.rect.center
+        if self._status_chrome is None:
+            chrome = pygame.Surface((self.screen_width, bar_height))
+            chrome.fill(self.bg_color)
+            pygame.draw.line(chrome, self.border_color, (0, 0), (self.screen_width, 0), 2)
+            self._status_chrome = chrome
+            self._status_hint = self.small_font.render(" | Move: WASD/Arrows | Click to interact", True, WHITE)
+        if self._status_pos is None or self._status_pos[0] != pos:
+            self._status_pos = (pos, self.small_font.render(f"Pos: ({pos[0]}, {pos[1]})", True, WHITE))
+
+        self.screen.blit(self._status_chrome, (0, bar_y))
+        text = self._status_pos[1]
         self.screen.blit(text, (10, bar_y + 8))
+        self.screen.blit(self._status_hint, (10 + text.get_width(), bar_y + 8))
 
-    def check_proximity(self, player, npcs, coffee_shop):
-        proximity_distance = 150
-        nearby_entities = []
-
-        if coffee_shop and hasattr(coffee_shop, 'rect'):
-            distance = ((coffee_shop.rect.centerx - player.rect.centerx) ** 2 +
-                        (coffee_shop.rect.centery - player.rect.centery) ** 2) ** 0.5
-            if distance <= proximity_distance:
-                nearby_entities.append(("Coffee Shop", coffee_shop, distance))
+    def check_proximity(self, player, npcs, coffee_shop, world=None):
+        """
+        [(name, entity, distance)] within reach of the player, nearest first
 
-        if npcs:
-            for npc in npcs:
-                if hasattr(npc, 'rect'):
-                    distance = ((npc.rect.centerx - player.rect.centerx) ** 2 +
-                                (npc.rect.centery - player.rect.centery) ** 2) ** 0.5
-                    if distance <= proximity_distance:
-                        nearby_entities.append((npc.name, npc, distance))
+        With `world` (a spatial.SpatialHash of the coffee shop and NPCs) only
+        the grid cells around the player are looked at; otherwise every
+        entity is checked. Distances are compared squared; the square root is
+        only taken for the entities that are shown.
+        """
+        proximity_distance = 150
+        x, y = player.rect.center
 
-        return nearby_entities
+        if world is not None:
+            found = world.query_radius(x, y, proximity_distance)
+        else:
+            limit = proximity_distance * proximity_distance
+            found = []
+            for entity in ([coffee_shop] if coffee_shop else []) + list(npcs or ()):
+                if hasattr(entity, 'rect'):
+                    dx, dy = entity.rect.centerx - x, entity.rect.centery - y
+                    if dx * dx + dy * dy <= limit:
+                        found.append((entity, dx * dx + dy * dy))
+            found.sort(key=lambda item: item[1])
+
+        return [("Coffee Shop" if entity is coffee_shop else entity.name, entity, dist_sq ** 0.5)
+                for entity, dist_sq in found]
 
     def draw_right_panel(self, nearby_entities):
         if not nearby_entities:
@@ -338,80 +373,108 @@ class UI:
             self.menu_rects.append((rect, option))
             y_offset += 45
 
-    def draw_popup(self):
-        """Draw the popup with description and buttons"""
-        if not self.showing_popup:
-            return
-
+    def wrap_text(self, text, max_width, font=None):
+        """
+        Lines of `text` that fit in `max_width` px, keeping its newlines
+        (blank lines stay blank); cached per (text, width)
+        """
+        font = font or self.font
+        key = (font, text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        lines = []
+        for paragraph in text.split("\n"):
+            current_line = ""
+            for word in paragraph.split():
+                test_line = current_line + " " + word if current_line else word
+                if text_width(font, test_line) > max_width and current_line:
+                    lines.append(current_line)
+                    current_line = word
+                else:
+                    current_line = test_line
+            lines.append(current_line)
+        while lines and not lines[-1]:
+            lines.pop()
+        if len(self._wrap_cache) >= 128:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = lines
+        return lines
+
+    def _build_popup(self):
+        """Pre-render the popup panel (title, wrapped text, buttons); returns (surface, pos, button rects)"""
+        margin = 20
+        line_height = 25
         panel_width = 500
-        panel_height = 400
+        lines = self.wrap_text(self.popup_description, panel_width - 2 * margin)
+        # grow with the text (newlines add lines), up to the screen
+        panel_height = min(self.screen_height - 40, max(400, 60 + line_height * len(lines) + 100))
         panel_x = (self.screen_width - panel_width) // 2
         panel_y = (self.screen_height - panel_height) // 2
 
-        # Dark overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        # Panel background
-        pygame.draw.rect(self.screen, self.bg_color, (panel_x, panel_y, panel_width, panel_height), border_radius=12)
-        pygame.draw.rect(self.screen, self.border_color, (panel_x, panel_y, panel_width, panel_height), width=3, border_radius=12)
+        panel = pygame.Surface((panel_width, panel_height))
+        panel.fill(PANEL_KEY)
+        pygame.draw.rect(panel, self.bg_color, (0, 0, panel_width, panel_height), border_radius=12)
+        pygame.draw.rect(panel, self.border_color, (0, 0, panel_width, panel_height), width=3, border_radius=12)
 
         # Title
-        title_surface = self.title_font.render(self.popup_title, True, WHITE)
-        self.screen.blit(title_surface, (panel_x + 20, panel_y + 15))
+        panel.blit(render_text(self.title_font, self.popup_title, WHITE), (20, 15))
 
         # Description (wrapped text)
-        description_y = panel_y + 60
-        margin = 20
-        max_width = panel_width - (2 * margin)
-        
-        words = self.popup_description.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            text_width = self.font.size(test_line)[0]
-            if text_width > max_width:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-            else:
-                current_line = test_line
-        if current_line:
-            lines.append(current_line)
-
+        description_y = 60
+        text_bottom = panel_height - 90
         for line in lines:
-            text_surface = self.font.render(line, True, WHITE)
-            self.screen.blit(text_surface, (panel_x + margin, description_y))
-            description_y += 25
+            if description_y + line_height > text_bottom:
+                break
+            if line:
+                panel.blit(render_text(self.font, line, WHITE), (margin, description_y))
+            description_y += line_height
 
         # Buttons
-        button_y = panel_y + panel_height - 80
-        self.popup_button_rects = []
+        button_y = panel_height - 80
+        button_rects = []
         button_width = 120
         button_height = 40
         button_spacing = 15
         total_width = (button_width * len(self.popup_buttons)) + (button_spacing * (len(self.popup_buttons) - 1))
-        start_x = panel_x + (panel_width - total_width) // 2
+        start_x = (panel_width - total_width) // 2
 
         for i, (button_text, action) in enumerate(self.popup_buttons):
             x = start_x + (i * (button_width + button_spacing))
             rect = pygame.Rect(x, button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, self.button_color, rect, border_radius=8)
-            pygame.draw.rect(self.screen, self.border_color, rect, width=2, border_radius=8)
+            pygame.draw.rect(panel, self.button_color, rect, border_radius=8)
+            pygame.draw.rect(panel, self.border_color, rect, width=2, border_radius=8)
             text_surface = self.small_font.render(button_text, True, WHITE)
-            text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
-            self.popup_button_rects.append((rect, button_text))
+            panel.blit(text_surface, text_surface.get_rect(center=rect.center))
+            button_rects.append((rect.move(panel_x, panel_y), button_text))
+
+        panel.set_colorkey(PANEL_KEY, pygame.RLEACCEL)
+        return panel, (panel_x, panel_y), button_rects
 
-    def draw_all(self, player, characters, coffee_shop=None, npcs=None):
+    def draw_popup(self):
+        """Draw the popup with description and buttons (laid out and rendered once per popup)"""
+        if not self.showing_popup:
+            return
+
+        # Dark overlay
+        if self._overlay is None:
+            self._overlay = pygame.Surface((self.screen_width, self.screen_height))
+            self._overlay.set_alpha(150)
+            self._overlay.fill((0, 0, 0))
+        self.screen.blit(self._overlay, (0, 0))
+
+        key = (self.popup_title, self.popup_description, tuple(self.popup_buttons))
+        if self._popup is None or self._popup[0] != key:
+            self._popup = (key,) + self._build_popup()
+        _, panel, pos, button_rects = self._popup
+        self.screen.blit(panel, pos)
+        self.popup_button_rects = list(button_rects)
+
+    def draw_all(self, player, characters, coffee_shop=None, npcs=None, world=None):
         self.draw_left_panel(player, characters, coffee_shop)
         self.draw_minimap(player, npcs, coffee_shop)
         self.draw_status_bar(player)
-        nearby_entities = self.check_proximity(player, npcs, coffee_shop)
+        nearby_entities = self.check_proximity(player, npcs, coffee_shop, world)
         if nearby_entities:
             self.draw_right_panel(nearby_entities)
         self.draw_active_menu()
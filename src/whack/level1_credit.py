@@ -1,15 +1,18 @@
 import pygame
 import sys
+import os
 import math
 import random
 
-# Initialize Pygame
-pygame.init()
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import Scene, SceneManager
 
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Security Command Center - Identity Check")
+screen = None  # set by the scene manager
 
 # Colors
 DARK_NAVY = (10, 31, 58)
@@ -21,11 +24,22 @@ WHITE = (255, 255, 255)
 DARK_BLUE = (20, 40, 80)
 PURPLE = (40, 20, 80)
 
-# Fonts
-font = pygame.font.SysFont('Arial', 24)
-title_font = pygame.font.SysFont('Arial', 32, bold=True)
-question_font = pygame.font.SysFont('Arial', 20)
-score_font = pygame.font.SysFont('Arial', 28, bold=True)
+# Fonts (created by init(), so importing this module stays cheap)
+font = None
+title_font = None
+question_font = None
+score_font = None
+
+def init():
+    """Initialise pygame and create the fonts (safe to call more than once)"""
+    global font, title_font, question_font, score_font
+    if font is not None:
+        return
+    pygame.init()
+    font = pygame.font.SysFont('Arial', 24)
+    title_font = pygame.font.SysFont('Arial', 32, bold=True)
+    question_font = pygame.font.SysFont('Arial', 20)
+    score_font = pygame.font.SysFont('Arial', 28, bold=True)
 
 class Particle:
     def __init__(self):
@@ -83,9 +97,12 @@ class Button:
         self.is_hovered = False
         self.glow = 0
         
+    def update(self):
+        """Advance the glow pulse (one fixed step)"""
+        self.glow = (self.glow + 0.1) % (2 * math.pi)
+
     def draw(self, surface):
         # Animated glow effect
-        self.glow = (self.glow + 0.1) % (2 * math.pi)
         glow_intensity = int(50 + 30 * math.sin(self.glow))
         
         color = self.hover_color if self.is_hovered else self.color
@@ -141,14 +158,12 @@ def draw_command_center_background(particles, floating_numbers):
     # Hexagon grid
     draw_hexagon_grid()
     
-    # Animated particles
+    # Animated particles (moved by CreditCardScene.update)
     for particle in particles:
-        particle.update()
         particle.draw()
     
     # Floating OTP numbers
     for number in floating_numbers:
-        number.update()
         number.draw()
     
     # Central glow
@@ -270,135 +285,137 @@ def show_final_score(score, total_questions):
         point_text = font.render(point, True, WHITE)
         screen.blit(point_text, (WIDTH//2 - point_text.get_width()//2, 300 + i*35))
 
-def main():
-    clock = pygame.time.Clock()
-    
-    # Game data
-    questions = [
-        {
-            "question": "Mastercard Identity Check is a free service that automatically protects your Capital One credit card from unauthorized online use.",
-            "answer": True,
-            "explanation": "CORRECT! It's a free service that provides automatic protection against unauthorized online transactions."
-        },
-        {
-            "question": "You need to manually register your card to use Mastercard Identity Check protection.",
-            "answer": False, 
-            "explanation": "FALSE! Your Capital One card is automatically registered for the service - no manual registration needed."
-        },
-        {
-            "question": "All online retailers offer Mastercard Identity Check protection for your payments.",
-            "answer": False,
-            "explanation": "FALSE! Only retailers displaying the Mastercard Identity Check logo offer this protection service."
-        }
-    ]
-    
-    # Visual elements
-    particles = [Particle() for _ in range(50)]
-    floating_numbers = [FloatingNumber() for _ in range(20)]
-    
-    # Game state
-    current_question = 0
-    score = 0
-    show_feedback_screen = False
-    current_feedback = None
-    game_finished = False
-    
-    running = True
-    while running:
+# Game data
+QUESTIONS = [
+    {
+        "question": "Mastercard Identity Check is a free service that automatically protects your Capital One credit card from unauthorized online use.",
+        "answer": True,
+        "explanation": "CORRECT! It's a free service that provides automatic protection against unauthorized online transactions."
+    },
+    {
+        "question": "You need to manually register your card to use Mastercard Identity Check protection.",
+        "answer": False,
+        "explanation": "FALSE! Your Capital One card is automatically registered for the service - no manual registration needed."
+    },
+    {
+        "question": "All online retailers offer Mastercard Identity Check protection for your payments.",
+        "answer": False,
+        "explanation": "FALSE! Only retailers displaying the Mastercard Identity Check logo offer this protection service."
+    }
+]
+
+class CreditCardScene(Scene):
+    """Level 1 - Identity Check true/false quiz"""
+    size = (WIDTH, HEIGHT)
+    caption = "Security Command Center - Identity Check"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.questions = QUESTIONS
+
+        # Visual elements
+        self.particles = [Particle() for _ in range(50)]
+        self.floating_numbers = [FloatingNumber() for _ in range(20)]
+
+        # Buttons
+        self.true_button = Button(WIDTH//2 - 150, 400, 120, 60, "TRUE", MINT_GREEN, (*MINT_GREEN, 150))
+        self.false_button = Button(WIDTH//2 + 30, 400, 120, 60, "FALSE", SOFT_RED, (*SOFT_RED, 150))
+        self.play_again_button = Button(WIDTH//2 - 100, 480, 200, 50, "PLAY AGAIN", SOFT_PURPLE, ELECTRIC_CYAN)
+        self.next_level_button = Button(WIDTH//2 - 100, 540, 200, 50, "NEXT LEVEL", MINT_GREEN, MINT_GREEN)
+
+        self.reset()
+
+    def reset(self):
+        # Game state
+        self.current_question = 0
+        self.score = 0
+        self.show_feedback_screen = False
+        self.current_feedback = None
+        self.game_finished = False
+
+    def enter(self):
+        global screen
+        init()
+        screen = self.manager.screen
+
+    def answer(self, value):
+        question = self.questions[self.current_question]
+        is_correct = question["answer"] == value
+        if is_correct:
+            self.score += 10
+        self.show_feedback_screen = True
+        self.current_feedback = (is_correct, question["explanation"])
+
+    def handle(self, event):
         mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-            
-            if not game_finished and not show_feedback_screen:
-                # Create buttons for current question
-                true_button = Button(WIDTH//2 - 150, 400, 120, 60, "TRUE", MINT_GREEN, (*MINT_GREEN, 150))
-                false_button = Button(WIDTH//2 + 30, 400, 120, 60, "FALSE", SOFT_RED, (*SOFT_RED, 150))
-                
-                true_button.check_hover(mouse_pos)
-                false_button.check_hover(mouse_pos)
-                
-                if true_button.is_clicked(mouse_pos, event):
-                    if questions[current_question]["answer"] == True:
-                        score += 10
-                        show_feedback_screen = True
-                        current_feedback = (True, questions[current_question]["explanation"])
-                    else:
-                        show_feedback_screen = True
-                        current_feedback = (False, questions[current_question]["explanation"])
-                
-                elif false_button.is_clicked(mouse_pos, event):
-                    if questions[current_question]["answer"] == False:
-                        score += 10
-                        show_feedback_screen = True
-                        current_feedback = (True, questions[current_question]["explanation"])
-                    else:
-                        show_feedback_screen = True
-                        current_feedback = (False, questions[current_question]["explanation"])
-            
-            elif show_feedback_screen and event.type == pygame.MOUSEBUTTONDOWN:
-                show_feedback_screen = False
-                current_question += 1
-                if current_question >= len(questions):
-                    game_finished = True
-            
-            #elif game_finished and event.type == pygame.MOUSEBUTTONDOWN:
-                # Restart game
-                #current_question = 0
-                #score = 0
-                #game_finished = False
-        
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if not self.game_finished and not self.show_feedback_screen:
+            if self.true_button.is_clicked(mouse_pos, event):
+                self.answer(True)
+            elif self.false_button.is_clicked(mouse_pos, event):
+                self.answer(False)
+
+        elif self.show_feedback_screen and event.type == pygame.MOUSEBUTTONDOWN:
+            self.show_feedback_screen = False
+            self.current_question += 1
+            if self.current_question >= len(self.questions):
+                self.game_finished = True
+
+        elif self.game_finished:
+            if self.play_again_button.is_clicked(mouse_pos, event):
+                self.reset()
+            elif self.next_level_button.is_clicked(mouse_pos, event):
+                # Go to level 2
+                from level2_identity import EmailScene
+                self.manager.replace(EmailScene(self.manager))
+
+    def update(self):
+        for particle in self.particles:
+            particle.update()
+        for number in self.floating_numbers:
+            number.update()
+        for button in (self.true_button, self.false_button, self.play_again_button, self.next_level_button):
+            button.update()
+
+    def draw(self, surface):
+        mouse_pos = pygame.mouse.get_pos()
+
         # Draw everything
-        draw_command_center_background(particles, floating_numbers)
-        
-        if not game_finished and not show_feedback_screen:
+        draw_command_center_background(self.particles, self.floating_numbers)
+
+        if not self.game_finished and not self.show_feedback_screen:
             draw_question_panel(
-                questions[current_question]["question"], 
-                (current_question + 1, len(questions)), 
-                score
+                self.questions[self.current_question]["question"],
+                (self.current_question + 1, len(self.questions)),
+                self.score
             )
-            
+
             # Draw buttons
-            true_button = Button(WIDTH//2 - 150, 400, 120, 60, "TRUE", MINT_GREEN, (*MINT_GREEN, 150))
-            false_button = Button(WIDTH//2 + 30, 400, 120, 60, "FALSE", SOFT_RED, (*SOFT_RED, 150))
-            
-            true_button.check_hover(mouse_pos)
-            false_button.check_hover(mouse_pos)
-            
-            true_button.draw(screen)
-            false_button.draw(screen)
-        
-        elif show_feedback_screen and current_feedback:
-            show_feedback(current_feedback[0], current_feedback[1])
-        
-        elif game_finished:
-            show_final_score(score, len(questions))
-
-            # Play Again button
-            play_again_button = Button(WIDTH//2 - 100, 480, 200, 50, "PLAY AGAIN", SOFT_PURPLE, ELECTRIC_CYAN)
-            play_again_button.check_hover(mouse_pos)
-            play_again_button.draw(screen)
-
-            # NEXT LEVEL button
-            next_level_button = Button(WIDTH//2 - 100, 540, 200, 50, "NEXT LEVEL", MINT_GREEN, MINT_GREEN)
-            next_level_button.check_hover(mouse_pos)
-            next_level_button.draw(screen)
-
-            # Handle button clicks INSIDE the game_finished section
-            if play_again_button.is_clicked(mouse_pos, event):
-                current_question = 0
-                score = 0
-                game_finished = False
-                show_feedback_screen = False
-    
-            if next_level_button.is_clicked(mouse_pos, event):
-                return "level2"  # Signal to main.py to go to level 2
+            self.true_button.check_hover(mouse_pos)
+            self.false_button.check_hover(mouse_pos)
+            self.true_button.draw(screen)
+            self.false_button.draw(screen)
 
-        pygame.display.flip()
-        clock.tick(60)
-    
+        elif self.show_feedback_screen and self.current_feedback:
+            show_feedback(self.current_feedback[0], self.current_feedback[1])
+
+        elif self.game_finished:
+            show_final_score(self.score, len(self.questions))
+
+            # Play Again / NEXT LEVEL buttons
+            self.play_again_button.check_hover(mouse_pos)
+            self.play_again_button.draw(screen)
+            self.next_level_button.check_hover(mouse_pos)
+            self.next_level_button.draw(screen)
+
+def run():
+    manager = SceneManager((WIDTH, HEIGHT), "Security Command Center - Identity Check")
+    manager.push(CreditCardScene(manager))
+    manager.run()
+
+if __name__ == "__main__":
+    run()
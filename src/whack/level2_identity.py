@@ -1,15 +1,18 @@
 import pygame
 import sys
+import os
 import random
 import math
 
-# Initialize Pygame
-pygame.init()
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import Scene, SceneManager
 
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Email Security Scanner - Level 2")
+screen = None  # set by the scene manager
 
 # Colors
 DARK_NAVY = (10, 31, 58)
@@ -25,11 +28,22 @@ YELLOW = (255, 255, 0)  # ADD THIS LINE
 BLACK = (0, 0, 0)
 
 
-# Fonts
-font = pygame.font.SysFont('Arial', 20)
-title_font = pygame.font.SysFont('Arial', 28, bold=True)
-email_font = pygame.font.SysFont('Courier New', 16)
-score_font = pygame.font.SysFont('Arial', 24, bold=True)
+# Fonts (created by init(), so importing this module stays cheap)
+font = None
+title_font = None
+email_font = None
+score_font = None
+
+def init():
+    """Initialise pygame and create the fonts (safe to call more than once)"""
+    global font, title_font, email_font, score_font
+    if font is not None:
+        return
+    pygame.init()
+    font = pygame.font.SysFont('Arial', 20)
+    title_font = pygame.font.SysFont('Arial', 28, bold=True)
+    email_font = pygame.font.SysFont('Courier New', 16)
+    score_font = pygame.font.SysFont('Arial', 24, bold=True)
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -222,170 +236,168 @@ def show_email_results(score, total_emails):
     for i, takeaway in enumerate(takeaways):
         takeaway_text = font.render(takeaway, True, WHITE)
         screen.blit(takeaway_text, (WIDTH//2 - takeaway_text.get_width()//2, 260 + i*40))
-    
-    # Continue button
-    continue_button = Button(WIDTH//2 - 100, 480, 200, 50, "CONTINUE", ELECTRIC_CYAN, SOFT_PURPLE)
-    
-    # NEXT LEVEL button
-    next_level_button = Button(WIDTH//2 - 100, 535, 200, 50, "NEXT LEVEL →", MINT_GREEN, (0, 200, 0))
-    
-    waiting = True
-    while waiting:
+
+# Email data
+EMAILS = [
+    # LEGITIMATE EMAILS
+    {
+        "type": "legitimate",
+        "sender": "capitalone@emails.capitalone.com",
+        "subject": "Your Monthly Statement is Ready",
+        "body": "Dear Valued Customer, Your monthly credit card statement is now available for review. Please log in to your secure online account to view your statement details and payment information. You can access your statement through our official mobile app or by visiting our secure website. Thank you for choosing Capital One.",
+        "clues": [
+            "Official Capital One email domain",
+            "Professional, non-urgent language", 
+            "No requests for personal information",
+            "Encourages secure login to official platforms"
+        ]
+    },
+    {
+        "type": "legitimate",
+        "sender": "no-reply@alerts.capitalone.com", 
+        "subject": "Security Notice: New Login Detected",
+        "body": "We noticed a new login to your Capital One account: Device: iPhone 13 Pro Location: New York, NY Time: Today, 2:30 PM EST If this was you, no action is needed. Your account remains secure. If this wasn't you, please contact our security team immediately.",
+        "clues": [
+            "Provides specific, verifiable details",
+            "Informative but not demanding immediate action",
+            "Official Capital One alerts domain",
+            "No suspicious links"
+        ]
+    },
+    # PHISHING EMAILS  
+    {
+        "type": "phishing", 
+        "sender": "security@capitalone-support.net",
+        "subject": "URGENT: Account Suspension Warning!",
+        "body": "IMPORTANT SECURITY ALERT: We detected suspicious login attempts on your account. Your account will be SUSPENDED in 24 hours unless you verify your identity immediately. CLICK HERE NOW to verify your account and prevent suspension. Do not ignore this warning!",
+        "clues": [
+            "Suspicious domain (not official Capital One)",
+            "Creates false urgency and threats", 
+            "Contains suspicious link",
+            "Pressure tactics to bypass careful thinking"
+        ]
+    },
+    {
+        "type": "phishing",
+        "sender": "rewards@capitalone-gifts.com",
+        "subject": "CONGRATULATIONS! You Won $500 Amazon Gift Card!", 
+        "body": "EXCLUSIVE OFFER: You've been selected for our special reward program! You won a $500 Amazon Gift Card! Click here to claim your prize now! HURRY! This offer expires in 2 hours. Limited availability! Just pay $4.99 shipping fee to receive your gift card.",
+        "clues": [
+            "Too good to be true offer",
+            "Asks for payment for 'free' gift",
+            "Creates false scarcity and urgency",
+            "Unofficial rewards domain"
+        ]
+    }
+]
+
+class EmailScene(Scene):
+    """Level 2 - spot the phishing email"""
+    size = (WIDTH, HEIGHT)
+    caption = "Email Security Scanner - Level 2"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.current_email = 0
+        self.score = 0
+        self.shuffled_emails = random.sample(EMAILS, len(EMAILS))
+        self.show_feedback = False
+        self.feedback_data = None
+        self.show_results = False
+
+        # Create particles for background
+        self.particles = [Particle() for _ in range(30)]
+
+        # Buttons
+        self.legit_button = Button(WIDTH//2 - 200, 450, 180, 50, "LEGITIMATE", MINT_GREEN, (0, 200, 0))
+        self.phishing_button = Button(WIDTH//2 + 20, 450, 180, 50, "PHISHING", SOFT_RED, (200, 0, 0))
+        self.continue_button = Button(WIDTH//2 - 80, 400, 160, 40, "CONTINUE", ELECTRIC_CYAN, SOFT_PURPLE)
+        self.results_continue_button = Button(WIDTH//2 - 100, 480, 200, 50, "CONTINUE", ELECTRIC_CYAN, SOFT_PURPLE)
+        self.next_level_button = Button(WIDTH//2 - 100, 535, 200, 50, "NEXT LEVEL →", MINT_GREEN, (0, 200, 0))
+
+    def enter(self):
+        global screen
+        init()
+        screen = self.manager.screen
+
+    def answer(self, email_type):
+        email = self.shuffled_emails[self.current_email]
+        is_correct = (email["type"] == email_type)
+        if is_correct:
+            self.score += 10
+        self.feedback_data = (is_correct, email["clues"], email["type"], self.score)
+        self.show_feedback = True
+
+    def handle(self, event):
         mouse_pos = pygame.mouse.get_pos()
-        continue_button.check_hover(mouse_pos)
-        next_level_button.check_hover(mouse_pos)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            if continue_button.is_clicked(mouse_pos, event):
-                waiting = False
-            if next_level_button.is_clicked(mouse_pos, event):
-                pygame.quit()  # Close current level
-                try:
-                    import level3_socialmedia  # Import your level3 file
-                    level3_socialmedia.main()  # Start level3
-                except ImportError:
-                    print("Level 3 not found! Make sure level3_instagram.py is in the same folder.")
-                return
-        
-        continue_button.draw(screen)
-        next_level_button.draw(screen)
-        pygame.display.flip()
-
-def main():
-    # Email data
-    emails = [
-        # LEGITIMATE EMAILS
-        {
-            "type": "legitimate",
-            "sender": "capitalone@emails.capitalone.com",
-            "subject": "Your Monthly Statement is Ready",
-            "body": "Dear Valued Customer, Your monthly credit card statement is now available for review. Please log in to your secure online account to view your statement details and payment information. You can access your statement through our official mobile app or by visiting our secure website. Thank you for choosing Capital One.",
-            "clues": [
-                "Official Capital One email domain",
-                "Professional, non-urgent language", 
-                "No requests for personal information",
-                "Encourages secure login to official platforms"
-            ]
-        },
-        {
-            "type": "legitimate",
-            "sender": "no-reply@alerts.capitalone.com", 
-            "subject": "Security Notice: New Login Detected",
-            "body": "We noticed a new login to your Capital One account: Device: iPhone 13 Pro Location: New York, NY Time: Today, 2:30 PM EST If this was you, no action is needed. Your account remains secure. If this wasn't you, please contact our security team immediately.",
-            "clues": [
-                "Provides specific, verifiable details",
-                "Informative but not demanding immediate action",
-                "Official Capital One alerts domain",
-                "No suspicious links"
-            ]
-        },
-        # PHISHING EMAILS  
-        {
-            "type": "phishing", 
-            "sender": "security@capitalone-support.net",
-            "subject": "URGENT: Account Suspension Warning!",
-            "body": "IMPORTANT SECURITY ALERT: We detected suspicious login attempts on your account. Your account will be SUSPENDED in 24 hours unless you verify your identity immediately. CLICK HERE NOW to verify your account and prevent suspension. Do not ignore this warning!",
-            "clues": [
-                "Suspicious domain (not official Capital One)",
-                "Creates false urgency and threats", 
-                "Contains suspicious link",
-                "Pressure tactics to bypass careful thinking"
-            ]
-        },
-        {
-            "type": "phishing",
-            "sender": "rewards@capitalone-gifts.com",
-            "subject": "CONGRATULATIONS! You Won $500 Amazon Gift Card!", 
-            "body": "EXCLUSIVE OFFER: You've been selected for our special reward program! You won a $500 Amazon Gift Card! Click here to claim your prize now! HURRY! This offer expires in 2 hours. Limited availability! Just pay $4.99 shipping fee to receive your gift card.",
-            "clues": [
-                "Too good to be true offer",
-                "Asks for payment for 'free' gift",
-                "Creates false scarcity and urgency",
-                "Unofficial rewards domain"
-            ]
-        }
-    ]
-    
-    current_email = 0
-    score = 0
-    shuffled_emails = random.sample(emails, len(emails))
-    
-    clock = pygame.time.Clock()
-    running = True
-    show_feedback = False
-    feedback_data = None
-    
-    # Create particles for background
-    particles = [Particle() for _ in range(30)]
-    
-    while running:
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if self.show_results:
+            if self.results_continue_button.is_clicked(mouse_pos, event):
+                self.manager.pop()
+            elif self.next_level_button.is_clicked(mouse_pos, event):
+                from level3_socialmedia import SocialMediaScene
+                self.manager.replace(SocialMediaScene(self.manager))
+
+        elif not self.show_feedback:
+            # Check button clicks
+            if self.legit_button.is_clicked(mouse_pos, event):
+                self.answer("legitimate")
+            elif self.phishing_button.is_clicked(mouse_pos, event):
+                self.answer("phishing")
+        else:
+            # Continue button in feedback
+            if self.continue_button.is_clicked(mouse_pos, event):
+                self.show_feedback = False
+                self.current_email += 1
+                if self.current_email >= len(self.shuffled_emails):
+                    self.show_results = True
+
+    def update(self):
+        if self.show_results:
+            return  # the results screen has no background particles
+        for particle in self.particles:
+            particle.update()
+
+    def draw(self, surface):
         mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-            
-            if not show_feedback:
-                # Check button clicks
-                legit_button = Button(WIDTH//2 - 200, 450, 180, 50, "LEGITIMATE", MINT_GREEN, (0, 200, 0))
-                phishing_button = Button(WIDTH//2 + 20, 450, 180, 50, "PHISHING", SOFT_RED, (200, 0, 0))
-                
-                if legit_button.is_clicked(mouse_pos, event):
-                    is_correct = (shuffled_emails[current_email]["type"] == "legitimate")
-                    if is_correct:
-                        score += 10
-                    feedback_data = (is_correct, shuffled_emails[current_email]["clues"], shuffled_emails[current_email]["type"], score)
-                    show_feedback = True
-                elif phishing_button.is_clicked(mouse_pos, event):
-                    is_correct = (shuffled_emails[current_email]["type"] == "phishing")
-                    if is_correct:
-                        score += 10
-                    feedback_data = (is_correct, shuffled_emails[current_email]["clues"], shuffled_emails[current_email]["type"], score)
-                    show_feedback = True
-            else:
-                # Continue button in feedback
-                continue_button = draw_feedback(feedback_data[0], feedback_data[1], feedback_data[2], feedback_data[3])
-                if continue_button.is_clicked(mouse_pos, event):
-                    show_feedback = False
-                    current_email += 1
-                    if current_email >= len(shuffled_emails):
-                        show_email_results(score, len(shuffled_emails))
-                        running = False
-        
+
+        if self.show_results:
+            show_email_results(self.score, len(self.shuffled_emails))
+            self.results_continue_button.check_hover(mouse_pos)
+            self.next_level_button.check_hover(mouse_pos)
+            self.results_continue_button.draw(screen)
+            self.next_level_button.draw(screen)
+            return
+
         # Draw everything
         draw_city_background()
-        
-        # Update and draw particles
-        for particle in particles:
-            particle.update()
+
+        # Draw particles
+        for particle in self.particles:
             particle.draw()
-        
-        if not show_feedback and current_email < len(shuffled_emails):
-            draw_email_display(shuffled_emails[current_email], current_email, len(shuffled_emails), score)
-            
+
+        if not self.show_feedback and self.current_email < len(self.shuffled_emails):
+            draw_email_display(self.shuffled_emails[self.current_email], self.current_email,
+                               len(self.shuffled_emails), self.score)
+
             # Draw buttons
-            legit_button = Button(WIDTH//2 - 200, 450, 180, 50, "LEGITIMATE", MINT_GREEN, (0, 200, 0))
-            phishing_button = Button(WIDTH//2 + 20, 450, 180, 50, "PHISHING", SOFT_RED, (200, 0, 0))
-            
-            legit_button.check_hover(mouse_pos)
-            phishing_button.check_hover(mouse_pos)
-            
-            legit_button.draw(screen)
-            phishing_button.draw(screen)
-        elif show_feedback and feedback_data:
-            continue_button = draw_feedback(feedback_data[0], feedback_data[1], feedback_data[2], feedback_data[3])
-            continue_button.check_hover(mouse_pos)
-            continue_button.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
-    
-    pygame.quit()
+            self.legit_button.check_hover(mouse_pos)
+            self.phishing_button.check_hover(mouse_pos)
+            self.legit_button.draw(screen)
+            self.phishing_button.draw(screen)
+        elif self.show_feedback and self.feedback_data:
+            draw_feedback(*self.feedback_data)
+            self.continue_button.check_hover(mouse_pos)
+            self.continue_button.draw(screen)
+
+def run():
+    manager = SceneManager((WIDTH, HEIGHT), "Email Security Scanner - Level 2")
+    manager.push(EmailScene(manager))
+    manager.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run()
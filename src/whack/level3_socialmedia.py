@@ -1,14 +1,17 @@
 import pygame
 import sys
+import os
 import random
 
-# Initialize Pygame
-pygame.init()
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import Scene, SceneManager
 
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Social Media Privacy Quiz")
+screen = None  # set by the scene manager
 
 # Colors
 INSTAGRAM_PURPLE = (193, 53, 132)
@@ -26,11 +29,22 @@ INSTAGRAM_PURPLE = (193, 53, 132)    # Change this
 INSTAGRAM_ORANGE = (225, 48, 108)    # Change this
 INSTAGRAM_YELLOW = (245, 166, 35)    # Change this
 
-# Fonts
-font = pygame.font.SysFont('Arial', 20)
-title_font = pygame.font.SysFont('Arial', 28, bold=True)
-small_font = pygame.font.SysFont('Arial', 16)
-post_font = pygame.font.SysFont('Arial', 18)
+# Fonts (created by init(), so importing this module stays cheap)
+font = None
+title_font = None
+small_font = None
+post_font = None
+
+def init():
+    """Initialise pygame and create the fonts (safe to call more than once)"""
+    global font, title_font, small_font, post_font
+    if font is not None:
+        return
+    pygame.init()
+    font = pygame.font.SysFont('Arial', 20)
+    title_font = pygame.font.SysFont('Arial', 28, bold=True)
+    small_font = pygame.font.SysFont('Arial', 16)
+    post_font = pygame.font.SysFont('Arial', 18)
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -219,134 +233,146 @@ def show_final_score(score, total_questions):
 
     # RETURN the button position so it can be used in main()
     return Button(WIDTH//2 - 80, 500, 160, 40, "PLAY AGAIN", WHITE, LIGHT_GRAY)
-def main():
-    clock = pygame.time.Clock()
-    
-    # Social media quiz questions
-    posts = [
-        InstagramPost(
-            username="travel_lover123",
-            profile_pic_color=(255, 150, 150),
-            post_image_color=(100, 200, 255),  # Beach color
-            caption="2 weeks in Hawaii! So excited for this vacation!",
-            options=[
-                "Public + Location ON ",
-                "Friends Only + No Location",
-            ],
-            correct_index=1,
-            explanation="Sharing vacation plans publicly reveals your home is empty. Friends-only without location is safest!"
-        ),
-        InstagramPost(
-            username="career_growth",
-            profile_pic_color=(150, 200, 255),
-            post_image_color=(200, 200, 200),  # Office color
-            caption="So excited about my new job at Capital One!",
-            options=[
-                "Public - Share the great news!",
-                "Friends Only - Keep it professional",
-            ],
-            correct_index=1,
-            explanation="Never reveal your workplace publicly! Scammers can use this for social engineering attacks."
-        ),
-        InstagramPost(
-            username="birthday_queen",
-            profile_pic_color=(255, 200, 150),
-            post_image_color=(255, 220, 150),  # Cake color
-            caption="Best birthday ever! Feeling so loved today!",
-            options=[
-                "Show Full Birth Date",
-                "Friends Only + Hide Date",
-            ],
-            correct_index=1,
-            explanation="Birth dates are key identity verification info. Never share them publicly - friends-only without date is safest!"
-        )
-    ]
-    
-    # Game state
-    current_post = 0
-    score = 0
-    show_feedback_screen = False
-    current_feedback = None
-    game_finished = False
-    selected_option = None
-    
-    running = True
-    while running:
+
+# Social media quiz questions
+POSTS = [
+    InstagramPost(
+        username="travel_lover123",
+        profile_pic_color=(255, 150, 150),
+        post_image_color=(100, 200, 255),  # Beach color
+        caption="2 weeks in Hawaii! So excited for this vacation!",
+        options=[
+            "Public + Location ON ",
+            "Friends Only + No Location",
+        ],
+        correct_index=1,
+        explanation="Sharing vacation plans publicly reveals your home is empty. Friends-only without location is safest!"
+    ),
+    InstagramPost(
+        username="career_growth",
+        profile_pic_color=(150, 200, 255),
+        post_image_color=(200, 200, 200),  # Office color
+        caption="So excited about my new job at Capital One!",
+        options=[
+            "Public - Share the great news!",
+            "Friends Only - Keep it professional",
+        ],
+        correct_index=1,
+        explanation="Never reveal your workplace publicly! Scammers can use this for social engineering attacks."
+    ),
+    InstagramPost(
+        username="birthday_queen",
+        profile_pic_color=(255, 200, 150),
+        post_image_color=(255, 220, 150),  # Cake color
+        caption="Best birthday ever! Feeling so loved today!",
+        options=[
+            "Show Full Birth Date",
+            "Friends Only + Hide Date",
+        ],
+        correct_index=1,
+        explanation="Birth dates are key identity verification info. Never share them publicly - friends-only without date is safest!"
+    )
+]
+
+class SocialMediaScene(Scene):
+    """Level 3 - pick the safest privacy option for each post"""
+    size = (WIDTH, HEIGHT)
+    caption = "Social Media Privacy Quiz"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.posts = POSTS
+        self.option_rects = []
+        self.play_again_button = Button(WIDTH//2 - 80, 480, 160, 40, "PLAY AGAIN", WHITE, LIGHT_GRAY)
+        self.reset()
+
+    def reset(self):
+        # Game state
+        self.current_post = 0
+        self.score = 0
+        self.show_feedback_screen = False
+        self.current_feedback = None
+        self.game_finished = False
+        self.selected_option = None
+
+    def enter(self):
+        global screen
+        init()
+        screen = self.manager.screen
+
+    def handle(self, event):
         mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-            
-            if not game_finished and not show_feedback_screen:
-                option_rects = draw_instagram_post(posts[current_post], selected_option)
-                
-                # Check option clicks
-                for i, rect in enumerate(option_rects):
-                    if event.type == pygame.MOUSEBUTTONDOWN and rect.collidepoint(mouse_pos):
-                        selected_option = i
-                        if i == posts[current_post].correct_index:
-                            score += 10
-                            show_feedback_screen = True
-                            current_feedback = (True, posts[current_post].explanation, posts[current_post])
-                        else:
-                            show_feedback_screen = True
-                            current_feedback = (False, posts[current_post].explanation, posts[current_post])
-            
-            elif show_feedback_screen and event.type == pygame.MOUSEBUTTONDOWN:
-                show_feedback_screen = False
-                selected_option = None
-                current_post += 1
-                if current_post >= len(posts):
-                    game_finished = True
-            
-            elif game_finished and event.type == pygame.MOUSEBUTTONDOWN:
-                # Restart game
-                current_post = 0
-                score = 0
-                game_finished = False
-                selected_option = None
-        
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+
+        if not self.game_finished and not self.show_feedback_screen:
+            post = self.posts[self.current_post]
+
+            # Check option clicks
+            for i, rect in enumerate(self.option_rects):
+                if rect.collidepoint(mouse_pos):
+                    self.selected_option = i
+                    is_correct = (i == post.correct_index)
+                    if is_correct:
+                        self.score += 10
+                    self.show_feedback_screen = True
+                    self.current_feedback = (is_correct, post.explanation, post)
+                    break
+
+        elif self.show_feedback_screen:
+            self.show_feedback_screen = False
+            self.selected_option = None
+            self.current_post += 1
+            if self.current_post >= len(self.posts):
+                self.game_finished = True
+
+        elif self.game_finished:
+            # Restart game
+            self.reset()
+
+    def draw(self, surface):
+        mouse_pos = pygame.mouse.get_pos()
+
         # Draw everything
         draw_instagram_ui()
-        
+
         # Title and score
         title = title_font.render("Social Media Privacy Quiz", True, WHITE)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 20))
-        
-        score_text = font.render(f"Privacy Score: {score}", True, WHITE)
+
+        score_text = font.render(f"Privacy Score: {self.score}", True, WHITE)
         screen.blit(score_text, (WIDTH - 175, 25))
-        
-        progress_text = font.render(f"Post {current_post + 1}/{len(posts)}", True, WHITE)
+
+        progress_text = font.render(f"Post {self.current_post + 1}/{len(self.posts)}", True, WHITE)
         screen.blit(progress_text, (50, 25))
-        
-        if not game_finished and not show_feedback_screen:
-            draw_instagram_post(posts[current_post], selected_option)
-            
+
+        if not self.game_finished and not self.show_feedback_screen:
+            self.option_rects = draw_instagram_post(self.posts[self.current_post], self.selected_option)
+
             # Instructions
             instruct = font.render("Click the safest privacy option for this post:", True, WHITE)
             screen.blit(instruct, (WIDTH//2 - instruct.get_width()//2, 560))
-        
-        elif show_feedback_screen and current_feedback:
-            show_feedback(current_feedback[0], current_feedback[1], current_feedback[2])
-        
-        elif game_finished:
-            play_again_button = show_final_score(score, len(posts))
-            
+
+        elif self.show_feedback_screen and self.current_feedback:
+            show_feedback(*self.current_feedback)
+
+        elif self.game_finished:
+            show_final_score(self.score, len(self.posts))
+
             # Play Again button
-            play_again_button = Button(WIDTH//2 - 80, 480, 160, 40, "PLAY AGAIN", WHITE, LIGHT_GRAY)
-            play_again_button.check_hover(mouse_pos)
-            play_again_button.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
-    
-    pygame.quit()
+            self.play_again_button.check_hover(mouse_pos)
+            self.play_again_button.draw(screen)
+
+def run():
+    manager = SceneManager((WIDTH, HEIGHT), "Social Media Privacy Quiz")
+    manager.push(SocialMediaScene(manager))
+    manager.run()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run()
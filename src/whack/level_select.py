@@ -1,15 +1,18 @@
 import pygame
 import sys
+import os
 import math
 import random
 
-# Initialize Pygame
-pygame.init()
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import Scene, SceneManager
 
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Security Training - Level Select")
+screen = None  # set by the scene manager
 
 # Colors
 DARK_NAVY = (10, 31, 58)
@@ -20,10 +23,20 @@ WHITE = (255, 255, 255)
 DARK_BLUE = (20, 40, 80)
 PURPLE = (40, 20, 80)
 
-# Fonts
-font = pygame.font.SysFont('Arial', 24)
-title_font = pygame.font.SysFont('Arial', 36, bold=True)
-level_font = pygame.font.SysFont('Arial', 18)
+# Fonts (created by init(), so importing this module stays cheap)
+font = None
+title_font = None
+level_font = None
+
+def init():
+    """Initialise pygame and create the fonts (safe to call more than once)"""
+    global font, title_font, level_font
+    if font is not None:
+        return
+    pygame.init()
+    font = pygame.font.SysFont('Arial', 24)
+    title_font = pygame.font.SysFont('Arial', 36, bold=True)
+    level_font = pygame.font.SysFont('Arial', 18)
 
 class Particle:
     def __init__(self):
@@ -51,9 +64,12 @@ class Button:
         self.is_hovered = False
         self.glow = 0
         
+    def update(self):
+        """Advance the glow pulse (one fixed step)"""
+        self.glow = (self.glow + 0.1) % (2 * math.pi)
+
     def draw(self, surface):
         # Animated glow effect
-        self.glow = (self.glow + 0.1) % (2 * math.pi)
         glow_intensity = int(50 + 30 * math.sin(self.glow))
         
         color = self.hover_color if self.is_hovered else self.color
@@ -106,83 +122,88 @@ def draw_background(particles):
     # Hexagon grid
     draw_hexagon_grid()
     
-    # Animated particles
+    # Animated particles (moved by LevelSelectScene.update)
     for particle in particles:
-        particle.update()
         particle.draw()
 
-def show_level_select():
-    particles = [Particle() for _ in range(50)]
-    
-    # Level data
-    levels = [
-        {"number": 1, "name": "Credit Card Protection", "description": "Mastercard Identity Check & OTP Security"},
-        {"number": 2, "name": "Identity Theft", "description": "Email Security & Phishing Detection"},
-        {"number": 3, "name": "Social Media Safety", "description": "Stay safe on social media"}
-    ]
-    
-    running = True
-    while running:
+# Level data
+LEVELS = [
+    {"number": 1, "name": "Credit Card Protection", "description": "Mastercard Identity Check & OTP Security"},
+    {"number": 2, "name": "Identity Theft", "description": "Email Security & Phishing Detection"},
+    {"number": 3, "name": "Social Media Safety", "description": "Stay safe on social media"}
+]
+
+class LevelSelectScene(Scene):
+    """Security training level select"""
+    size = (WIDTH, HEIGHT)
+    caption = "Security Training - Level Select"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.particles = [Particle() for _ in range(50)]
+        # Start button (only for level 1 for now)
+        self.start_button = Button(WIDTH//2 - 100, 520, 200, 50, "START LEVEL 1", ELECTRIC_CYAN, SOFT_PURPLE)
+
+    def enter(self):
+        global screen
+        init()
+        screen = self.manager.screen
+
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()  # Exit game
+            return
+
         mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-                return None
-                
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return None  # Exit game
-            
-            # Start button
-            start_button = Button(WIDTH//2 - 100, 520, 200, 50, "START LEVEL 1", ELECTRIC_CYAN, SOFT_PURPLE)
-            start_button.check_hover(mouse_pos)
-            
-            if start_button.is_clicked(mouse_pos, event):
-                return 1  # Start with level 1
-        
+        if self.start_button.is_clicked(mouse_pos, event):
+            # Start with level 1
+            from level1_credit import CreditCardScene
+            self.manager.replace(CreditCardScene(self.manager))
+
+    def update(self):
+        for particle in self.particles:
+            particle.update()
+        self.start_button.update()
+
+    def draw(self, surface):
+        mouse_pos = pygame.mouse.get_pos()
+
         # Draw everything
-        draw_background(particles)
-        
+        draw_background(self.particles)
+
         # Title
         title = title_font.render("SECURITY TRAINING PROGRAM", True, ELECTRIC_CYAN)
         subtitle = font.render("Complete all 3 levels to become a Security Expert", True, WHITE)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 30))
         screen.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 80))
-        
+
         # Draw level cards
-        for i, level in enumerate(levels):
+        for i, level in enumerate(LEVELS):
             y_pos = 130 + i * 65
-            
+
             # Level card background
             card_rect = pygame.Rect(80, y_pos, WIDTH - 160, 55)
-            
-            
+
             card_color = (*ELECTRIC_CYAN, 40)
             border_color = ELECTRIC_CYAN
-            
-            
+
             pygame.draw.rect(screen, card_color, card_rect, border_radius=8)
             pygame.draw.rect(screen, border_color, card_rect, 2, border_radius=8)
-            
+
             # Level number and name
             level_text = font.render(f"Level {level['number']}: {level['name']}", True, WHITE)
             desc_text = level_font.render(level['description'], True, WHITE)
-            
+
             screen.blit(level_text, (100, y_pos + 8))
             screen.blit(desc_text, (100, y_pos + 32))
-        
-        # Start button (only for level 1 for now)
-        start_button = Button(WIDTH//2 - 100, 520, 200, 50, "START LEVEL 1", ELECTRIC_CYAN, SOFT_PURPLE)
-        start_button.check_hover(mouse_pos)
-        start_button.draw(screen)
-        
-        pygame.display.flip()
-        pygame.time.Clock().tick(60)
-    
-    return None
+
+        self.start_button.check_hover(mouse_pos)
+        self.start_button.draw(screen)
+
+def run():
+    manager = SceneManager((WIDTH, HEIGHT), "Security Training - Level Select")
+    manager.push(LevelSelectScene(manager))
+    manager.run()
 
 if __name__ == "__main__":
-    selected_level = show_level_select()
-    print(f"Starting level: {selected_level}")
\ No newline at end of file
+    run()
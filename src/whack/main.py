@@ -1,25 +1,22 @@
-import pygame
 import sys
-from level_select import show_level_select
+import os
+
+# scene.py lives one folder up in src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from scene import SceneManager
+from level_select import LevelSelectScene, WIDTH, HEIGHT
 
 def main():
-    pygame.init()
-    
-    # This shows the level selection screen
-    selected_level = show_level_select()
-    
-    # It will ALWAYS return 1 (since only Level 1 is clickable)
-    if selected_level == 1:
-    # Run your credit card game
-        from level1_credit import main as level1_main
-        result = level1_main()  # NEW - capture return value
-        if result == "level2":  # NEW - check if they clicked NEXT LEVEL
-            from level2_identity import main as level2_main
-            level2_main()
+    manager = SceneManager((WIDTH, HEIGHT), "Security Training - Level Select")
+
+    # Level select starts Level 1; each level hands over to the next one
+    # in the same window (Level 1 -> Level 2 -> Level 3)
+    manager.push(LevelSelectScene(manager))
+    manager.run()
 
-    
-    pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()